@@ -1,13 +1,15 @@
-from typing import Optional
+from typing import Optional, Union
 
 from executorlib.interactive import create_executor
 from executorlib.interactive.dependencies import ExecutorWithDependencies
+from executorlib.shared.communication import SHARED_MEMORY_THRESHOLD
 from executorlib.shared.inputcheck import (
     check_plot_dependency_graph as _check_plot_dependency_graph,
 )
 from executorlib.shared.inputcheck import (
     check_refresh_rate as _check_refresh_rate,
 )
+from executorlib.shared.scatter import Scatter
 from executorlib.shell.executor import SubprocessExecutor
 from executorlib.shell.interactive import ShellExecutor
 
@@ -17,6 +19,7 @@ __version__ = get_versions()["version"]
 __all__ = [
     SubprocessExecutor,
     ShellExecutor,
+    Scatter,
 ]
 
 
@@ -69,6 +72,13 @@ class Executor:
         refresh_rate (float): Set the refresh rate in seconds, how frequently the input queue is checked.
         plot_dependency_graph (bool): Plot the dependencies of multiple future objects without executing them. For
                                       debugging purposes and to get an overview of the specified dependencies.
+        compression (str): compress task messages and results larger than 1MB with the codec "zlib", "lz4" or "zstd"
+        cache (bool/dict): Reuse the results of repeated function calls with identical arguments. Either True to keep up
+                           to 1GB of results in memory or a dictionary with the keys "max_bytes" to limit the size in
+                           memory and "cache_directory" to additionally store the results on disk.
+        shared_memory_threshold (int): exchange task arguments and results larger than this number of bytes with
+                                       worker processes on the same node through files in /dev/shm, which are only
+                                       readable by the current user. None disables shared memory - default is 256kB
 
     Examples:
         ```
@@ -112,6 +122,9 @@ class Executor:
         disable_dependencies: bool = False,
         refresh_rate: float = 0.01,
         plot_dependency_graph: bool = False,
+        compression: Optional[str] = None,
+        cache: Union[bool, dict] = False,
+        shared_memory_threshold: Optional[int] = SHARED_MEMORY_THRESHOLD,
     ):
         # Use __new__() instead of __init__(). This function is only implemented to enable auto-completion.
         pass
@@ -138,6 +151,9 @@ class Executor:
         disable_dependencies: bool = False,
         refresh_rate: float = 0.01,
         plot_dependency_graph: bool = False,
+        compression: Optional[str] = None,
+        cache: Union[bool, dict] = False,
+        shared_memory_threshold: Optional[int] = SHARED_MEMORY_THRESHOLD,
     ):
         """
         Instead of returning a executorlib.Executor object this function returns either a executorlib.mpi.PyMPIExecutor,
@@ -181,6 +197,15 @@ class Executor:
             refresh_rate (float): Set the refresh rate in seconds, how frequently the input queue is checked.
             plot_dependency_graph (bool): Plot the dependencies of multiple future objects without executing them. For
                                           debugging purposes and to get an overview of the specified dependencies.
+            compression (str): compress task messages and results larger than 1MB with the codec "zlib", "lz4" or
+                               "zstd" - default is None
+            cache (bool/dict): Reuse the results of repeated function calls with identical arguments. Either True to
+                               keep up to 1GB of results in memory or a dictionary with the keys "max_bytes" to limit
+                               the size in memory and "cache_directory" to additionally store the results on disk.
+            shared_memory_threshold (int): exchange task arguments and results larger than this number of bytes with
+                                           worker processes on the same node through files in /dev/shm, which are
+                                           only readable by the current user. None disables shared memory - default
+                                           is 256kB
 
         """
         if not disable_dependencies:
@@ -202,6 +227,9 @@ class Executor:
                 command_line_argument_lst=command_line_argument_lst,
                 pmi=pmi,
                 nested_flux_executor=nested_flux_executor,
+                compression=compression,
+                cache=cache,
+                shared_memory_threshold=shared_memory_threshold,
                 refresh_rate=refresh_rate,
                 plot_dependency_graph=plot_dependency_graph,
             )
@@ -226,4 +254,7 @@ class Executor:
                 command_line_argument_lst=command_line_argument_lst,
                 pmi=pmi,
                 nested_flux_executor=nested_flux_executor,
+                compression=compression,
+                cache=cache,
+                shared_memory_threshold=shared_memory_threshold,
             )
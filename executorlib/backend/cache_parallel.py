@@ -1,25 +1,36 @@
+import os
 import pickle
 import sys
+import traceback
+from typing import Optional
 
 import cloudpickle
 
-from executorlib.cache.shared import backend_load_file, backend_write_file
+from executorlib.cache.shared import (
+    backend_resolve_future_items,
+    backend_write_error,
+    backend_write_file,
+)
+from executorlib.cache.storage import load
+from executorlib.shared.reduce import reduce_output
+from executorlib.shared.scatter import scatter_arguments, split_scatter_arguments
 
 
-def main() -> None:
+def main() -> bool:
     """
     Main function for executing the cache_parallel script.
 
     This function uses MPI (Message Passing Interface) to distribute the execution of a function
-    across multiple processes. It loads a file, broadcasts the data to all processes, executes
-    the function, gathers the results (if there are multiple processes), and writes the output
-    to a file.
+    across multiple processes. For each file passed on the command line, it loads the file,
+    broadcasts the data to all processes, executes the function, gathers or reduces the results (if
+    there are multiple processes), and writes the output to a file. When a task fails on any rank,
+    the exception is written to the file of the task and the remaining tasks are still executed.
 
     Args:
         None
 
     Returns:
-        None
+        bool: True if all tasks were executed successfully.
     """
     from mpi4py import MPI
 
@@ -30,25 +41,92 @@ def main() -> None:
     )
     mpi_rank_zero = MPI.COMM_WORLD.Get_rank() == 0
     mpi_size_larger_one = MPI.COMM_WORLD.Get_size() > 1
-    file_name = sys.argv[1]
-
-    if mpi_rank_zero:
-        apply_dict = backend_load_file(file_name=file_name)
-    else:
-        apply_dict = None
-    apply_dict = MPI.COMM_WORLD.bcast(apply_dict, root=0)
-    output = apply_dict["fn"].__call__(*apply_dict["args"], **apply_dict["kwargs"])
-    if mpi_size_larger_one:
-        result = MPI.COMM_WORLD.gather(output, root=0)
-    else:
-        result = output
-    if mpi_rank_zero:
-        backend_write_file(
-            file_name=file_name,
-            output=result,
-        )
-    MPI.COMM_WORLD.Barrier()
+    success = True
+    for file_name in sys.argv[1:]:
+        # All ranks take part in the same collective operations, even when the task failed on some of the ranks
+        apply_dict, array_lst, error = None, None, None
+        if mpi_rank_zero:
+            try:
+                apply_dict = load(file_name=file_name)
+                if not apply_dict.get("lazy", False):
+                    apply_dict = backend_resolve_future_items(apply_dict=apply_dict)
+                apply_dict, array_lst = split_scatter_arguments(input_dict=apply_dict)
+            except Exception as e:
+                traceback.print_exc()
+                error = e
+        apply_dict = MPI.COMM_WORLD.bcast(apply_dict, root=0)
+        if apply_dict is not None:
+            try:
+                # Each rank only receives its part of the arrays marked by Scatter
+                apply_dict = scatter_arguments(
+                    input_dict=apply_dict, array_lst=array_lst, comm=MPI.COMM_WORLD
+                )
+                if apply_dict.get("lazy", False):
+                    # Each rank opens the results of the previous tasks, so it only reads the parts it accesses
+                    apply_dict = backend_resolve_future_items(apply_dict=apply_dict)
+                output = apply_dict["fn"].__call__(
+                    *apply_dict["args"], **apply_dict["kwargs"]
+                )
+            except Exception as e:
+                traceback.print_exc()
+                error = e
+        error = _get_first_error(error=error, comm=MPI.COMM_WORLD)
+        if error is None:
+            try:
+                if mpi_size_larger_one:
+                    result = reduce_output(
+                        output=output,
+                        reduce=apply_dict.get("reduce"),
+                        comm=MPI.COMM_WORLD,
+                    )
+                else:
+                    result = output
+                if mpi_rank_zero:
+                    backend_write_file(
+                        file_name=file_name,
+                        output=result,
+                        compression=apply_dict.get("compression"),
+                    )
+            except Exception as e:
+                traceback.print_exc()
+                error = e
+        if error is not None:
+            success = False
+            if mpi_rank_zero and os.path.exists(file_name):
+                backend_write_error(file_name=file_name, error=error)
+        MPI.COMM_WORLD.Barrier()
+    return success
+
+
+def _get_first_error(error: Optional[Exception], comm) -> Optional[Exception]:
+    """
+    Get the exception of the lowest rank on which the task failed, so all ranks agree whether the task failed.
+
+    Args:
+        error (Exception): The exception raised on this rank, None if the task succeeded on this rank.
+        comm (mpi4py.MPI.Comm): The MPI communicator.
+
+    Returns:
+        Exception: The exception of the lowest failed rank, None if the task succeeded on all ranks.
+    """
+    from mpi4py import MPI
+
+    error_rank = comm.allreduce(
+        comm.Get_rank() if error is not None else comm.Get_size(), op=MPI.MIN
+    )
+    if error_rank == comm.Get_size():
+        return None
+    if comm.Get_rank() == error_rank:
+        try:
+            cloudpickle.dumps(error)
+        except Exception:  # Exceptions which cannot be serialized are converted
+            error = RuntimeError(
+                "".join(
+                    traceback.format_exception(type(error), error, error.__traceback__)
+                )
+            )
+    return comm.bcast(error, root=error_rank)
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(0 if main() else 1)
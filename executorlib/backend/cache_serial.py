@@ -1,6 +1,6 @@
 import sys
 
-from executorlib.cache.shared import execute_task_in_file
+from executorlib.cache.shared import execute_task_bundle
 
 if __name__ == "__main__":
-    execute_task_in_file(file_name=sys.argv[1])
+    sys.exit(0 if execute_task_bundle(file_name_lst=sys.argv[1:]) else 1)
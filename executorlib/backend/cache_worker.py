@@ -0,0 +1,6 @@
+import sys
+
+from executorlib.cache.worker import execute_tasks_from_queue
+
+if __name__ == "__main__":
+    execute_tasks_from_queue(queue_directory=sys.argv[1], worker_id=sys.argv[2])
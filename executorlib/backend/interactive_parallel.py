@@ -11,6 +11,9 @@ from executorlib.shared.communication import (
     interface_send,
     interface_shutdown,
 )
+from executorlib.shared.function_cache import FunctionCache
+from executorlib.shared.reduce import reduce_output
+from executorlib.shared.scatter import scatter_arguments, split_scatter_arguments
 
 
 def main() -> None:
@@ -35,13 +38,21 @@ def main() -> None:
     argument_dict = parse_arguments(argument_lst=sys.argv)
     if mpi_rank_zero:
         context, socket = interface_connect(
-            host=argument_dict["host"], port=argument_dict["zmqport"]
+            host=argument_dict["host"],
+            port=argument_dict.get("zmqport"),
+            address=argument_dict.get("zmqaddress"),
         )
     else:
         context = None
         socket = None
 
+    # Large results are returned through shared memory, when the executor runs on the same node
+    shared_memory_threshold = argument_dict.get("shared_memory_threshold")
+    if shared_memory_threshold is not None:
+        shared_memory_threshold = int(shared_memory_threshold)
+
     memory = None
+    function_cache = FunctionCache()
 
     # required for flux interface - otherwise the current path is not included in the python path
     cwd = abspath(".")
@@ -51,10 +62,18 @@ def main() -> None:
     while True:
         # Read from socket
         if mpi_rank_zero:
-            input_dict = interface_receive(socket=socket)
+            input_dict, array_lst = split_scatter_arguments(
+                input_dict=interface_receive(socket=socket)
+            )
         else:
-            input_dict = None
+            input_dict, array_lst = None, None
         input_dict = MPI.COMM_WORLD.bcast(input_dict, root=0)
+        # Each rank only receives its part of the arrays marked by Scatter
+        input_dict = scatter_arguments(
+            input_dict=input_dict, array_lst=array_lst, comm=MPI.COMM_WORLD
+        )
+        # Functions which were received before are only referred to by their hash, each rank keeps its own cache
+        input_dict = function_cache.decode(input_dict=input_dict)
 
         # Parse input
         if "shutdown" in input_dict.keys() and input_dict["shutdown"]:
@@ -73,19 +92,30 @@ def main() -> None:
             try:
                 output = call_funct(input_dict=input_dict, funct=None, memory=memory)
                 if mpi_size_larger_one:
-                    output_reply = MPI.COMM_WORLD.gather(output, root=0)
+                    # The outputs are combined on the worker, so only the combined result is sent to the executor
+                    output_reply = reduce_output(
+                        output=output,
+                        reduce=input_dict.get("reduce"),
+                        comm=MPI.COMM_WORLD,
+                        chunk=input_dict.get("chunk", False),
+                    )
                 else:
                     output_reply = output
             except Exception as error:
-                if mpi_rank_zero:
-                    interface_send(
-                        socket=socket,
-                        result_dict={"error": error, "error_type": str(type(error))},
-                    )
+                result_dict = {"error": error, "error_type": str(type(error))}
             else:
-                # Send output
-                if mpi_rank_zero:
-                    interface_send(socket=socket, result_dict={"result": output_reply})
+                result_dict = {"result": output_reply}
+            # Tag the reply with the task id, when multiple tasks are in flight
+            if "task_id" in input_dict.keys():
+                result_dict["task_id"] = input_dict["task_id"]
+            # Send output
+            if mpi_rank_zero:
+                interface_send(
+                    socket=socket,
+                    result_dict=result_dict,
+                    compression=argument_dict.get("compression"),
+                    shared_memory_threshold=shared_memory_threshold,
+                )
         elif (
             "init" in input_dict.keys()
             and input_dict["init"]
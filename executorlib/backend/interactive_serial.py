@@ -9,6 +9,7 @@ from executorlib.shared.communication import (
     interface_send,
     interface_shutdown,
 )
+from executorlib.shared.function_cache import FunctionCache
 
 
 def main(argument_lst: Optional[List[str]] = None):
@@ -25,10 +26,18 @@ def main(argument_lst: Optional[List[str]] = None):
         argument_lst = sys.argv
     argument_dict = parse_arguments(argument_lst=argument_lst)
     context, socket = interface_connect(
-        host=argument_dict["host"], port=argument_dict["zmqport"]
+        host=argument_dict["host"],
+        port=argument_dict.get("zmqport"),
+        address=argument_dict.get("zmqaddress"),
     )
 
+    # Large results are returned through shared memory, when the executor runs on the same node
+    shared_memory_threshold = argument_dict.get("shared_memory_threshold")
+    if shared_memory_threshold is not None:
+        shared_memory_threshold = int(shared_memory_threshold)
+
     memory = None
+    function_cache = FunctionCache()
 
     # required for flux interface - otherwise the current path is not included in the python path
     cwd = abspath(".")
@@ -36,8 +45,8 @@ def main(argument_lst: Optional[List[str]] = None):
         sys.path.insert(1, cwd)
 
     while True:
-        # Read from socket
-        input_dict = interface_receive(socket=socket)
+        # Read from socket, functions which were received before are only referred to by their hash
+        input_dict = function_cache.decode(input_dict=interface_receive(socket=socket))
 
         # Parse input
         if "shutdown" in input_dict.keys() and input_dict["shutdown"]:
@@ -54,13 +63,19 @@ def main(argument_lst: Optional[List[str]] = None):
             try:
                 output = call_funct(input_dict=input_dict, funct=None, memory=memory)
             except Exception as error:
-                interface_send(
-                    socket=socket,
-                    result_dict={"error": error, "error_type": str(type(error))},
-                )
+                result_dict = {"error": error, "error_type": str(type(error))}
             else:
-                # Send output
-                interface_send(socket=socket, result_dict={"result": output})
+                result_dict = {"result": output}
+            # Tag the reply with the task id, when multiple tasks are in flight
+            if "task_id" in input_dict.keys():
+                result_dict["task_id"] = input_dict["task_id"]
+            # Send output
+            interface_send(
+                socket=socket,
+                result_dict=result_dict,
+                compression=argument_dict.get("compression"),
+                shared_memory_threshold=shared_memory_threshold,
+            )
         elif (
             "init" in input_dict.keys()
             and input_dict["init"]
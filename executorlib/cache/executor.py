@@ -1,7 +1,15 @@
 import os
+from concurrent.futures import Future
+from typing import Optional
 
+from executorlib.cache.index import CacheIndex
 from executorlib.cache.shared import execute_in_subprocess, execute_tasks_h5
+from executorlib.cache.storage import create_storage
+from executorlib.cache.worker import CacheWorkerPool
+from executorlib.shared.compression import check_compression
 from executorlib.shared.executor import ExecutorBase
+from executorlib.shared.inputcheck import check_reduce, check_resource_dict
+from executorlib.shared.interface import BaseInterface, MpiExecInterface
 from executorlib.shared.thread import RaisingThread
 
 
@@ -11,6 +19,17 @@ class FileExecutor(ExecutorBase):
         cache_directory: str = "cache",
         execute_function: callable = execute_in_subprocess,
         cores_per_worker: int = 1,
+        compression: Optional[str] = None,
+        cache_manifest: bool = False,
+        lazy_inputs: bool = False,
+        max_cores: Optional[int] = None,
+        max_workers: Optional[int] = None,
+        bundle_size: int = 1,
+        persistent_workers: int = 0,
+        interface_class: BaseInterface = MpiExecInterface,
+        cache_max_bytes: Optional[int] = None,
+        cache_eviction_policy: str = "lru",
+        storage: str = "hdf5",
     ):
         """
         Initialize the FileExecutor.
@@ -19,10 +38,59 @@ class FileExecutor(ExecutorBase):
             cache_directory (str, optional): The directory to store cache files. Defaults to "cache".
             execute_function (callable, optional): The function to execute tasks. Defaults to execute_in_subprocess.
             cores_per_worker (int, optional): The number of CPU cores per worker. Defaults to 1.
+            compression (str, optional): The codec "zlib", "lz4" or "zstd" to compress cache files larger than 1MB.
+                Defaults to None.
+            cache_manifest (bool, optional): Persist the index of completed tasks as sqlite database in the cache
+                directory, so it can be shared by multiple executors. Defaults to False.
+            lazy_inputs (bool, optional): Pass the results of other tasks as proxies, so only the parts which are
+                accessed are read from the cache files: uncompressed numpy arrays are memory-mapped, compressed numpy
+                arrays are passed as DatasetView and dictionaries as LazyDict objects. Defaults to False.
+            max_cores (int, optional): The maximum number of cores used by the running tasks. Further tasks are queued
+                and started as the running tasks finish. Defaults to None, which starts all tasks immediately.
+            max_workers (int, optional): For backwards compatibility with the standard library, max_workers also
+                defines the number of cores which can be used in parallel - just like the max_cores parameter, which
+                takes precedence. Defaults to None.
+            bundle_size (int, optional): The maximum number of tasks executed one after another by a single python
+                process. Bundling short tasks avoids starting the python interpreter and importing the modules for
+                every task, while the output of each task is still written to its own cache file. Ready tasks are
+                bundled until the bundle is complete or no further tasks are submitted. Defaults to 1.
+            persistent_workers (int, optional): The number of long-lived worker processes, which claim the tasks with
+                a single core from the cache directory, so the python interpreter is started once per worker rather
+                than once per task. Defaults to 0, which starts a python process for each task.
+            interface_class (BaseInterface, optional): The interface class to start the persistent workers, for
+                example MpiExecInterface to start them locally or SrunInterface to start them with SLURM. Defaults to
+                MpiExecInterface.
+            cache_max_bytes (int, optional): The maximum total size in bytes of the output files in the cache
+                directory. Once it is exceeded, the output files which are not required by pending tasks are deleted.
+                Defaults to None, which does not limit the size of the cache directory.
+            cache_eviction_policy (str, optional): Delete the least recently used "lru" or the least frequently used
+                "lfu" output files first. Defaults to "lru".
+            storage (str, optional): The storage backend for the cache files: "hdf5" stores each task in an HDF5 file,
+                "pickle" in a file of pickle protocol 5 records, from which numpy arrays are memory-mapped without
+                copying them, and "sqlite" in a single sqlite database in the cache directory, which suits many small
+                results. Existing cache files are read with the storage backend which wrote them. Defaults to "hdf5".
         """
         super().__init__()
+        check_compression(compression=compression)
         cache_directory_path = os.path.abspath(cache_directory)
         os.makedirs(cache_directory_path, exist_ok=True)
+        storage_backend = create_storage(
+            storage=storage, cache_directory=cache_directory_path
+        )
+        self._cache_index = CacheIndex(
+            cache_directory=cache_directory_path,
+            manifest=cache_manifest,
+            max_bytes=cache_max_bytes,
+            eviction_policy=cache_eviction_policy,
+        )
+        if persistent_workers > 0:
+            worker_pool = CacheWorkerPool(
+                cache_directory=cache_directory_path,
+                max_workers=persistent_workers,
+                interface_class=interface_class,
+            )
+        else:
+            worker_pool = None
         self._set_process(
             RaisingThread(
                 target=execute_tasks_h5,
@@ -31,6 +99,68 @@ class FileExecutor(ExecutorBase):
                     "execute_function": execute_function,
                     "cache_directory": cache_directory_path,
                     "cores_per_worker": cores_per_worker,
+                    "compression": compression,
+                    "cache_manifest": cache_manifest,
+                    "lazy_inputs": lazy_inputs,
+                    "max_cores": max_cores if max_cores is not None else max_workers,
+                    "bundle_size": bundle_size,
+                    "worker_pool": worker_pool,
+                    "cache_index": self._cache_index,
+                    "storage": storage_backend,
                 },
             )
         )
+
+    def stats(self) -> dict:
+        """
+        Get the statistics of the cache directory.
+
+        Returns:
+            dict: The number of hits, misses and evicted output files, the hit rate, the bytes of the output files
+                which were loaded rather than computed, the average time in seconds to load an output file, as well as
+                the number of cached output files and their total size in bytes.
+        """
+        return self._cache_index.stats()
+
+    def submit(self, fn: callable, *args, resource_dict: dict = {}, **kwargs) -> Future:
+        """
+        Submits a callable to be executed with the given arguments.
+
+        Schedules the callable to be executed as fn(*args, **kwargs) and returns
+        a Future instance representing the execution of the callable.
+
+        Args:
+            fn (callable): function to submit for execution
+            args: arguments for the submitted function
+            kwargs: keyword arguments for the submitted function
+            resource_dict (dict): resource dictionary, which defines the resources used for the execution of the
+                                  function. The FileExecutor supports the number of cores, which overrides the
+                                  cores_per_worker parameter, and the reduction of the outputs of the MPI ranks,
+                                  either "gather", "root", "sum", "max", "min" or a function with two arguments:
+                                  {cores: 1, reduce: "gather"}
+
+        Returns:
+            Future: A Future representing the given call.
+        """
+        check_resource_dict(function=fn)
+        unsupported_key_lst = [
+            key for key in resource_dict.keys() if key not in ["cores", "reduce"]
+        ]
+        if len(unsupported_key_lst) > 0:
+            raise ValueError(
+                "The FileExecutor only supports the keys cores and reduce in the resource dictionary, the keys "
+                + str(unsupported_key_lst)
+                + " are not supported."
+            )
+        check_reduce(reduce=resource_dict.get("reduce"))
+        f = Future()
+        self._put_task(
+            {
+                "fn": fn,
+                "args": args,
+                "kwargs": kwargs,
+                "future": f,
+                "resource_dict": resource_dict,
+            }
+        )
+        return f
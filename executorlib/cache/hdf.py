@@ -1,42 +1,56 @@
-from typing import Tuple
+from collections.abc import Mapping
+from typing import Optional, Tuple
 
-import cloudpickle
-import h5io
 import h5py
 import numpy as np
 
+from executorlib.shared.compression import dumps, loads
 
-def dump(file_name: str, data_dict: dict) -> None:
+group_dict = {
+    "fn": "function",
+    "args": "input_args",
+    "kwargs": "input_kwargs",
+    "output": "output",
+    "compression": "compression",
+    "lazy": "lazy",
+    "reduce": "reduce",
+    "error": "error",
+}
+
+
+def dump(file_name: str, data_dict: dict, compression: Optional[str] = None) -> None:
     """
-    Dump data dictionary into HDF5 file
+    Dump data dictionary into HDF5 file. Numpy arrays, as well as dictionaries, lists and tuples containing numpy
+    arrays, are stored as native HDF5 datasets. All other objects are serialized with cloudpickle.
 
     Args:
         file_name (str): file name of the HDF5 file as absolute path
         data_dict (dict): dictionary containing the python function to be executed {"fn": ..., "args": (), "kwargs": {}}
+        compression (str): compress entries larger than 1MB with the codec "zlib", "lz4" or "zstd" - default is None.
+                           The numpy arrays are stored in compressed chunks, using gzip for the zlib codec and lzf
+                           otherwise, as these filters are available in every HDF5 installation.
     """
-    group_dict = {
-        "fn": "function",
-        "args": "input_args",
-        "kwargs": "input_kwargs",
-        "output": "output",
-    }
     with h5py.File(file_name, "a") as fname:
         for data_key, data_value in data_dict.items():
             if data_key in group_dict.keys():
-                h5io.write_hdf5(
-                    fname=fname,
-                    data=np.void(cloudpickle.dumps(data_value)),
-                    overwrite="update",
+                if group_dict[data_key] in fname:
+                    del fname[group_dict[data_key]]
+                _write_hdf(
+                    hdf=fname,
                     title=group_dict[data_key],
+                    value=data_value,
+                    compression=compression,
                 )
 
 
-def load(file_name: str) -> dict:
+def load(file_name: str, mmap_mode: Optional[str] = None) -> dict:
     """
     Load data dictionary from HDF5 file
 
     Args:
         file_name (str): file name of the HDF5 file as absolute path
+        mmap_mode (str): if "r", uncompressed numpy arrays are returned as read-only memory-mapped arrays rather than
+                         being read into memory - default is None
 
     Returns:
         dict: dictionary containing the python function to be executed {"fn": ..., "args": (), "kwargs": {}}
@@ -44,40 +58,342 @@ def load(file_name: str) -> dict:
     with h5py.File(file_name, "r") as hdf:
         data_dict = {}
         if "function" in hdf:
-            data_dict["fn"] = cloudpickle.loads(
-                h5io.read_hdf5(fname=hdf, title="function", slash="ignore")
-            )
+            data_dict["fn"] = _read_hdf(hdf=hdf, title="function", mmap_mode=mmap_mode)
         else:
             raise TypeError("Function not found in HDF5 file.")
         if "input_args" in hdf:
-            data_dict["args"] = cloudpickle.loads(
-                h5io.read_hdf5(fname=hdf, title="input_args", slash="ignore")
+            data_dict["args"] = _read_hdf(
+                hdf=hdf, title="input_args", mmap_mode=mmap_mode
             )
         else:
             data_dict["args"] = ()
         if "input_kwargs" in hdf:
-            data_dict["kwargs"] = cloudpickle.loads(
-                h5io.read_hdf5(fname=hdf, title="input_kwargs", slash="ignore")
+            data_dict["kwargs"] = _read_hdf(
+                hdf=hdf, title="input_kwargs", mmap_mode=mmap_mode
             )
         else:
             data_dict["kwargs"] = {}
+        if "compression" in hdf:
+            data_dict["compression"] = _read_hdf(hdf=hdf, title="compression")
+        if "lazy" in hdf:
+            data_dict["lazy"] = _read_hdf(hdf=hdf, title="lazy")
+        if "reduce" in hdf:
+            data_dict["reduce"] = _read_hdf(hdf=hdf, title="reduce")
         return data_dict
 
 
-def get_output(file_name: str) -> Tuple[bool, object]:
+def get_output(
+    file_name: str, mmap_mode: Optional[str] = None, lazy: bool = False
+) -> Tuple[bool, object]:
     """
     Check if output is available in the HDF5 file
 
     Args:
         file_name (str): file name of the HDF5 file as absolute path
+        mmap_mode (str): if "r", uncompressed numpy arrays are returned as read-only memory-mapped arrays rather than
+                         being read into memory - default is None
+        lazy (bool): return proxies which only read the data when it is accessed: uncompressed numpy arrays are
+                     memory-mapped, compressed numpy arrays are returned as DatasetView and dictionaries as LazyDict
+                     - default is False
 
     Returns:
         Tuple[bool, object]: boolean flag indicating if output is available and the output object itself
     """
     with h5py.File(file_name, "r") as hdf:
         if "output" in hdf:
-            return True, cloudpickle.loads(
-                h5io.read_hdf5(fname=hdf, title="output", slash="ignore")
+            return True, _read_hdf(
+                hdf=hdf, title="output", mmap_mode=mmap_mode, lazy=lazy
             )
         else:
             return False, None
+
+
+def get_error(file_name: str) -> Optional[BaseException]:
+    """
+    Get the exception of a failed task from the HDF5 file
+
+    Args:
+        file_name (str): file name of the HDF5 file as absolute path
+
+    Returns:
+        BaseException: exception raised by the task or None if the HDF5 file does not contain an exception
+    """
+    with h5py.File(file_name, "r") as hdf:
+        if "error" in hdf:
+            return _read_hdf(hdf=hdf, title="error")
+        else:
+            return None
+
+
+class DatasetView:
+    def __init__(self, file_name: str, path: str):
+        """
+        Initialize a DatasetView object, a read-only view of a numpy array stored as HDF5 dataset. Indexing the view
+        only reads the selected elements from the file, while converting it with numpy.asarray() reads the whole array.
+        The HDF5 file is opened on first access, so the view can be pickled and sent to other processes, and it is kept
+        open until close() is called or the view is garbage collected.
+
+        Args:
+            file_name (str): file name of the HDF5 file as absolute path
+            path (str): path of the dataset in the HDF5 file
+        """
+        self._file_name = file_name
+        self._path = path
+        self._hdf = None
+        self._dataset = None
+        with h5py.File(file_name, "r") as hdf:
+            self.shape = hdf[path].shape
+            self.dtype = hdf[path].dtype
+
+    @property
+    def ndim(self) -> int:
+        return len(self.shape)
+
+    @property
+    def size(self) -> int:
+        return int(np.prod(self.shape))
+
+    @property
+    def nbytes(self) -> int:
+        return self.size * self.dtype.itemsize
+
+    def __len__(self) -> int:
+        return self.shape[0]
+
+    def __getitem__(self, key) -> np.ndarray:
+        return self._get_dataset()[key]
+
+    def __array__(self, dtype=None, copy=None) -> np.ndarray:
+        data = self._get_dataset()[()]
+        if dtype is not None:
+            return data.astype(dtype)
+        return data
+
+    def __getstate__(self) -> dict:
+        return {
+            key: value
+            for key, value in self.__dict__.items()
+            if key not in ["_hdf", "_dataset"]
+        }
+
+    def __setstate__(self, state: dict):
+        self.__dict__.update(state)
+        self._hdf = None
+        self._dataset = None
+
+    def __del__(self):
+        self.close()
+
+    def close(self) -> None:
+        """
+        Close the HDF5 file, it is opened again on the next access.
+        """
+        if self._hdf is not None:
+            self._hdf.close()
+        self._hdf = None
+        self._dataset = None
+
+    def __repr__(self) -> str:
+        return (
+            "DatasetView(file_name="
+            + self._file_name
+            + ", path="
+            + self._path
+            + ", shape="
+            + str(self.shape)
+            + ", dtype="
+            + str(self.dtype)
+            + ")"
+        )
+
+    def _get_dataset(self) -> h5py.Dataset:
+        """
+        Open the HDF5 file on first access and keep it open for the following accesses.
+
+        Returns:
+            h5py.Dataset: HDF5 dataset
+        """
+        if self._dataset is None:
+            self._hdf = h5py.File(self._file_name, "r")
+            self._dataset = self._hdf[self._path]
+        return self._dataset
+
+
+class LazyDict(Mapping):
+    def __init__(self, file_name: str, path: str, key_lst: list):
+        """
+        Initialize a LazyDict object, a read-only dictionary stored as HDF5 group. Each value is read from the file on
+        first access and kept in memory for the following accesses.
+
+        Args:
+            file_name (str): file name of the HDF5 file as absolute path
+            path (str): path of the group in the HDF5 file
+            key_lst (list): keys of the dictionary
+        """
+        self._file_name = file_name
+        self._path = path
+        self._key_lst = key_lst
+        self._value_dict = {}
+
+    def __getitem__(self, key: str) -> object:
+        if key not in self._key_lst:
+            raise KeyError(key)
+        if key not in self._value_dict.keys():
+            with h5py.File(self._file_name, "r") as hdf:
+                self._value_dict[key] = _read_hdf(
+                    hdf=hdf[self._path], title="key_" + key, lazy=True
+                )
+        return self._value_dict[key]
+
+    def __iter__(self):
+        return iter(self._key_lst)
+
+    def __len__(self) -> int:
+        return len(self._key_lst)
+
+    def __repr__(self) -> str:
+        return "LazyDict(" + str(self._key_lst) + ")"
+
+
+def _write_hdf(
+    hdf: h5py.Group, title: str, value: object, compression: Optional[str] = None
+) -> None:
+    """
+    Write a python object to an HDF5 group. The layout follows the conventions of h5io, so the files remain readable
+    with h5io.read_hdf5(): each node has a TITLE attribute with its type, dictionary entries are stored as key_<key>
+    and list or tuple entries as idx_<index>. Objects serialized with cloudpickle are stored as opaque void datasets.
+
+    Args:
+        hdf (h5py.Group): HDF5 group to write to
+        title (str): name of the node in the HDF5 group
+        value (object): python object to write
+        compression (str): compression codec "zlib", "lz4" or "zstd" - default is None
+    """
+    if _is_native_array(value=value):
+        if compression is not None and value.size > 0:
+            hdf.create_dataset(
+                title,
+                data=value,
+                chunks=True,
+                compression="gzip" if compression == "zlib" else "lzf",
+                compression_opts=1 if compression == "zlib" else None,
+            )
+        else:
+            hdf.create_dataset(title, data=value)
+        hdf[title].attrs["TITLE"] = "ndarray"
+    elif _contains_native_array(value=value):
+        group = hdf.create_group(title, track_order=True)
+        if isinstance(value, dict):
+            group.attrs["TITLE"] = "dict"
+            for key, item in value.items():
+                _write_hdf(
+                    hdf=group, title="key_" + key, value=item, compression=compression
+                )
+        else:
+            group.attrs["TITLE"] = type(value).__name__
+            for index, item in enumerate(value):
+                _write_hdf(
+                    hdf=group,
+                    title="idx_" + str(index),
+                    value=item,
+                    compression=compression,
+                )
+    else:
+        hdf.create_dataset(
+            title, data=np.void(dumps(obj=value, compression=compression))
+        )
+        hdf[title].attrs["TITLE"] = "void"
+
+
+def _read_hdf(
+    hdf: h5py.Group, title: str, mmap_mode: Optional[str] = None, lazy: bool = False
+) -> object:
+    """
+    Read a python object written by _write_hdf() from an HDF5 group.
+
+    Args:
+        hdf (h5py.Group): HDF5 group to read from
+        title (str): name of the node in the HDF5 group
+        mmap_mode (str): if "r", uncompressed numpy arrays are returned as read-only memory-mapped arrays
+        lazy (bool): return memory-mapped arrays, DatasetView and LazyDict proxies rather than reading the data
+
+    Returns:
+        object: python object
+    """
+    node = hdf[title]
+    node_type = node.attrs.get("TITLE")
+    if lazy and mmap_mode is None:
+        mmap_mode = "r"
+    if node_type == "ndarray":
+        offset = node.id.get_offset()
+        if mmap_mode is not None and offset is not None:
+            return np.memmap(
+                node.file.filename,
+                dtype=node.dtype,
+                mode=mmap_mode,
+                offset=offset,
+                shape=node.shape,
+            )
+        elif lazy and node.size > 0:
+            return DatasetView(file_name=node.file.filename, path=node.name)
+        return node[()]
+    elif node_type == "dict" and lazy:
+        return LazyDict(
+            file_name=node.file.filename,
+            path=node.name,
+            key_lst=[key[len("key_") :] for key in node.keys()],
+        )
+    elif node_type == "dict":
+        return {
+            key[len("key_") :]: _read_hdf(hdf=node, title=key, mmap_mode=mmap_mode)
+            for key in node.keys()
+        }
+    elif node_type in ["list", "tuple"]:
+        value_lst = [
+            _read_hdf(
+                hdf=node, title="idx_" + str(index), mmap_mode=mmap_mode, lazy=lazy
+            )
+            for index in range(len(node))
+        ]
+        return value_lst if node_type == "list" else tuple(value_lst)
+    else:
+        return loads(node[()])
+
+
+def _is_native_array(value: object) -> bool:
+    """
+    Check if a python object is a numpy array which can be stored as native HDF5 dataset. Zero-dimensional arrays are
+    excluded, as h5py reads scalar datasets as numpy scalars rather than numpy arrays.
+
+    Args:
+        value (object): python object
+
+    Returns:
+        bool: True for numpy arrays of numeric or boolean type with at least one dimension
+    """
+    return type(value) is np.ndarray and value.ndim > 0 and value.dtype.kind in "biufc"
+
+
+def _contains_native_array(value: object) -> bool:
+    """
+    Check if a python object is a dictionary with string keys, a list or a tuple, which contains numpy arrays that can
+    be stored as native HDF5 datasets.
+
+    Args:
+        value (object): python object
+
+    Returns:
+        bool: True if the object is stored as HDF5 group
+    """
+    if type(value) is dict and all(
+        isinstance(key, str) and "/" not in key for key in value.keys()
+    ):
+        item_lst = list(value.values())
+    elif type(value) in [list, tuple]:
+        item_lst = value
+    else:
+        return False
+    return any(
+        _is_native_array(value=item) or _contains_native_array(value=item)
+        for item in item_lst
+    )
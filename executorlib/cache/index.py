@@ -0,0 +1,343 @@
+import os
+import sqlite3
+import time
+from typing import Optional
+
+from executorlib.cache.storage import remove
+
+
+class CacheIndex:
+    def __init__(
+        self,
+        cache_directory: str,
+        manifest: bool = False,
+        max_bytes: Optional[int] = None,
+        eviction_policy: str = "lru",
+    ):
+        """
+        Initialize a CacheIndex object, which keeps the keys of the completed tasks in the cache directory in memory, so
+        checking if a task is already cached does not require listing the cache directory. The index is loaded once,
+        either by listing the cache directory or from the manifest, and updated when tasks are completed.
+
+        Besides the keys, the index records the size, the last access time and the number of hits of each output file.
+        When max_bytes is set, the least recently used (LRU) or least frequently used (LFU) output files are deleted
+        once the total size exceeds the limit, except for the pinned output files, which are still required by pending
+        tasks. The access time is stored as modification time of the output file, or in the manifest if it is enabled,
+        so the eviction order is kept between sessions.
+
+        Args:
+            cache_directory (str): The directory to store the HDF5 files.
+            manifest (bool, optional): Persist the index as sqlite database in the cache directory, so multiple
+                executors can share it. Defaults to False.
+            max_bytes (int, optional): The maximum total size in bytes of the output files, None for no limit.
+                Defaults to None.
+            eviction_policy (str, optional): Evict the least recently used "lru" or the least frequently used "lfu"
+                output files first. Defaults to "lru".
+
+        """
+        if eviction_policy not in ["lru", "lfu"]:
+            raise ValueError(
+                "The eviction policy "
+                + str(eviction_policy)
+                + " is not supported, choose either lru or lfu."
+            )
+        self._cache_directory = cache_directory
+        self._max_bytes = max_bytes
+        self._eviction_policy = eviction_policy
+        self._connection = None
+        self._entry_dict = {}
+        self._pin_dict = {}
+        self._total_bytes = 0
+        self._stats_dict = {
+            "hits": 0,
+            "misses": 0,
+            "evictions": 0,
+            "bytes_saved": 0,
+            "load_time": 0.0,
+        }
+        if manifest:
+            self._connection = _connect_manifest(
+                file_name=os.path.join(cache_directory, "manifest.sqlite")
+            )
+            for task_key, size, access_time, hits in self._connection.execute(
+                "SELECT task_key, size, access_time, hits FROM task"
+            ):
+                self._set_entry(
+                    task_key=task_key, size=size, access_time=access_time, hits=hits
+                )
+        if not manifest or len(self._entry_dict) == 0:
+            with os.scandir(cache_directory) as it:
+                for entry in it:
+                    if entry.name.endswith(".h5out"):
+                        stat_result = entry.stat()
+                        self._set_entry(
+                            task_key=entry.name[: -len(".h5out")],
+                            size=stat_result.st_size,
+                            access_time=stat_result.st_mtime,
+                        )
+            self._insert(task_key_lst=list(self._entry_dict.keys()))
+        self._evict()
+
+    def __contains__(self, task_key: str) -> bool:
+        """
+        Check if a task is completed. Task keys which are not in memory are looked up in the manifest, as they might
+        have been completed by a different executor sharing the same cache directory.
+
+        Args:
+            task_key (str): The key of the task.
+
+        Returns:
+            bool: True if the output of the task is cached.
+
+        """
+        if task_key in self._entry_dict:
+            return True
+        elif self._connection is not None:
+            row = self._connection.execute(
+                "SELECT size, access_time, hits FROM task WHERE task_key = ?",
+                (task_key,),
+            ).fetchone()
+            if row is not None:
+                self._set_entry(
+                    task_key=task_key, size=row[0], access_time=row[1], hits=row[2]
+                )
+                return True
+        return False
+
+    def add(self, task_key: str) -> None:
+        """
+        Add a completed task to the index and evict output files if the total size exceeds the limit.
+
+        Args:
+            task_key (str): The key of the task.
+
+        """
+        if task_key not in self._entry_dict:
+            self._set_entry(task_key=task_key, size=self._get_file_size(task_key))
+            self._insert(task_key_lst=[task_key])
+            self._evict()
+
+    def remove(self, task_key: str) -> None:
+        """
+        Remove a task from the index, for example when its output file was deleted.
+
+        Args:
+            task_key (str): The key of the task.
+
+        """
+        entry = self._entry_dict.pop(task_key, None)
+        if entry is not None:
+            self._total_bytes -= entry["size"]
+        if self._connection is not None:
+            with self._connection:
+                self._connection.execute(
+                    "DELETE FROM task WHERE task_key = ?", (task_key,)
+                )
+
+    def hit(self, task_key: str, load_time: float = 0.0) -> None:
+        """
+        Record that the output of a task was loaded from the cache rather than executing the task again.
+
+        Args:
+            task_key (str): The key of the task.
+            load_time (float, optional): The time in seconds to load the output. Defaults to 0.0.
+
+        """
+        self._stats_dict["hits"] += 1
+        self._stats_dict["load_time"] += load_time
+        entry = self._entry_dict.get(task_key)
+        if entry is None:
+            return
+        self._stats_dict["bytes_saved"] += entry["size"]
+        entry["access_time"] = time.time()
+        entry["hits"] += 1
+        if self._connection is not None:
+            with self._connection:
+                self._connection.execute(
+                    "UPDATE task SET access_time = ?, hits = ? WHERE task_key = ?",
+                    (entry["access_time"], entry["hits"], task_key),
+                )
+        else:
+            try:
+                os.utime(self._get_file_name(task_key=task_key))
+            except FileNotFoundError:
+                pass
+
+    def miss(self) -> None:
+        """
+        Record that a task was not found in the cache and has to be executed.
+        """
+        self._stats_dict["misses"] += 1
+
+    def pin(self, task_key: str) -> None:
+        """
+        Pin the output file of a task, so it is not evicted while pending tasks still require it. A task can be pinned
+        multiple times and is released once it is unpinned as often as it was pinned.
+
+        Args:
+            task_key (str): The key of the task.
+
+        """
+        self._pin_dict[task_key] = self._pin_dict.get(task_key, 0) + 1
+
+    def unpin(self, task_key: str) -> None:
+        """
+        Release a pinned output file and evict output files if the total size exceeds the limit.
+
+        Args:
+            task_key (str): The key of the task.
+
+        """
+        if task_key in self._pin_dict:
+            self._pin_dict[task_key] -= 1
+            if self._pin_dict[task_key] <= 0:
+                del self._pin_dict[task_key]
+                self._evict()
+
+    def stats(self) -> dict:
+        """
+        Get the statistics of the cache.
+
+        Returns:
+            dict: The number of hits, misses and evicted output files, the hit rate, the bytes of the output files
+                which were loaded rather than computed, the average time in seconds to load an output file, as well as
+                the number of entries and their total size in bytes.
+
+        """
+        stats_dict = {
+            key: value for key, value in self._stats_dict.items() if key != "load_time"
+        }
+        requests = stats_dict["hits"] + stats_dict["misses"]
+        stats_dict["hit_rate"] = stats_dict["hits"] / requests if requests > 0 else 0.0
+        stats_dict["average_load_time"] = (
+            self._stats_dict["load_time"] / stats_dict["hits"]
+            if stats_dict["hits"] > 0
+            else 0.0
+        )
+        stats_dict["entries"] = len(self._entry_dict)
+        stats_dict["bytes"] = self._total_bytes
+        return stats_dict
+
+    def close(self) -> None:
+        """
+        Close the connection to the manifest.
+        """
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    def _evict(self) -> None:
+        """
+        Delete the output files of the least recently or least frequently used tasks, which are not pinned, until the
+        total size is below the limit.
+        """
+        if self._max_bytes is None or self._total_bytes <= self._max_bytes:
+            return
+        entry_lst = sorted(
+            self._entry_dict.items(),
+            key=lambda item: (
+                item[1]["hits"] if self._eviction_policy == "lfu" else 0,
+                item[1]["access_time"],
+            ),
+        )
+        for task_key, _ in entry_lst:
+            if self._total_bytes <= self._max_bytes:
+                break
+            if task_key in self._pin_dict:
+                continue
+            try:
+                remove(file_name=self._get_file_name(task_key=task_key))
+            except FileNotFoundError:
+                pass
+            self.remove(task_key=task_key)
+            self._stats_dict["evictions"] += 1
+
+    def _set_entry(
+        self,
+        task_key: str,
+        size: Optional[int],
+        access_time: Optional[float] = None,
+        hits: Optional[int] = None,
+    ) -> None:
+        """
+        Add an entry to the index in memory.
+
+        Args:
+            task_key (str): The key of the task.
+            size (int): The size of the output file in bytes.
+            access_time (float, optional): The last access time. Defaults to the current time.
+            hits (int, optional): The number of hits. Defaults to 0.
+
+        """
+        if size is None:
+            size = self._get_file_size(task_key=task_key)
+        self._entry_dict[task_key] = {
+            "size": size,
+            "access_time": access_time if access_time is not None else time.time(),
+            "hits": hits if hits is not None else 0,
+        }
+        self._total_bytes += size
+
+    def _get_file_name(self, task_key: str) -> str:
+        return os.path.join(self._cache_directory, task_key + ".h5out")
+
+    def _get_file_size(self, task_key: str) -> int:
+        try:
+            return os.path.getsize(self._get_file_name(task_key=task_key))
+        except FileNotFoundError:
+            return 0
+
+    def _insert(self, task_key_lst: list) -> None:
+        """
+        Insert completed tasks into the manifest, if the index is persisted.
+
+        Args:
+            task_key_lst (list): The keys of the tasks.
+
+        """
+        if self._connection is not None and len(task_key_lst) > 0:
+            with self._connection:
+                self._connection.executemany(
+                    "INSERT OR IGNORE INTO task (task_key, size, access_time, hits) VALUES (?, ?, ?, ?)",
+                    [
+                        (
+                            task_key,
+                            self._entry_dict[task_key]["size"],
+                            self._entry_dict[task_key]["access_time"],
+                            self._entry_dict[task_key]["hits"],
+                        )
+                        for task_key in task_key_lst
+                    ],
+                )
+
+
+def _connect_manifest(file_name: str, timeout: float = 60.0):
+    """
+    Connect to the sqlite manifest and create the table of completed tasks if it does not exist yet. Manifests created
+    by previous versions only contain the task keys, so the columns for the size, the access time and the number of
+    hits are added. The connection can be used by a different thread than the one it was created in, as the executor
+    creates the index before starting the thread which uses it.
+
+    Args:
+        file_name (str): The file name of the sqlite database.
+        timeout (float, optional): Seconds to wait for a lock held by a different executor. Defaults to 60.0.
+
+    Returns:
+        sqlite3.Connection: The connection to the manifest.
+    """
+    connection = sqlite3.connect(file_name, timeout=timeout, check_same_thread=False)
+    with connection:
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS task (task_key TEXT PRIMARY KEY, size INTEGER, access_time REAL, hits INTEGER)"
+        )
+        column_lst = [row[1] for row in connection.execute("PRAGMA table_info(task)")]
+        for column, column_type in [
+            ("size", "INTEGER"),
+            ("access_time", "REAL"),
+            ("hits", "INTEGER"),
+        ]:
+            if column not in column_lst:
+                connection.execute(
+                    "ALTER TABLE task ADD COLUMN " + column + " " + column_type
+                )
+    return connection
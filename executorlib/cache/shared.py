@@ -1,17 +1,32 @@
-import hashlib
 import importlib.util
 import os
 import queue
-import re
 import subprocess
 import sys
+import time
+import traceback
 from concurrent.futures import Future
-from typing import Any, Tuple
-
-import cloudpickle
-
-from executorlib.cache.hdf import dump, get_output, load
-from executorlib.shared.executor import get_command_path
+from functools import partial
+from typing import Any, Optional, Tuple
+
+try:  # inotify is only available on Linux, other systems fall back to polling.
+    from inotify_simple import INotify
+    from inotify_simple import flags as inotify_flags
+except ImportError:
+    INotify = None
+
+from executorlib.cache.index import CacheIndex
+from executorlib.cache.storage import (
+    HDF5Storage,
+    StorageBase,
+    dump,
+    get_error,
+    get_output,
+    load,
+)
+from executorlib.shared.executor import ResourceScheduler, get_command_path
+from executorlib.shared.hashing import get_hash
+from executorlib.shared.scatter import resolve_scatter_arguments
 
 
 class FutureItem:
@@ -25,19 +40,24 @@ class FutureItem:
         """
         self._file_name = file_name
 
-    def result(self) -> str:
+    def result(self, lazy: bool = False) -> str:
         """
         Get the result of the future item.
 
+        Args:
+            lazy (bool, optional): Return proxies which only read the parts of the result which are accessed, namely
+                memory-mapped numpy arrays, DatasetView objects for compressed numpy arrays and LazyDict objects for
+                dictionaries. Defaults to False.
+
         Returns:
             str: The result of the future item.
 
         """
-        exec_flag, result = get_output(file_name=self._file_name)
+        exec_flag, result = get_output(file_name=self._file_name, lazy=lazy)
         if exec_flag:
             return result
         else:
-            return self.result()
+            return self.result(lazy=lazy)
 
     def done(self) -> bool:
         """
@@ -50,6 +70,60 @@ class FutureItem:
         return get_output(file_name=self._file_name)[0]
 
 
+class DirectoryWatcher:
+    def __init__(self, directory: str, rescan_interval: Optional[float] = None):
+        """
+        Initialize a DirectoryWatcher object, which reports the files created in a directory using inotify. When
+        inotify is not available, the DirectoryWatcher is inactive and all files have to be checked. Files written by
+        other nodes of a network file system like NFS, Lustre or GPFS do not trigger inotify events, so with a rescan
+        interval all files have to be checked again after this interval.
+
+        Args:
+            directory (str): The directory to watch.
+            rescan_interval (float, optional): The interval in seconds after which all files have to be checked, even
+                when inotify is available. Defaults to None, which relies on inotify only.
+
+        """
+        self._rescan_interval = rescan_interval
+        self._rescan_time = time.monotonic()
+        self._inotify = None
+        if INotify is not None:
+            try:
+                self._inotify = INotify()
+                self._inotify.add_watch(
+                    directory, inotify_flags.MOVED_TO | inotify_flags.CLOSE_WRITE
+                )
+            except OSError:
+                self._inotify = None
+
+    def read(self) -> Optional[set]:
+        """
+        Read the names of the files created in the directory since the last call without blocking.
+
+        Returns:
+            set: The names of the created files, None if they are unknown and all files have to be checked.
+
+        """
+        if self._inotify is None:
+            return None
+        event_lst = self._inotify.read(timeout=0)
+        if any(event.mask & inotify_flags.Q_OVERFLOW for event in event_lst) or (
+            self._rescan_interval is not None
+            and time.monotonic() - self._rescan_time >= self._rescan_interval
+        ):
+            self._rescan_time = time.monotonic()
+            return None
+        return {event.name for event in event_lst}
+
+    def close(self) -> None:
+        """
+        Stop watching the directory.
+        """
+        if self._inotify is not None:
+            self._inotify.close()
+            self._inotify = None
+
+
 def backend_load_file(file_name: str) -> dict:
     """
     Load the data from an HDF5 file and convert FutureItem objects to their results.
@@ -61,25 +135,43 @@ def backend_load_file(file_name: str) -> dict:
         dict: The loaded data from the file.
 
     """
-    apply_dict = load(file_name=file_name)
+    return backend_resolve_future_items(apply_dict=load(file_name=file_name))
+
+
+def backend_resolve_future_items(apply_dict: dict) -> dict:
+    """
+    Convert the FutureItem objects in the arguments of a task to their results. When the task was submitted with lazy
+    inputs, the results are resolved to proxies, so only the parts which are accessed are read from the HDF5 files.
+
+    Args:
+        apply_dict (dict): The task loaded from the HDF5 file.
+
+    Returns:
+        dict: The task with the results of the FutureItem objects as arguments.
+
+    """
+    lazy = apply_dict.get("lazy", False)
     apply_dict["args"] = [
-        arg if not isinstance(arg, FutureItem) else arg.result()
+        arg if not isinstance(arg, FutureItem) else arg.result(lazy=lazy)
         for arg in apply_dict["args"]
     ]
     apply_dict["kwargs"] = {
-        key: arg if not isinstance(arg, FutureItem) else arg.result()
+        key: arg if not isinstance(arg, FutureItem) else arg.result(lazy=lazy)
         for key, arg in apply_dict["kwargs"].items()
     }
     return apply_dict
 
 
-def backend_write_file(file_name: str, output: Any) -> None:
+def backend_write_file(
+    file_name: str, output: Any, compression: Optional[str] = None
+) -> None:
     """
     Write the output to an HDF5 file.
 
     Args:
         file_name (str): The name of the HDF5 file.
         output (Any): The output to be written.
+        compression (str, optional): The codec to compress large outputs. Defaults to None.
 
     Returns:
         None
@@ -87,15 +179,46 @@ def backend_write_file(file_name: str, output: Any) -> None:
     """
     file_name_out = os.path.splitext(file_name)[0]
     os.rename(file_name, file_name_out + ".h5ready")
-    dump(file_name=file_name_out + ".h5ready", data_dict={"output": output})
+    dump(
+        file_name=file_name_out + ".h5ready",
+        data_dict={"output": output},
+        compression=compression,
+    )
     os.rename(file_name_out + ".h5ready", file_name_out + ".h5out")
 
 
+def backend_write_error(file_name: str, error: Exception) -> None:
+    """
+    Write the exception of a failed task to an HDF5 file with the suffix .h5err. Like the output, the exception is
+    written to the file of the task after renaming it to the suffix .h5ready, so the file is only read once it is
+    complete. Exceptions which cannot be serialized are stored as RuntimeError with the formatted traceback.
+
+    Args:
+        file_name (str): The name of the HDF5 file.
+        error (Exception): The exception raised by the task.
+
+    Returns:
+        None
+
+    """
+    file_name_out = os.path.splitext(file_name)[0]
+    os.rename(file_name, file_name_out + ".h5ready")
+    try:
+        dump(file_name=file_name_out + ".h5ready", data_dict={"error": error})
+    except Exception:  # Exceptions which cannot be serialized are converted
+        dump(
+            file_name=file_name_out + ".h5ready",
+            data_dict={"error": RuntimeError(traceback.format_exc())},
+        )
+    os.rename(file_name_out + ".h5ready", file_name_out + ".h5err")
+
+
 def execute_in_subprocess(
     command: list, task_dependent_lst: list = []
 ) -> subprocess.Popen:
     """
-    Execute a command in a subprocess.
+    Execute a command in a subprocess. The FileExecutor only launches a task once the tasks it depends on are finished,
+    so the subprocesses in task_dependent_lst are already terminated and waiting for them does not block.
 
     Args:
         command (list): The command to be executed.
@@ -105,10 +228,8 @@ def execute_in_subprocess(
         subprocess.Popen: The subprocess object.
 
     """
-    while len(task_dependent_lst) > 0:
-        task_dependent_lst = [
-            task for task in task_dependent_lst if task.poll() is None
-        ]
+    for task in task_dependent_lst:
+        task.wait()
     return subprocess.Popen(command, universal_newlines=True)
 
 
@@ -117,25 +238,81 @@ def execute_tasks_h5(
     cache_directory: str,
     cores_per_worker: int,
     execute_function: callable,
+    compression: Optional[str] = None,
+    refresh_rate_min: float = 0.01,
+    refresh_rate_max: float = 1.0,
+    cache_manifest: bool = False,
+    lazy_inputs: bool = False,
+    max_cores: Optional[int] = None,
+    bundle_size: int = 1,
+    worker_pool: Optional[Any] = None,
+    cache_index: Optional[CacheIndex] = None,
+    storage: Optional[StorageBase] = None,
 ) -> None:
     """
-    Execute tasks stored in a queue using HDF5 files.
+    Execute tasks stored in a queue using HDF5 files. While tasks are pending, the queue is checked with an adaptive
+    refresh rate: after a task finished the completion is checked again after refresh_rate_min, otherwise the interval
+    is doubled up to refresh_rate_max. Output files are only opened once the task is known to be finished. Tasks which
+    depend on unfinished tasks are parked and launched once their dependencies are finished, so submitting tasks never
+    blocks and independent tasks are launched immediately. When max_cores is set, the ready tasks are queued in the
+    ResourceScheduler and new processes are only started as the running ones finish. With a bundle_size larger than
+    one, the ready tasks are executed in bundles, which are launched once they are complete or no further tasks are
+    submitted.
 
     Args:
         future_queue (queue.Queue): The queue containing the tasks.
         cache_directory (str): The directory to store the HDF5 files.
-        cores_per_worker (int): The number of cores per worker.
+        cores_per_worker (int): The number of cores per worker, tasks can override it with the key "cores" in their
+            resource dictionary.
         execute_function (callable): The function to execute the tasks.
+        compression (str, optional): The codec to compress large inputs and outputs. Defaults to None.
+        refresh_rate_min (float, optional): The minimum interval in seconds to check for finished tasks. Defaults to 0.01.
+        refresh_rate_max (float, optional): The maximum interval in seconds to check for finished tasks. Defaults to 1.0.
+        cache_manifest (bool, optional): Persist the index of completed tasks as sqlite database in the cache directory,
+            so it can be shared by multiple executors. Defaults to False.
+        lazy_inputs (bool, optional): Pass the results of other tasks as proxies which only read the parts that are
+            accessed. Defaults to False.
+        max_cores (int, optional): The maximum number of cores used by the running tasks, None for no limit. Defaults
+            to None.
+        bundle_size (int, optional): The maximum number of ready tasks executed one after another by a single process,
+            to reduce the overhead of starting the python interpreter for short tasks. Defaults to 1.
+        worker_pool (CacheWorkerPool, optional): The pool of persistent worker processes, which executes the tasks
+            with a single core instead of starting a python process for each task. Defaults to None.
+        cache_index (CacheIndex, optional): The index of the completed tasks, which records the cache statistics and
+            evicts output files beyond its size limit. Defaults to None, which creates an index without size limit.
+        storage (StorageBase, optional): The storage backend to write the files of new tasks. Defaults to None, which
+            stores the tasks in HDF5 files.
 
     Returns:
         None
 
     """
-    memory_dict, process_dict, file_name_dict = {}, {}, {}
+    memory_dict, process_dict, file_name_dict, waiting_dict = {}, {}, {}, {}
+    pin_dict = {}
+    # The output files written by other nodes are found by checking all pending tasks every refresh_rate_max
+    directory_watcher = DirectoryWatcher(
+        directory=cache_directory, rescan_interval=refresh_rate_max
+    )
+    if cache_index is None:
+        cache_index = CacheIndex(
+            cache_directory=cache_directory, manifest=cache_manifest
+        )
+    if storage is None:
+        storage = HDF5Storage()
+    scheduler = ResourceScheduler(
+        max_cores=max_cores if max_cores is not None else sys.maxsize
+    )
+    refresh_rate = refresh_rate_min
+    shutdown_requested, shutdown_wait = False, True
     while True:
         task_dict = None
         try:
-            task_dict = future_queue.get_nowait()
+            if shutdown_requested:
+                time.sleep(refresh_rate)
+            elif len(memory_dict) > 0:
+                task_dict = future_queue.get(timeout=refresh_rate)
+            else:
+                task_dict = future_queue.get()
         except queue.Empty:
             pass
         if (
@@ -143,9 +320,9 @@ def execute_tasks_h5(
             and "shutdown" in task_dict.keys()
             and task_dict["shutdown"]
         ):
+            shutdown_requested = True
+            shutdown_wait = task_dict.get("wait", True)
             future_queue.task_done()
-            future_queue.join()
-            break
         elif task_dict is not None:
             task_args, task_kwargs, future_wait_key_lst = _convert_args_and_kwargs(
                 task_dict=task_dict,
@@ -155,32 +332,115 @@ def execute_tasks_h5(
             task_key, data_dict = _serialize_funct_h5(
                 task_dict["fn"], *task_args, **task_kwargs
             )
+            reduce = task_dict.get("resource_dict", {}).get("reduce")
+            if reduce is not None:
+                # The reduction changes the output, so it is part of the task key
+                data_dict["reduce"] = reduce
+                task_key = task_dict["fn"].__name__ + get_hash(obj=data_dict)
             if task_key not in memory_dict.keys():
-                if task_key + ".h5out" not in os.listdir(cache_directory):
+                if task_key in cache_index:
+                    load_start = time.perf_counter()
+                    if _check_task_output(
+                        task_key=task_key,
+                        future_obj=task_dict["future"],
+                        cache_directory=cache_directory,
+                    ).done():
+                        cache_index.hit(
+                            task_key=task_key,
+                            load_time=time.perf_counter() - load_start,
+                        )
+                    else:
+                        # The output file was removed after the index was loaded
+                        cache_index.remove(task_key=task_key)
+                if task_key not in cache_index:
+                    cache_index.miss()
                     file_name = os.path.join(cache_directory, task_key + ".h5in")
-                    dump(file_name=file_name, data_dict=data_dict)
-                    process_dict[task_key] = execute_function(
-                        command=_get_execute_command(
-                            file_name=file_name,
-                            cores=cores_per_worker,
+                    if compression is not None:
+                        data_dict["compression"] = compression
+                    if lazy_inputs:
+                        data_dict["lazy"] = lazy_inputs
+                    dump(
+                        file_name=file_name,
+                        data_dict=data_dict,
+                        compression=compression,
+                        storage=storage,
+                    )
+                    file_name_dict[task_key] = os.path.join(
+                        cache_directory, task_key + ".h5out"
+                    )
+                    memory_dict[task_key] = task_dict["future"]
+                    # The outputs of the dependencies are not evicted before the task is finished
+                    pin_dict[task_key] = future_wait_key_lst
+                    for k in future_wait_key_lst:
+                        cache_index.pin(task_key=k)
+                    waiting_dict[task_key] = {
+                        "cores": task_dict.get("resource_dict", {}).get(
+                            "cores", cores_per_worker
                         ),
-                        task_dependent_lst=[
-                            process_dict[k] for k in future_wait_key_lst
-                        ],
+                        "dependency_dict": {
+                            k: memory_dict[k] for k in future_wait_key_lst
+                        },
+                    }
+                    waiting_dict = _launch_ready_tasks(
+                        waiting_dict=waiting_dict,
+                        memory_dict=memory_dict,
+                        process_dict=process_dict,
+                        execute_function=execute_function,
+                        cache_directory=cache_directory,
+                        scheduler=scheduler,
+                        bundle_size=bundle_size,
+                        flush=future_queue.empty(),
+                        worker_pool=worker_pool,
                     )
-                file_name_dict[task_key] = os.path.join(
-                    cache_directory, task_key + ".h5out"
-                )
-                memory_dict[task_key] = task_dict["future"]
             future_queue.task_done()
         else:
-            memory_dict = {
-                key: _check_task_output(
-                    task_key=key, future_obj=value, cache_directory=cache_directory
+            if worker_pool is not None:
+                worker_pool.check()
+            task_key_lst = _get_finished_task_keys(
+                task_key_lst=[key for key in memory_dict.keys() if key in process_dict],
+                process_dict=process_dict,
+                directory_watcher=directory_watcher,
+            )
+            for key in task_key_lst:
+                future_obj = _check_task_output(
+                    task_key=key,
+                    future_obj=memory_dict[key],
+                    cache_directory=cache_directory,
+                    process=process_dict.get(key),
                 )
-                for key, value in memory_dict.items()
-                if not value.done()
+                if future_obj.done() and future_obj.exception() is None:
+                    cache_index.add(task_key=key)
+            waiting_dict = _launch_ready_tasks(
+                waiting_dict=waiting_dict,
+                memory_dict=memory_dict,
+                process_dict=process_dict,
+                execute_function=execute_function,
+                cache_directory=cache_directory,
+                scheduler=scheduler,
+                bundle_size=bundle_size,
+                worker_pool=worker_pool,
+            )
+            # Poll again quickly after progress, otherwise back off to reduce the load on the file system
+            if any(memory_dict[key].done() for key in task_key_lst):
+                refresh_rate = refresh_rate_min
+            else:
+                refresh_rate = min(2 * refresh_rate, refresh_rate_max)
+            for key in [key for key, value in memory_dict.items() if value.done()]:
+                for k in pin_dict.pop(key, []):
+                    cache_index.unpin(task_key=k)
+            memory_dict = {
+                key: value for key, value in memory_dict.items() if not value.done()
             }
+        # Tasks waiting for their dependencies or for free cores are launched before the shutdown, unless it does not wait
+        if shutdown_requested and (
+            (len(waiting_dict) == 0 and len(scheduler) == 0) or not shutdown_wait
+        ):
+            if worker_pool is not None:
+                worker_pool.shutdown(wait=shutdown_wait)
+            directory_watcher.close()
+            cache_index.close()
+            future_queue.join()
+            break
 
 
 def execute_task_in_file(file_name: str) -> None:
@@ -193,21 +453,48 @@ def execute_task_in_file(file_name: str) -> None:
     Returns:
         None
     """
-    apply_dict = backend_load_file(file_name=file_name)
+    apply_dict = resolve_scatter_arguments(
+        input_dict=backend_load_file(file_name=file_name)
+    )
     result = apply_dict["fn"].__call__(*apply_dict["args"], **apply_dict["kwargs"])
     backend_write_file(
         file_name=file_name,
         output=result,
+        compression=apply_dict.get("compression"),
     )
 
 
-def _get_execute_command(file_name: str, cores: int = 1) -> list:
+def execute_task_bundle(file_name_lst: list) -> bool:
+    """
+    Execute the tasks stored in a list of HDF5 files one after another, so the python interpreter is started and the
+    modules are imported only once. The output of each task is written as soon as it is finished. The exception of a
+    failing task is written to its .h5err file and does not stop the remaining tasks.
+
+    Args:
+        file_name_lst (list): The file names of the HDF5 files as absolute paths.
+
+    Returns:
+        bool: True if all tasks were executed successfully.
+    """
+    success = True
+    for file_name in file_name_lst:
+        try:
+            execute_task_in_file(file_name=file_name)
+        except Exception as e:
+            traceback.print_exc()
+            success = False
+            if os.path.exists(file_name):
+                backend_write_error(file_name=file_name, error=e)
+    return success
+
+
+def _get_execute_command(file_name_lst: list, cores: int = 1) -> list:
     """
     Get command to call backend as a list of two strings
 
     Args:
-        file_name (str): The name of the file.
-        cores (int, optional): Number of cores used to execute the task. Defaults to 1.
+        file_name_lst (list): The names of the files of the tasks, which are executed one after another.
+        cores (int, optional): Number of cores used to execute the tasks. Defaults to 1.
 
     Returns:
         list[str]: List of strings containing the python executable path and the backend script to execute
@@ -217,33 +504,18 @@ def _get_execute_command(file_name: str, cores: int = 1) -> list:
         command_lst = (
             ["mpiexec", "-n", str(cores)]
             + command_lst
-            + [get_command_path(executable="cache_parallel.py"), file_name]
+            + [get_command_path(executable="cache_parallel.py")]
+            + file_name_lst
         )
     elif cores > 1:
         raise ImportError(
             "mpi4py is required for parallel calculations. Please install mpi4py."
         )
     else:
-        command_lst += [get_command_path(executable="cache_serial.py"), file_name]
+        command_lst += [get_command_path(executable="cache_serial.py")] + file_name_lst
     return command_lst
 
 
-def _get_hash(binary: bytes) -> str:
-    """
-    Get the hash of a binary.
-
-    Args:
-        binary (bytes): The binary to be hashed.
-
-    Returns:
-        str: The hash of the binary.
-
-    """
-    # Remove specification of jupyter kernel from hash to be deterministic
-    binary_no_ipykernel = re.sub(b"(?<=/ipykernel_)(.*)(?=/)", b"", binary)
-    return str(hashlib.md5(binary_no_ipykernel).hexdigest())
-
-
 def _serialize_funct_h5(fn: callable, *args: Any, **kwargs: Any) -> Tuple[str, dict]:
     """
     Serialize a function and its arguments and keyword arguments into an HDF5 file.
@@ -257,29 +529,52 @@ def _serialize_funct_h5(fn: callable, *args: Any, **kwargs: Any) -> Tuple[str, d
         Tuple[str, dict]: A tuple containing the task key and the serialized data.
 
     """
-    binary_all = cloudpickle.dumps({"fn": fn, "args": args, "kwargs": kwargs})
-    task_key = fn.__name__ + _get_hash(binary=binary_all)
     data = {"fn": fn, "args": args, "kwargs": kwargs}
+    task_key = fn.__name__ + get_hash(obj=data)
     return task_key, data
 
 
 def _check_task_output(
-    task_key: str, future_obj: Future, cache_directory: str
+    task_key: str,
+    future_obj: Future,
+    cache_directory: str,
+    process: Optional[Any] = None,
 ) -> Future:
     """
-    Check the output of a task and set the result of the future object if available.
+    Check the output of a task and set the result of the future object if available. When the process executing the
+    task terminated with a non-zero return code without writing an output file, the future object is set to an error.
+    Tasks executed by persistent workers store their exception in a file with the suffix .h5err instead.
 
     Args:
         task_key (str): The key of the task.
         future_obj (Future): The future object associated with the task.
         cache_directory (str): The directory where the HDF5 files are stored.
+        process (subprocess.Popen, optional): The process executing the task. Defaults to None.
 
     Returns:
         Future: The updated future object.
 
     """
     file_name = os.path.join(cache_directory, task_key + ".h5out")
-    if not os.path.exists(file_name):
+    file_name_error = os.path.join(cache_directory, task_key + ".h5err")
+    if not os.path.exists(file_name) and os.path.exists(file_name_error):
+        future_obj.set_exception(get_error(file_name=file_name_error))
+        return future_obj
+    elif not os.path.exists(file_name):
+        if (
+            process is not None
+            and hasattr(process, "poll")
+            and process.poll() not in [None, 0]
+        ):
+            future_obj.set_exception(
+                RuntimeError(
+                    "The task "
+                    + task_key
+                    + " failed with return code "
+                    + str(process.poll())
+                    + " without writing an output file."
+                )
+            )
         return future_obj
     exec_flag, result = get_output(file_name=file_name)
     if exec_flag:
@@ -287,6 +582,221 @@ def _check_task_output(
     return future_obj
 
 
+def _launch_ready_tasks(
+    waiting_dict: dict,
+    memory_dict: dict,
+    process_dict: dict,
+    execute_function: callable,
+    cache_directory: str,
+    scheduler: ResourceScheduler,
+    bundle_size: int = 1,
+    flush: bool = True,
+    worker_pool: Optional[Any] = None,
+) -> dict:
+    """
+    Submit the waiting tasks whose dependencies are finished to the scheduler, which launches them once the cores are
+    available. Ready tasks with the same number of cores are bundled, up to bundle_size tasks are executed one after
+    another by a single process. Incomplete bundles are only launched when flush is True. When a dependency failed,
+    the task is not launched and its future object is set to the exception of the dependency, or cancelled when the
+    dependency was cancelled.
+
+    Args:
+        waiting_dict (dict): The dictionary mapping the keys of the waiting tasks to dictionaries with the number of
+            cores and the dependencies, which map the task keys of the dependencies to their future objects.
+        memory_dict (dict): The dictionary mapping task keys to the future objects of the pending tasks.
+        process_dict (dict): The dictionary mapping task keys to the handles returned by the execute function.
+        execute_function (callable): The function to execute the tasks.
+        cache_directory (str): The directory to store the HDF5 files.
+        scheduler (ResourceScheduler): The scheduler which limits the number of cores used by the running tasks.
+        bundle_size (int, optional): The maximum number of tasks executed by a single process. Defaults to 1.
+        flush (bool, optional): Launch incomplete bundles, otherwise the tasks wait for further ready tasks. Defaults
+            to True.
+        worker_pool (CacheWorkerPool, optional): The pool of persistent worker processes for the tasks with a single
+            core. Defaults to None.
+
+    Returns:
+        dict: The tasks which are still waiting for their dependencies or for further tasks to complete a bundle.
+    """
+    waiting_next_dict, ready_dict = {}, {}
+    for task_key, task_wait_dict in waiting_dict.items():
+        future_lst = list(task_wait_dict["dependency_dict"].values())
+        if not all(future.done() for future in future_lst):
+            waiting_next_dict[task_key] = task_wait_dict
+        elif any(future.cancelled() for future in future_lst):
+            memory_dict[task_key].cancel()
+        elif any(future.exception() is not None for future in future_lst):
+            memory_dict[task_key].set_exception(
+                next(
+                    future.exception()
+                    for future in future_lst
+                    if future.exception() is not None
+                )
+            )
+        else:
+            ready_dict.setdefault(task_wait_dict["cores"], []).append(task_key)
+    for cores, task_key_lst in ready_dict.items():
+        for i in range(0, len(task_key_lst), bundle_size):
+            bundle_key_lst = task_key_lst[i : i + bundle_size]
+            if len(bundle_key_lst) < bundle_size and not flush:
+                waiting_next_dict.update({k: waiting_dict[k] for k in bundle_key_lst})
+                continue
+            future_dict = {k: memory_dict[k] for k in bundle_key_lst}
+            scheduler.submit(
+                future=_get_bundle_future(future_lst=list(future_dict.values())),
+                start_function=partial(
+                    _execute_bundle,
+                    future_dict=future_dict,
+                    process_dict=process_dict,
+                    execute_function=execute_function,
+                    cache_directory=cache_directory,
+                    cores=cores,
+                    task_dependent_lst=[
+                        process_dict[k]
+                        for task_key in bundle_key_lst
+                        for k in waiting_dict[task_key]["dependency_dict"].keys()
+                        if process_dict[k] is not None
+                    ],
+                    worker_pool=worker_pool if cores == 1 else None,
+                ),
+                cores=cores,
+            )
+    return waiting_next_dict
+
+
+def _execute_bundle(
+    future_dict: dict,
+    process_dict: dict,
+    execute_function: callable,
+    cache_directory: str,
+    cores: int,
+    task_dependent_lst: list,
+    worker_pool: Optional[Any] = None,
+) -> Any:
+    """
+    Start a bundle of tasks once the scheduler assigned the cores to it. The future objects are marked as running, so
+    the tasks can no longer be cancelled and the cores are only released when all tasks of the bundle are finished.
+    Tasks which were cancelled while waiting for the cores are removed from the bundle.
+
+    Args:
+        future_dict (dict): The dictionary mapping the keys of the tasks in the bundle to their future objects.
+        process_dict (dict): The dictionary mapping task keys to the handles returned by the execute function.
+        execute_function (callable): The function to execute the tasks.
+        cache_directory (str): The directory to store the HDF5 files.
+        cores (int): The number of cores used to execute the tasks.
+        task_dependent_lst (list): The handles of the tasks the bundle depends on.
+        worker_pool (CacheWorkerPool, optional): The pool of persistent worker processes to execute the tasks instead
+            of the execute function. Defaults to None.
+
+    Returns:
+        Any: The handle returned by the execute function, None if all tasks of the bundle were cancelled or if they
+            are executed by the worker pool.
+    """
+    task_key_lst = [
+        task_key
+        for task_key, future_obj in future_dict.items()
+        if future_obj.set_running_or_notify_cancel()
+    ]
+    if len(task_key_lst) == 0:
+        return None
+    file_name_lst = [
+        os.path.join(cache_directory, task_key + ".h5in") for task_key in task_key_lst
+    ]
+    if worker_pool is not None:
+        worker_pool.submit(file_name_lst=file_name_lst)
+        process = None
+    else:
+        # The exception of a previous execution of the same task is removed
+        for task_key in task_key_lst:
+            file_name_error = os.path.join(cache_directory, task_key + ".h5err")
+            if os.path.exists(file_name_error):
+                os.remove(file_name_error)
+        process = execute_function(
+            command=_get_execute_command(file_name_lst=file_name_lst, cores=cores),
+            task_dependent_lst=task_dependent_lst,
+        )
+    for task_key in task_key_lst:
+        process_dict[task_key] = process
+    return process
+
+
+def _get_bundle_future(future_lst: list) -> Future:
+    """
+    Get a future object which is done once all future objects of a bundle of tasks are done.
+
+    Args:
+        future_lst (list): The future objects of the tasks in the bundle.
+
+    Returns:
+        Future: The future object of the bundle.
+    """
+    bundle_future = Future()
+    pending_set = set(future_lst)
+    for future_obj in future_lst:
+        future_obj.add_done_callback(
+            partial(
+                _release_bundle_future,
+                bundle_future=bundle_future,
+                pending_set=pending_set,
+            )
+        )
+    return bundle_future
+
+
+def _release_bundle_future(
+    future_obj: Future, bundle_future: Future, pending_set: set
+) -> None:
+    """
+    Callback for the future objects of a bundle of tasks, which completes the future object of the bundle once the
+    future objects of all tasks are done.
+
+    Args:
+        future_obj (Future): The completed future object of a task in the bundle.
+        bundle_future (Future): The future object of the bundle.
+        pending_set (set): The future objects of the tasks in the bundle which are not done yet.
+    """
+    pending_set.discard(future_obj)
+    if len(pending_set) == 0 and not bundle_future.done():
+        bundle_future.set_result(None)
+
+
+def _get_finished_task_keys(
+    task_key_lst: list, process_dict: dict, directory_watcher: "DirectoryWatcher"
+) -> list:
+    """
+    Get the keys of the tasks which might have finished, so only their output files have to be opened. Tasks with a
+    process handle are finished once the process terminated or, as a bundle of tasks is executed by a single process,
+    once the directory watcher reports their output file. For the remaining tasks the directory watcher reports the
+    completed output files, or when no directory watcher is available or its rescan interval passed all of them have
+    to be checked.
+
+    Args:
+        task_key_lst (list): The keys of the pending tasks.
+        process_dict (dict): The dictionary mapping task keys to the handles returned by the execute function.
+        directory_watcher (DirectoryWatcher): The watcher for the cache directory.
+
+    Returns:
+        list: The keys of the tasks which might have finished.
+    """
+    file_name_set = directory_watcher.read()
+    return [
+        key
+        for key in task_key_lst
+        if (
+            file_name_set is not None
+            and (key + ".h5out" in file_name_set or key + ".h5err" in file_name_set)
+        )
+        or (
+            key in process_dict.keys()
+            and hasattr(process_dict[key], "poll")
+            and process_dict[key].poll() is not None
+        )
+        or (
+            not (key in process_dict.keys() and hasattr(process_dict[key], "poll"))
+            and file_name_set is None
+        )
+    ]
+
+
 def _convert_args_and_kwargs(
     task_dict: dict, memory_dict: dict, file_name_dict: dict
 ) -> Tuple[list, dict, list]:
@@ -0,0 +1,542 @@
+import mmap
+import os
+import sqlite3
+import struct
+import threading
+from typing import Optional, Tuple
+
+import cloudpickle
+
+from executorlib.cache import hdf
+from executorlib.cache.hdf import group_dict
+from executorlib.shared.compression import dumps, is_compressed, loads
+
+# Each file starts with a signature identifying its storage backend, so the backend is detected when the file is read.
+_hdf5_signature = b"\x89HDF\r\n\x1a\n"
+_pickle_signature = b"EXLIBPKL"
+_sqlite_signature = b"EXLIBSQL"
+
+# Every record of a pickle file starts with the length of its name, the length of the pickle stream and the number of
+# out-of-band buffers, followed by the name, the length of each buffer, the pickle stream and the aligned buffers.
+_record_header = struct.Struct("<HQI")
+_buffer_header = struct.Struct("<Q")
+_buffer_alignment = 64
+
+# The connections to the sqlite databases are reused by all storage objects of the same thread.
+_connection_local = threading.local()
+
+
+class StorageBase:
+    """
+    Base class for the storage backends of the FileExecutor. A storage backend writes the function, the arguments and
+    the output of a task to a file in the cache directory. The suffix of the file name identifies the stage of the task
+    - .h5in for submitted tasks, .h5ready while the output is written, .h5out for completed tasks and .h5err for failed
+    tasks - independent of the storage backend, as the file is renamed between the stages.
+    """
+
+    def dump(
+        self, file_name: str, data_dict: dict, compression: Optional[str] = None
+    ) -> None:
+        """
+        Dump data dictionary into a file, the entries are added to the existing entries of the file.
+
+        Args:
+            file_name (str): file name as absolute path
+            data_dict (dict): dictionary containing the python function to be executed {"fn": ..., "args": (), "kwargs": {}}
+            compression (str): compress entries larger than 1MB with the codec "zlib", "lz4" or "zstd" - default is None
+        """
+        raise NotImplementedError
+
+    def load(self, file_name: str, mmap_mode: Optional[str] = None) -> dict:
+        """
+        Load data dictionary from a file
+
+        Args:
+            file_name (str): file name as absolute path
+            mmap_mode (str): if "r", numpy arrays are returned as read-only memory-mapped arrays when the storage
+                             backend supports it - default is None
+
+        Returns:
+            dict: dictionary containing the python function to be executed {"fn": ..., "args": (), "kwargs": {}}
+        """
+        raise NotImplementedError
+
+    def get_output(
+        self, file_name: str, mmap_mode: Optional[str] = None, lazy: bool = False
+    ) -> Tuple[bool, object]:
+        """
+        Check if output is available in the file
+
+        Args:
+            file_name (str): file name as absolute path
+            mmap_mode (str): if "r", numpy arrays are returned as read-only memory-mapped arrays when the storage
+                             backend supports it - default is None
+            lazy (bool): return proxies which only read the data when it is accessed, when the storage backend supports
+                         it - default is False
+
+        Returns:
+            Tuple[bool, object]: boolean flag indicating if output is available and the output object itself
+        """
+        raise NotImplementedError
+
+    def get_error(self, file_name: str) -> Optional[BaseException]:
+        """
+        Get the exception of a failed task from the file
+
+        Args:
+            file_name (str): file name as absolute path
+
+        Returns:
+            BaseException: exception raised by the task or None if the file does not contain an exception
+        """
+        raise NotImplementedError
+
+    def remove(self, file_name: str) -> None:
+        """
+        Remove the file of a task including all data stored for it.
+
+        Args:
+            file_name (str): file name as absolute path
+        """
+        os.remove(file_name)
+
+
+class HDF5Storage(StorageBase):
+    """
+    Store each task in an HDF5 file, numpy arrays are stored as native HDF5 datasets. The files remain readable with
+    h5io and support lazy loading of the arguments and outputs.
+    """
+
+    def dump(
+        self, file_name: str, data_dict: dict, compression: Optional[str] = None
+    ) -> None:
+        hdf.dump(file_name=file_name, data_dict=data_dict, compression=compression)
+
+    def load(self, file_name: str, mmap_mode: Optional[str] = None) -> dict:
+        return hdf.load(file_name=file_name, mmap_mode=mmap_mode)
+
+    def get_output(
+        self, file_name: str, mmap_mode: Optional[str] = None, lazy: bool = False
+    ) -> Tuple[bool, object]:
+        return hdf.get_output(file_name=file_name, mmap_mode=mmap_mode, lazy=lazy)
+
+    def get_error(self, file_name: str) -> Optional[BaseException]:
+        return hdf.get_error(file_name=file_name)
+
+
+class PickleStorage(StorageBase):
+    """
+    Store each task in a file of records serialized with pickle protocol 5. The large buffers of numpy arrays are not
+    copied into the pickle stream but stored out-of-band, aligned to 64 bytes, after the stream of their record. So
+    loading memory-maps the file and the numpy arrays reference the buffers directly rather than being copied, and new
+    entries are appended to the file without rewriting the existing ones. With compression the objects are stored as
+    compressed pickle streams without out-of-band buffers.
+    """
+
+    def dump(
+        self, file_name: str, data_dict: dict, compression: Optional[str] = None
+    ) -> None:
+        with open(file_name, "ab") as f:
+            if f.tell() == 0:
+                f.write(_pickle_signature)
+            for data_key, data_value in data_dict.items():
+                if data_key in group_dict.keys():
+                    _write_record(
+                        f=f,
+                        name=group_dict[data_key],
+                        value=data_value,
+                        compression=compression,
+                    )
+
+    def load(self, file_name: str, mmap_mode: Optional[str] = None) -> dict:
+        return _get_data_dict(
+            record_dict=_read_records(file_name=file_name),
+            mmap_mode=mmap_mode,
+        )
+
+    def get_output(
+        self, file_name: str, mmap_mode: Optional[str] = None, lazy: bool = False
+    ) -> Tuple[bool, object]:
+        record_dict = _read_records(file_name=file_name)
+        if "output" in record_dict.keys():
+            return True, _read_record(
+                record=record_dict["output"],
+                mmap_mode="r" if lazy and mmap_mode is None else mmap_mode,
+            )
+        else:
+            return False, None
+
+    def get_error(self, file_name: str) -> Optional[BaseException]:
+        record_dict = _read_records(file_name=file_name)
+        if "error" in record_dict.keys():
+            return _read_record(record=record_dict["error"])
+        else:
+            return None
+
+
+class SqliteStorage(StorageBase):
+    """
+    Store the tasks as rows of a single sqlite database, so millions of small results do not require millions of
+    files to be opened. As the executor tracks the stage of each task by renaming its file, a small file referencing
+    the database remains in the cache directory for each task, while the objects are stored in the database as
+    cloudpickle streams. The size limit of the cache directory only accounts for these files, not for the database.
+
+    Args:
+        database (str): file name of the sqlite database as absolute path
+    """
+
+    def __init__(self, database: str):
+        self._database = database
+
+    def dump(
+        self, file_name: str, data_dict: dict, compression: Optional[str] = None
+    ) -> None:
+        task_key = _get_task_key(file_name=file_name)
+        connection = _get_connection(database=self._database)
+        with connection:
+            connection.executemany(
+                "INSERT OR REPLACE INTO record (task_key, name, data) VALUES (?, ?, ?)",
+                [
+                    (
+                        task_key,
+                        group_dict[data_key],
+                        dumps(obj=data_value, compression=compression),
+                    )
+                    for data_key, data_value in data_dict.items()
+                    if data_key in group_dict.keys()
+                ],
+            )
+        if not os.path.exists(file_name):
+            with open(file_name, "wb") as f:
+                f.write(_sqlite_signature + self._database.encode())
+
+    def load(self, file_name: str, mmap_mode: Optional[str] = None) -> dict:
+        connection = _get_connection(database=self._database)
+        return _get_data_dict(
+            record_dict={
+                name: data
+                for name, data in connection.execute(
+                    "SELECT name, data FROM record WHERE task_key = ?",
+                    (_get_task_key(file_name=file_name),),
+                )
+            }
+        )
+
+    def get_output(
+        self, file_name: str, mmap_mode: Optional[str] = None, lazy: bool = False
+    ) -> Tuple[bool, object]:
+        data = self._get_record(file_name=file_name, name="output")
+        if data is not None:
+            return True, loads(data=data)
+        else:
+            return False, None
+
+    def get_error(self, file_name: str) -> Optional[BaseException]:
+        data = self._get_record(file_name=file_name, name="error")
+        if data is not None:
+            return loads(data=data)
+        else:
+            return None
+
+    def remove(self, file_name: str) -> None:
+        connection = _get_connection(database=self._database)
+        with connection:
+            connection.execute(
+                "DELETE FROM record WHERE task_key = ?",
+                (_get_task_key(file_name=file_name),),
+            )
+        os.remove(file_name)
+
+    def _get_record(self, file_name: str, name: str) -> Optional[bytes]:
+        """
+        Get a single serialized object of a task from the database.
+
+        Args:
+            file_name (str): file name of the task as absolute path
+            name (str): name of the object, for example "output"
+
+        Returns:
+            bytes: serialized object, None if it is not stored in the database
+        """
+        row = (
+            _get_connection(database=self._database)
+            .execute(
+                "SELECT data FROM record WHERE task_key = ? AND name = ?",
+                (_get_task_key(file_name=file_name), name),
+            )
+            .fetchone()
+        )
+        return row[0] if row is not None else None
+
+
+def create_storage(storage: str, cache_directory: str) -> StorageBase:
+    """
+    Create the storage backend for new tasks.
+
+    Args:
+        storage (str): name of the storage backend, either "hdf5", "pickle" or "sqlite"
+        cache_directory (str): directory to store the files, the sqlite database is stored as storage.sqlite in it
+
+    Returns:
+        StorageBase: storage backend
+    """
+    if storage == "hdf5":
+        return HDF5Storage()
+    elif storage == "pickle":
+        return PickleStorage()
+    elif storage == "sqlite":
+        return SqliteStorage(database=os.path.join(cache_directory, "storage.sqlite"))
+    else:
+        raise ValueError(
+            "The storage backend "
+            + str(storage)
+            + " is not supported, choose one of ['hdf5', 'pickle', 'sqlite']."
+        )
+
+
+def get_storage(file_name: str) -> StorageBase:
+    """
+    Get the storage backend of an existing file from its signature.
+
+    Args:
+        file_name (str): file name as absolute path
+
+    Returns:
+        StorageBase: storage backend which wrote the file
+    """
+    with open(file_name, "rb") as f:
+        signature = f.read(len(_pickle_signature))
+        if signature == _pickle_signature:
+            return PickleStorage()
+        elif signature == _sqlite_signature:
+            return SqliteStorage(database=f.read().decode())
+        else:
+            return HDF5Storage()
+
+
+def dump(
+    file_name: str,
+    data_dict: dict,
+    compression: Optional[str] = None,
+    storage: Optional[StorageBase] = None,
+) -> None:
+    """
+    Dump data dictionary into a file. Existing files are extended with the storage backend which wrote them.
+
+    Args:
+        file_name (str): file name as absolute path
+        data_dict (dict): dictionary containing the python function to be executed {"fn": ..., "args": (), "kwargs": {}}
+        compression (str): compress entries larger than 1MB with the codec "zlib", "lz4" or "zstd" - default is None
+        storage (StorageBase): storage backend for new files - default is HDF5Storage
+    """
+    if os.path.exists(file_name):
+        storage = get_storage(file_name=file_name)
+    elif storage is None:
+        storage = HDF5Storage()
+    storage.dump(file_name=file_name, data_dict=data_dict, compression=compression)
+
+
+def load(file_name: str, mmap_mode: Optional[str] = None) -> dict:
+    """
+    Load data dictionary from a file written by any storage backend
+
+    Args:
+        file_name (str): file name as absolute path
+        mmap_mode (str): if "r", numpy arrays are returned as read-only memory-mapped arrays - default is None
+
+    Returns:
+        dict: dictionary containing the python function to be executed {"fn": ..., "args": (), "kwargs": {}}
+    """
+    return get_storage(file_name=file_name).load(
+        file_name=file_name, mmap_mode=mmap_mode
+    )
+
+
+def get_output(
+    file_name: str, mmap_mode: Optional[str] = None, lazy: bool = False
+) -> Tuple[bool, object]:
+    """
+    Check if output is available in a file written by any storage backend
+
+    Args:
+        file_name (str): file name as absolute path
+        mmap_mode (str): if "r", numpy arrays are returned as read-only memory-mapped arrays - default is None
+        lazy (bool): return proxies which only read the data when it is accessed - default is False
+
+    Returns:
+        Tuple[bool, object]: boolean flag indicating if output is available and the output object itself
+    """
+    return get_storage(file_name=file_name).get_output(
+        file_name=file_name, mmap_mode=mmap_mode, lazy=lazy
+    )
+
+
+def get_error(file_name: str) -> Optional[BaseException]:
+    """
+    Get the exception of a failed task from a file written by any storage backend
+
+    Args:
+        file_name (str): file name as absolute path
+
+    Returns:
+        BaseException: exception raised by the task or None if the file does not contain an exception
+    """
+    return get_storage(file_name=file_name).get_error(file_name=file_name)
+
+
+def remove(file_name: str) -> None:
+    """
+    Remove a file written by any storage backend including all data stored for it.
+
+    Args:
+        file_name (str): file name as absolute path
+    """
+    get_storage(file_name=file_name).remove(file_name=file_name)
+
+
+def _get_task_key(file_name: str) -> str:
+    return os.path.splitext(os.path.basename(file_name))[0]
+
+
+def _get_data_dict(record_dict: dict, mmap_mode: Optional[str] = None) -> dict:
+    """
+    Convert the serialized objects of a task to the data dictionary returned by load().
+
+    Args:
+        record_dict (dict): dictionary mapping the names of the objects to their serialized records
+        mmap_mode (str): if "r", numpy arrays are returned as read-only memory-mapped arrays - default is None
+
+    Returns:
+        dict: dictionary containing the python function to be executed {"fn": ..., "args": (), "kwargs": {}}
+    """
+    data_dict = {}
+    for data_key, default in [
+        ("fn", None),
+        ("args", ()),
+        ("kwargs", {}),
+        ("compression", None),
+        ("lazy", None),
+        ("reduce", None),
+    ]:
+        if group_dict[data_key] in record_dict.keys():
+            data_dict[data_key] = _read_record(
+                record=record_dict[group_dict[data_key]], mmap_mode=mmap_mode
+            )
+        elif data_key == "fn":
+            raise TypeError("Function not found in file.")
+        elif default is not None:
+            data_dict[data_key] = default
+    return data_dict
+
+
+def _write_record(f, name: str, value: object, compression: Optional[str] = None):
+    """
+    Append a record to a pickle file. Without compression, the buffers of numpy arrays are stored out-of-band.
+
+    Args:
+        f (file): pickle file opened for appending
+        name (str): name of the record
+        value (object): python object to store
+        compression (str): compression codec "zlib", "lz4" or "zstd" - default is None
+    """
+    buffer_lst = []
+    if compression is None:
+        data = cloudpickle.dumps(value, protocol=5, buffer_callback=buffer_lst.append)
+        buffer_lst = [buffer.raw() for buffer in buffer_lst]
+    else:
+        data = dumps(obj=value, compression=compression)
+    name_bytes = name.encode()
+    f.write(_record_header.pack(len(name_bytes), len(data), len(buffer_lst)))
+    f.write(name_bytes)
+    for buffer in buffer_lst:
+        f.write(_buffer_header.pack(buffer.nbytes))
+    f.write(data)
+    for buffer in buffer_lst:
+        f.write(b"\0" * (-f.tell() % _buffer_alignment))
+        f.write(buffer)
+
+
+def _read_records(file_name: str) -> dict:
+    """
+    Memory-map a pickle file and get the location of its records without deserializing them.
+
+    Args:
+        file_name (str): file name as absolute path
+
+    Returns:
+        dict: dictionary mapping the names of the records to tuples of the pickle stream and the list of buffers, as
+              memoryview objects of the memory-mapped file. Records which were appended later replace earlier ones.
+    """
+    with open(file_name, "rb") as f:
+        data = memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+    record_dict = {}
+    offset = len(_pickle_signature)
+    while offset < len(data):
+        name_length, data_length, buffer_count = _record_header.unpack_from(
+            data, offset
+        )
+        offset += _record_header.size
+        name = bytes(data[offset : offset + name_length]).decode()
+        offset += name_length
+        buffer_length_lst = [
+            _buffer_header.unpack_from(data, offset + i * _buffer_header.size)[0]
+            for i in range(buffer_count)
+        ]
+        offset += buffer_count * _buffer_header.size
+        stream = data[offset : offset + data_length]
+        offset += data_length
+        buffer_lst = []
+        for buffer_length in buffer_length_lst:
+            offset += -offset % _buffer_alignment
+            buffer_lst.append(data[offset : offset + buffer_length])
+            offset += buffer_length
+        record_dict[name] = (stream, buffer_lst)
+    return record_dict
+
+
+def _read_record(record, mmap_mode: Optional[str] = None) -> object:
+    """
+    Deserialize a record of a pickle file or a row of the sqlite database.
+
+    Args:
+        record (tuple, bytes): tuple of the pickle stream and the list of buffers of a pickle file, or the serialized
+                               object stored in the sqlite database
+        mmap_mode (str): if "r", the numpy arrays reference the memory-mapped file, otherwise the buffers are copied
+                         into memory - default is None
+
+    Returns:
+        object: python object
+    """
+    if not isinstance(record, tuple):
+        return loads(data=record)
+    stream, buffer_lst = record
+    if is_compressed(data=stream):
+        return loads(data=stream)
+    if mmap_mode is None:
+        buffer_lst = [bytearray(buffer) for buffer in buffer_lst]
+    return cloudpickle.loads(stream, buffers=buffer_lst)
+
+
+def _get_connection(database: str) -> sqlite3.Connection:
+    """
+    Get the connection of the current thread to a sqlite database and create the table of records if it does not
+    exist yet. The write-ahead log allows the processes executing the tasks to write their outputs concurrently.
+
+    Args:
+        database (str): file name of the sqlite database as absolute path
+
+    Returns:
+        sqlite3.Connection: connection to the database
+    """
+    connection_dict = getattr(_connection_local, "connection_dict", None)
+    if connection_dict is None:
+        connection_dict = _connection_local.connection_dict = {}
+    if database not in connection_dict.keys():
+        connection = sqlite3.connect(database, timeout=60.0)
+        connection.execute("PRAGMA journal_mode=WAL")
+        with connection:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS record (task_key TEXT, name TEXT, data BLOB, PRIMARY KEY (task_key, name))"
+            )
+        connection_dict[database] = connection
+    return connection_dict[database]
@@ -0,0 +1,352 @@
+import os
+import shutil
+import sys
+import time
+import traceback
+from typing import Optional
+from uuid import uuid4
+
+try:  # file locks are only available on POSIX systems, other systems do not recover the tasks of crashed workers.
+    import fcntl
+except ImportError:
+    fcntl = None
+
+from executorlib.cache.shared import backend_write_error, execute_task_in_file
+from executorlib.shared.executor import get_command_path
+from executorlib.shared.interface import BaseInterface, MpiExecInterface
+
+# A task which terminated its worker process this many times is failed rather than queued again
+MAX_TASK_CRASHES = 3
+
+
+class CacheWorkerPool:
+    def __init__(
+        self,
+        cache_directory: str,
+        max_workers: int = 1,
+        interface_class: BaseInterface = MpiExecInterface,
+    ):
+        """
+        Initialize a CacheWorkerPool object, a pool of long-lived worker processes which execute the tasks stored in
+        the cache directory. Rather than starting a python process for each task, the HDF5 files of the tasks are moved
+        to the queue directory, from which the workers claim them by renaming them to their claim directory. So the
+        python interpreter is started and the modules are imported once per worker. The workers write the output of
+        each task to the cache directory and the exception of a failed task to a file with the suffix .h5err. When a
+        worker crashes, the tasks it claimed are moved back to the queue directory by the remaining workers, until a
+        task crashed MAX_TASK_CRASHES workers, then it fails with a RuntimeError.
+
+        Args:
+            cache_directory (str): The directory to store the HDF5 files.
+            max_workers (int, optional): The number of worker processes. Defaults to 1.
+            interface_class (BaseInterface, optional): The interface class to start the worker processes, for example
+                MpiExecInterface to start them locally or SrunInterface to start them with SLURM. Defaults to
+                MpiExecInterface.
+
+        """
+        self._cache_directory = cache_directory
+        self._queue_directory = os.path.join(cache_directory, "queue")
+        os.makedirs(self._queue_directory, exist_ok=True)
+        self._interface_class = interface_class
+        self._pool_id = uuid4().hex
+        self._worker_count = 0
+        self._worker_dict = {}
+        for _ in range(max_workers):
+            self._start_worker()
+
+    def submit(self, file_name_lst: list) -> None:
+        """
+        Move the HDF5 files of the tasks to the queue directory, so they are executed by the workers.
+
+        Args:
+            file_name_lst (list): The file names of the HDF5 files as absolute paths.
+
+        """
+        for file_name in file_name_lst:
+            task_key = os.path.splitext(os.path.basename(file_name))[0]
+            file_name_error = os.path.join(self._cache_directory, task_key + ".h5err")
+            if os.path.exists(file_name_error):
+                os.remove(file_name_error)
+            _remove_crash_count(
+                queue_directory=self._queue_directory, task_key=task_key
+            )
+            os.rename(
+                file_name, os.path.join(self._queue_directory, task_key + ".h5in")
+            )
+
+    def check(self) -> None:
+        """
+        Replace the worker processes which terminated unexpectedly.
+        """
+        for worker_id in [
+            worker_id
+            for worker_id, interface in self._worker_dict.items()
+            if not interface.poll()
+        ]:
+            del self._worker_dict[worker_id]
+            self._start_worker()
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Stop the worker processes once all tasks in the queue directory are executed.
+
+        Args:
+            wait (bool, optional): Wait for the worker processes to finish. Defaults to True.
+
+        """
+        for worker_id in self._worker_dict.keys():
+            with open(os.path.join(self._queue_directory, worker_id + ".stop"), "w"):
+                pass
+        if wait:
+            for interface in self._worker_dict.values():
+                interface.shutdown(wait=True)
+        self._worker_dict = {}
+
+    def _start_worker(self) -> None:
+        """
+        Start a new worker process.
+        """
+        worker_id = self._pool_id + "_" + str(self._worker_count)
+        self._worker_count += 1
+        interface = self._interface_class(cores=1)
+        interface.bootup(
+            command_lst=[
+                sys.executable,
+                get_command_path(executable="cache_worker.py"),
+                self._queue_directory,
+                worker_id,
+            ]
+        )
+        self._worker_dict[worker_id] = interface
+
+
+def execute_tasks_from_queue(
+    queue_directory: str,
+    worker_id: str,
+    refresh_rate_min: float = 0.01,
+    refresh_rate_max: float = 0.1,
+) -> None:
+    """
+    Execute the tasks in the queue directory until the stop file of the worker is created and the queue is empty. The
+    tasks are claimed by renaming their HDF5 files to the claim directory of the worker, so each task is executed by a
+    single worker. The claim directory is locked while the worker is alive, so the tasks of crashed workers are moved
+    back to the queue directory by the remaining workers.
+
+    Args:
+        queue_directory (str): The directory containing the HDF5 files of the queued tasks.
+        worker_id (str): The unique identifier of the worker.
+        refresh_rate_min (float, optional): The minimum interval in seconds to check for new tasks. Defaults to 0.01.
+        refresh_rate_max (float, optional): The maximum interval in seconds to check for new tasks. Defaults to 0.1.
+
+    """
+    cache_directory = os.path.dirname(queue_directory)
+    stop_file_name = os.path.join(queue_directory, worker_id + ".stop")
+    claim_directory, lock_file = _create_claim_directory(
+        queue_directory=queue_directory, worker_id=worker_id
+    )
+    refresh_rate = refresh_rate_min
+    while True:
+        file_name = _claim_task(
+            queue_directory=queue_directory, claim_directory=claim_directory
+        )
+        if file_name is not None:
+            _execute_claimed_task(file_name=file_name, cache_directory=cache_directory)
+            refresh_rate = refresh_rate_min
+        elif os.path.exists(stop_file_name):
+            break
+        else:
+            _recover_claimed_tasks(
+                queue_directory=queue_directory, cache_directory=cache_directory
+            )
+            time.sleep(refresh_rate)
+            refresh_rate = min(2 * refresh_rate, refresh_rate_max)
+    os.remove(stop_file_name)
+    if lock_file is not None:
+        lock_file.close()
+    shutil.rmtree(claim_directory)
+
+
+def _create_claim_directory(queue_directory: str, worker_id: str) -> tuple:
+    """
+    Create the claim directory of a worker. The directory is locked before it is renamed to its final name, so the
+    other workers never mistake it for the claim directory of a crashed worker.
+
+    Args:
+        queue_directory (str): The directory containing the HDF5 files of the queued tasks.
+        worker_id (str): The unique identifier of the worker.
+
+    Returns:
+        tuple: The path of the claim directory and the open lock file, which is None if file locks are not available.
+    """
+    claim_directory = os.path.join(queue_directory, "worker_" + worker_id)
+    claim_directory_tmp = os.path.join(queue_directory, "tmp_" + worker_id)
+    os.makedirs(claim_directory_tmp)
+    lock_file = None
+    if fcntl is not None:
+        lock_file = open(os.path.join(claim_directory_tmp, "lock"), "w")
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+    os.rename(claim_directory_tmp, claim_directory)
+    return claim_directory, lock_file
+
+
+def _claim_task(queue_directory: str, claim_directory: str) -> Optional[str]:
+    """
+    Claim a queued task by renaming its HDF5 file to the claim directory. As renaming is atomic, a task which was
+    claimed by a different worker in the meantime is skipped.
+
+    Args:
+        queue_directory (str): The directory containing the HDF5 files of the queued tasks.
+        claim_directory (str): The claim directory of the worker.
+
+    Returns:
+        str: The file name of the claimed HDF5 file, None if the queue is empty.
+    """
+    for file_name in os.listdir(queue_directory):
+        if file_name.endswith(".h5in"):
+            file_name_claimed = os.path.join(claim_directory, file_name)
+            try:
+                os.rename(os.path.join(queue_directory, file_name), file_name_claimed)
+            except FileNotFoundError:
+                continue
+            return file_name_claimed
+    return None
+
+
+def _execute_claimed_task(file_name: str, cache_directory: str) -> None:
+    """
+    Execute a claimed task and move its output to the cache directory. When the task fails, the exception is stored
+    in a file with the suffix .h5err in the cache directory.
+
+    Args:
+        file_name (str): The file name of the claimed HDF5 file.
+        cache_directory (str): The directory to store the HDF5 files.
+
+    """
+    file_name_base = os.path.splitext(file_name)[0]
+    task_key = os.path.basename(file_name_base)
+    try:
+        execute_task_in_file(file_name=file_name)
+    except Exception as error:
+        traceback.print_exc()
+        _write_task_error(
+            file_name=file_name, cache_directory=cache_directory, error=error
+        )
+    else:
+        os.rename(
+            file_name_base + ".h5out",
+            os.path.join(cache_directory, task_key + ".h5out"),
+        )
+    _remove_crash_count(
+        queue_directory=os.path.dirname(os.path.dirname(file_name)), task_key=task_key
+    )
+
+
+def _write_task_error(file_name: str, cache_directory: str, error: Exception) -> None:
+    """
+    Store the exception of a failed task in a file with the suffix .h5err in the cache directory.
+
+    Args:
+        file_name (str): The file name of the claimed HDF5 file.
+        cache_directory (str): The directory to store the HDF5 files.
+        error (Exception): The exception raised by the task.
+
+    """
+    file_name_base = os.path.splitext(file_name)[0]
+    backend_write_error(file_name=file_name, error=error)
+    os.rename(
+        file_name_base + ".h5err",
+        os.path.join(cache_directory, os.path.basename(file_name_base) + ".h5err"),
+    )
+
+
+def _recover_claimed_tasks(queue_directory: str, cache_directory: str) -> None:
+    """
+    Move the tasks claimed by crashed workers back to the queue directory. The claim directory of a worker is locked
+    while the worker is alive, so the lock can only be acquired after the worker terminated. Output files which were
+    completed before the crash are moved to the cache directory. The crashes are counted for each task, so a task
+    which terminates every worker executing it, for example by a segmentation fault, fails with a RuntimeError after
+    MAX_TASK_CRASHES crashes rather than being queued again forever.
+
+    Args:
+        queue_directory (str): The directory containing the HDF5 files of the queued tasks.
+        cache_directory (str): The directory to store the HDF5 files.
+
+    """
+    if fcntl is None:
+        return
+    for directory_name in os.listdir(queue_directory):
+        claim_directory = os.path.join(queue_directory, directory_name)
+        if not directory_name.startswith("worker_"):
+            continue
+        try:
+            with open(os.path.join(claim_directory, "lock"), "a") as lock_file:
+                fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                for file_name in os.listdir(claim_directory):
+                    task_key, suffix = os.path.splitext(file_name)
+                    if suffix == ".h5out":
+                        os.rename(
+                            os.path.join(claim_directory, file_name),
+                            os.path.join(cache_directory, file_name),
+                        )
+                    elif suffix in [".h5in", ".h5ready"]:
+                        _recover_claimed_task(
+                            file_name=os.path.join(claim_directory, file_name),
+                            queue_directory=queue_directory,
+                            cache_directory=cache_directory,
+                        )
+                shutil.rmtree(claim_directory)
+        except (BlockingIOError, FileNotFoundError):
+            continue
+
+
+def _recover_claimed_task(
+    file_name: str, queue_directory: str, cache_directory: str
+) -> None:
+    """
+    Move a task claimed by a crashed worker back to the queue directory, or fail it with a RuntimeError when it
+    crashed MAX_TASK_CRASHES workers.
+
+    Args:
+        file_name (str): The file name of the claimed HDF5 file.
+        queue_directory (str): The directory containing the HDF5 files of the queued tasks.
+        cache_directory (str): The directory to store the HDF5 files.
+
+    """
+    task_key = os.path.splitext(os.path.basename(file_name))[0]
+    file_name_count = os.path.join(queue_directory, task_key + ".crashes")
+    try:
+        with open(file_name_count) as f:
+            crash_count = int(f.read()) + 1
+    except (FileNotFoundError, ValueError):
+        crash_count = 1
+    if crash_count >= MAX_TASK_CRASHES:
+        _write_task_error(
+            file_name=file_name,
+            cache_directory=cache_directory,
+            error=RuntimeError(
+                "The task "
+                + task_key
+                + " terminated the worker process "
+                + str(crash_count)
+                + " times without writing an output file."
+            ),
+        )
+        _remove_crash_count(queue_directory=queue_directory, task_key=task_key)
+    else:
+        with open(file_name_count, "w") as f:
+            f.write(str(crash_count))
+        os.rename(file_name, os.path.join(queue_directory, task_key + ".h5in"))
+
+
+def _remove_crash_count(queue_directory: str, task_key: str) -> None:
+    """
+    Remove the number of crashes of a task, once the task is completed or submitted again.
+
+    Args:
+        queue_directory (str): The directory containing the HDF5 files of the queued tasks.
+        task_key (str): The key of the task.
+
+    """
+    try:
+        os.remove(os.path.join(queue_directory, task_key + ".crashes"))
+    except FileNotFoundError:
+        pass
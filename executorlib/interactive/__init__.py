@@ -1,11 +1,13 @@
 import os
 import shutil
-from typing import Optional
+from typing import Optional, Union
 
 from executorlib.interactive.executor import (
     InteractiveExecutor,
     InteractiveStepExecutor,
 )
+from executorlib.shared.communication import SHARED_MEMORY_THRESHOLD
+from executorlib.shared.compression import check_compression
 from executorlib.shared.inputcheck import (
     check_command_line_argument_lst,
     check_executor,
@@ -14,6 +16,7 @@ from executorlib.shared.inputcheck import (
     check_nested_flux_executor,
     check_oversubscribe,
     check_pmi,
+    check_shared_memory_threshold,
     check_threads_per_core,
     validate_backend,
     validate_number_of_cores,
@@ -23,6 +26,7 @@ from executorlib.shared.interface import (
     MpiExecInterface,
     SrunInterface,
 )
+from executorlib.shared.memoize import get_result_cache
 
 try:  # The PyFluxExecutor requires flux-core to be installed.
     from executorlib.interactive.flux import FluxPythonInterface
@@ -54,6 +58,9 @@ def create_executor(
     command_line_argument_lst: list[str] = [],
     pmi: Optional[str] = None,
     nested_flux_executor: bool = False,
+    compression: Optional[str] = None,
+    cache: Union[bool, dict] = False,
+    shared_memory_threshold: Optional[int] = SHARED_MEMORY_THRESHOLD,
 ):
     """
     Instead of returning a executorlib.Executor object this function returns either a executorlib.mpi.PyMPIExecutor,
@@ -92,6 +99,13 @@ def create_executor(
         command_line_argument_lst (list): Additional command line arguments for the srun call (SLURM only)
         pmi (str): PMI interface to use (OpenMPI v5 requires pmix) default is None (Flux only)
         nested_flux_executor (bool): Provide hierarchically nested Flux job scheduler inside the submitted function.
+        compression (str): compress task messages and results larger than 1MB with the codec "zlib", "lz4" or "zstd"
+        cache (bool/dict): Reuse the results of repeated function calls with identical arguments. Either True to keep
+                           up to 1GB of results in memory or a dictionary with the keys "max_bytes" to limit the size
+                           in memory and "cache_directory" to additionally store the results on disk.
+        shared_memory_threshold (int): exchange task arguments and results larger than this number of bytes with
+                                       worker processes on the same node through files in /dev/shm, which are only
+                                       readable by the current user. None disables shared memory - default is 256kB
 
     """
     max_cores = validate_number_of_cores(max_cores=max_cores, max_workers=max_workers)
@@ -100,12 +114,17 @@ def create_executor(
         backend=backend, flux_installed=flux_installed, slurm_installed=slurm_installed
     )
     check_pmi(backend=backend, pmi=pmi)
+    check_compression(compression=compression)
+    check_shared_memory_threshold(shared_memory_threshold=shared_memory_threshold)
+    result_cache = get_result_cache(cache=cache)
     executor_kwargs = {
         "cores": cores_per_worker,
         "hostname_localhost": hostname_localhost,
         "cwd": cwd,
         "prefix_name": conda_environment_name,
         "prefix_path": conda_environment_path,
+        "compression": compression,
+        "shared_memory_threshold": shared_memory_threshold,
     }
     if backend == "flux":
         check_oversubscribe(oversubscribe=oversubscribe)
@@ -123,12 +142,14 @@ def create_executor(
                 max_workers=int(max_cores / cores_per_worker),
                 executor_kwargs=executor_kwargs,
                 interface_class=FluxPythonInterface,
+                result_cache=result_cache,
             )
         else:
             return InteractiveStepExecutor(
                 max_cores=max_cores,
                 executor_kwargs=executor_kwargs,
                 interface_class=FluxPythonInterface,
+                result_cache=result_cache,
             )
     elif backend == "slurm":
         check_executor(executor=executor)
@@ -143,12 +164,14 @@ def create_executor(
                 max_workers=int(max_cores / cores_per_worker),
                 executor_kwargs=executor_kwargs,
                 interface_class=SrunInterface,
+                result_cache=result_cache,
             )
         else:
             return InteractiveStepExecutor(
                 max_cores=max_cores,
                 executor_kwargs=executor_kwargs,
                 interface_class=SrunInterface,
+                result_cache=result_cache,
             )
     else:  # backend="local"
         check_threads_per_core(threads_per_core=threads_per_core)
@@ -165,10 +188,12 @@ def create_executor(
                 max_workers=int(max_cores / cores_per_worker),
                 executor_kwargs=executor_kwargs,
                 interface_class=MpiExecInterface,
+                result_cache=result_cache,
             )
         else:
             return InteractiveStepExecutor(
                 max_cores=max_cores,
                 executor_kwargs=executor_kwargs,
                 interface_class=MpiExecInterface,
+                result_cache=result_cache,
             )
@@ -1,12 +1,15 @@
 import inspect
 from typing import Optional
 
+from executorlib.shared.scatter import resolve_scatter_arguments
+
 
 def call_funct(
     input_dict: dict, funct: Optional[callable] = None, memory: Optional[dict] = None
 ) -> callable:
     """
-    Call function from dictionary
+    Call function from dictionary. For a chunk of function calls, marked by the key 'chunk', 'args' contains a list
+    with the positional arguments of each function call and the list of results is returned.
 
     Args:
         input_dict (dict): dictionary containing the function 'fn', its arguments 'args' and keyword arguments 'kwargs'
@@ -21,6 +24,7 @@ def call_funct(
         def funct(*args, **kwargs):
             return args[0].__call__(*args[1:], **kwargs)
 
+    input_dict = resolve_scatter_arguments(input_dict=input_dict)
     funct_args = inspect.getfullargspec(input_dict["fn"]).args
     if memory is not None:
         input_dict["kwargs"].update(
@@ -30,6 +34,11 @@ def call_funct(
                 keys_possible_lst=funct_args,
             )
         )
+    if "chunk" in input_dict.keys() and input_dict["chunk"]:
+        return [
+            funct(input_dict["fn"], *args, **input_dict["kwargs"])
+            for args in input_dict["args"]
+        ]
     return funct(input_dict["fn"], *input_dict["args"], **input_dict["kwargs"])
 
 
@@ -47,7 +56,10 @@ def parse_arguments(argument_lst: list[str]) -> dict:
         argument_lst=argument_lst,
         argument_dict={
             "zmqport": "--zmqport",
+            "zmqaddress": "--zmqaddress",
             "host": "--host",
+            "compression": "--compression",
+            "shared_memory_threshold": "--shared-memory-threshold",
         },
         default_dict={"host": "localhost"},
     )
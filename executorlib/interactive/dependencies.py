@@ -1,5 +1,5 @@
 from concurrent.futures import Future
-from typing import Any, Callable, Dict
+from typing import Any, Callable, Dict, Iterator, Optional
 
 from executorlib.interactive import create_executor
 from executorlib.shared.executor import ExecutorSteps, execute_tasks_with_dependencies
@@ -43,6 +43,7 @@ class ExecutorWithDependencies(ExecutorSteps):
                     "executor_queue": executor._future_queue,
                     "executor": executor,
                     "refresh_rate": refresh_rate,
+                    "result_cache": executor._result_cache,
                 },
             )
         )
@@ -92,6 +93,32 @@ class ExecutorWithDependencies(ExecutorSteps):
             self._task_hash_dict[task_hash] = task_dict
         return f
 
+    def map(
+        self,
+        fn: Callable[..., Any],
+        *iterables: Any,
+        timeout: Optional[float] = None,
+        chunksize: int = 1,
+    ) -> Iterator:
+        """
+        Returns an iterator equivalent to map(fn, iter). With chunksize larger than one, the function calls are
+        combined in chunks, which are communicated to the worker in a single message.
+
+        Args:
+            fn (callable): The function to be executed.
+            *iterables: Iterables of arguments for the function.
+            timeout (float, optional): Maximum number of seconds to wait for the results. Defaults to None.
+            chunksize (int, optional): Number of function calls combined in a single task. Defaults to 1.
+
+        Returns:
+            Iterator: An iterator over the results of the function calls.
+
+        """
+        if self._generate_dependency_graph:
+            # Each function call is represented as individual node in the dependency graph
+            chunksize = 1
+        return super().map(fn, *iterables, timeout=timeout, chunksize=chunksize)
+
     def __exit__(
         self,
         exc_type: Any,
@@ -1,3 +1,5 @@
+from typing import Optional
+
 from executorlib.shared.executor import (
     ExecutorBroker,
     ExecutorSteps,
@@ -5,6 +7,7 @@ from executorlib.shared.executor import (
     execute_separate_tasks,
 )
 from executorlib.shared.interface import BaseInterface, MpiExecInterface
+from executorlib.shared.memoize import ResultCache
 from executorlib.shared.thread import RaisingThread
 
 
@@ -20,6 +23,8 @@ class InteractiveExecutor(ExecutorBroker):
         max_workers (int): defines the number workers which can execute functions in parallel
         executor_kwargs (dict): keyword arguments for the executor
         interface_class (BaseInterface): interface class to initiate python processes
+        prefetch_depth (int): number of tasks sent to each worker before the first result is received - defaults to 1
+        result_cache (ResultCache): cache to resolve repeated function calls without executing them again
 
     Examples:
 
@@ -47,10 +52,13 @@ class InteractiveExecutor(ExecutorBroker):
         max_workers: int = 1,
         executor_kwargs: dict = {},
         interface_class: BaseInterface = MpiExecInterface,
+        prefetch_depth: int = 1,
+        result_cache: Optional[ResultCache] = None,
     ):
-        super().__init__()
+        super().__init__(result_cache=result_cache)
         executor_kwargs["future_queue"] = self._future_queue
         executor_kwargs["interface_class"] = interface_class
+        executor_kwargs["prefetch_depth"] = prefetch_depth
         self._set_process(
             process=[
                 RaisingThread(
@@ -74,6 +82,11 @@ class InteractiveStepExecutor(ExecutorSteps):
         max_cores (int): defines the number workers which can execute functions in parallel
         executor_kwargs (dict): keyword arguments for the executor
         interface_class (BaseInterface): interface class to initiate python processes
+        max_gpus (int): defines the number of GPUs which can be used in parallel - by default the GPUs are not limited
+        max_idle_workers (int): number of idle worker processes which are kept alive to execute following tasks with the
+                                same resource requirements - by default every task is executed in a new process
+        idle_timeout (float): number of seconds after which an idle worker process is shut down
+        result_cache (ResultCache): cache to resolve repeated function calls without executing them again
 
     Examples:
 
@@ -99,11 +112,18 @@ class InteractiveStepExecutor(ExecutorSteps):
         max_cores: int = 1,
         executor_kwargs: dict = {},
         interface_class: BaseInterface = MpiExecInterface,
+        max_gpus: Optional[int] = None,
+        max_idle_workers: int = 0,
+        idle_timeout: float = 60.0,
+        result_cache: Optional[ResultCache] = None,
     ):
-        super().__init__()
+        super().__init__(result_cache=result_cache)
         executor_kwargs["future_queue"] = self._future_queue
         executor_kwargs["interface_class"] = interface_class
         executor_kwargs["max_cores"] = max_cores
+        executor_kwargs["max_gpus"] = max_gpus
+        executor_kwargs["max_idle_workers"] = max_idle_workers
+        executor_kwargs["idle_timeout"] = idle_timeout
         self._set_process(
             RaisingThread(
                 target=execute_separate_tasks,
@@ -1,8 +1,60 @@
+import io
+import mmap
+import os
+import pickle
+import shutil
+import tempfile
 from socket import gethostname
-from typing import Optional
+from types import FunctionType
+from typing import Callable, Optional, Tuple
+from uuid import uuid4
 
 import cloudpickle
 import zmq
+from cloudpickle.cloudpickle import _should_pickle_by_reference
+
+from executorlib.shared.compression import (
+    COMPRESSION_THRESHOLD,
+    check_compression,
+    compress,
+    decompress,
+    get_codec_id,
+    is_compressed,
+)
+from executorlib.shared.interface import MpiExecInterface, SubprocessInterface
+
+# Large buffers are exchanged with worker processes on the same node through files in the shared memory file system.
+# The first frame of such a message starts with this header byte, which differs from the codec ids and the PROTO
+# opcode 0x80 of a pickle stream.
+SHARED_MEMORY_DIRECTORY = "/dev/shm"
+SHARED_MEMORY_THRESHOLD = 2**18
+_shared_memory_id = 0x10
+
+# Messages are serialized with the C implementation of pickle, unless they contain functions or classes which have to
+# be pickled by value, like lambda functions, functions defined in __main__ or in modules registered with
+# cloudpickle.register_pickle_by_value(). These messages are serialized with cloudpickle and start with this header
+# byte, while the messages serialized with pickle start with the PROTO opcode 0x80.
+_cloudpickle_id = 0x20
+
+
+class _PickleByValueError(Exception):
+    """
+    Raised by the _ReferencePickler for objects which have to be pickled by value.
+    """
+
+
+class _ReferencePickler(pickle.Pickler):
+    """
+    Pickler which only accepts functions and classes that can be pickled by reference, following the same rules as
+    cloudpickle, so the message can be deserialized by the receiver.
+    """
+
+    def reducer_override(self, obj):
+        if isinstance(obj, (FunctionType, type)) and not _should_pickle_by_reference(
+            obj
+        ):
+            raise _PickleByValueError()
+        return NotImplemented
 
 
 class SocketInterface:
@@ -11,19 +63,38 @@ class SocketInterface:
 
     Args:
         interface (executorlib.shared.interface.BaseInterface): Interface for starting the parallel process
+        compression (str): compression codec for large messages, either "zlib", "lz4" or "zstd". Default is None.
+        shared_memory_threshold (int): minimum size in bytes of the buffers which are sent through shared memory
+                                       rather than the socket, None disables shared memory. Default is None.
     """
 
-    def __init__(self, interface=None):
+    def __init__(
+        self,
+        interface=None,
+        compression: Optional[str] = None,
+        shared_memory_threshold: Optional[int] = None,
+    ):
         """
         Initialize the SocketInterface.
 
         Args:
             interface (executorlib.shared.interface.BaseInterface): Interface for starting the parallel process
+            compression (str): compression codec for large messages, either "zlib", "lz4" or "zstd". Default is None.
+            shared_memory_threshold (int): minimum size in bytes of the buffers which are sent through shared memory
+                                           rather than the socket, None disables shared memory. Default is None.
         """
-        self._context = zmq.Context()
-        self._socket = self._context.socket(zmq.PAIR)
+        # The attributes are set before the validation, as shutdown() is called by the destructor
+        self._compression = compression
+        self._shared_memory_threshold = shared_memory_threshold
+        self._shared_memory_lst = []
+        self._context = None
+        self._socket = None
+        self._ipc_directory = None
         self._process = None
         self._interface = interface
+        check_compression(compression=compression)
+        self._context = zmq.Context()
+        self._socket = self._context.socket(zmq.PAIR)
 
     def send_dict(self, input_dict: dict):
         """
@@ -33,7 +104,12 @@ class SocketInterface:
             input_dict (dict): dictionary of commands to be communicated. The key "shutdown" is reserved to stop the
                 connected client from listening.
         """
-        self._socket.send(cloudpickle.dumps(input_dict))
+        self._shared_memory_lst += _send_frames(
+            socket=self._socket,
+            data=input_dict,
+            compression=self._compression,
+            shared_memory_threshold=self._shared_memory_threshold,
+        )
 
     def receive_dict(self):
         """
@@ -42,12 +118,18 @@ class SocketInterface:
         Returns:
             dict: dictionary with response received from the connected client
         """
-        output = cloudpickle.loads(self._socket.recv())
-        if "result" in output.keys():
-            return output["result"]
-        else:
-            error_type = output["error_type"].split("'")[1]
-            raise eval(error_type)(output["error"])
+        return get_result_from_output(output=self._receive())
+
+    def receive_tagged_dict(self) -> Tuple[Optional[int], dict]:
+        """
+        Receive a dictionary from a connected client process, which is tagged with the id of the task it belongs to.
+        This is required when multiple tasks are sent to the client process before the first result is received.
+
+        Returns:
+            int, dict: task id and the dictionary with either the key "result" or the keys "error" and "error_type"
+        """
+        output = self._receive()
+        return output.pop("task_id", None), output
 
     def send_and_receive_dict(self, input_dict: dict) -> dict:
         """
@@ -73,6 +155,20 @@ class SocketInterface:
         """
         return self._socket.bind_to_random_port("tcp://*")
 
+    def bind_to_ipc(self) -> str:
+        """
+        Bind the SocketInterface instance to a unix domain socket in a private temporary directory, which is removed
+        on shutdown. Processes on the same node can connect to this address, which avoids the overhead of the TCP
+        loopback and does not occupy a port.
+
+        Returns:
+            str: address the SocketInterface instance is bound to.
+        """
+        self._ipc_directory = tempfile.mkdtemp(prefix="executorlib_")
+        address = "ipc://" + os.path.join(self._ipc_directory, "socket")
+        self._socket.bind(address)
+        return address
+
     def bootup(
         self,
         command_lst: list[str],
@@ -99,7 +195,7 @@ class SocketInterface:
             wait (bool): Whether to wait for the client process to finish before returning. Default is True.
         """
         result = None
-        if self._interface.poll():
+        if self._interface is not None and self._interface.poll():
             result = self.send_and_receive_dict(
                 input_dict={"shutdown": True, "wait": wait}
             )
@@ -108,11 +204,38 @@ class SocketInterface:
             self._socket.close()
         if self._context is not None:
             self._context.term()
+        if self._ipc_directory is not None:
+            shutil.rmtree(self._ipc_directory, ignore_errors=True)
+        # Remove the shared memory files which were never received, for example as the client process crashed
+        for file_name in self._shared_memory_lst:
+            try:
+                os.remove(file_name)
+            except FileNotFoundError:
+                pass
         self._process = None
         self._socket = None
         self._context = None
+        self._ipc_directory = None
+        self._shared_memory_lst = []
         return result
 
+    def _receive(self) -> dict:
+        """
+        Receive a dictionary from a connected client process. Each reply means the client received the preceding
+        messages, so the shared memory files it removed are no longer tracked.
+
+        Returns:
+            dict: received dictionary
+        """
+        output = _receive_frames(socket=self._socket)
+        if len(self._shared_memory_lst) > 0:
+            self._shared_memory_lst = [
+                file_name
+                for file_name in self._shared_memory_lst
+                if os.path.exists(file_name)
+            ]
+        return output
+
     def __del__(self):
         """
         Destructor for the SocketInterface class.
@@ -121,15 +244,35 @@ class SocketInterface:
         self.shutdown(wait=True)
 
 
+def get_result_from_output(output: dict):
+    """
+    Get the result from the dictionary received from a connected client process or raise the error it contains.
+
+    Args:
+        output (dict): dictionary with either the key "result" or the keys "error" and "error_type"
+
+    Returns:
+        object: result of the function call
+    """
+    if "result" in output.keys():
+        return output["result"]
+    else:
+        error_type = output["error_type"].split("'")[1]
+        raise eval(error_type)(output["error"])
+
+
 def interface_bootup(
     command_lst: list[str],
     connections,
     hostname_localhost: bool = False,
     prefix_name: Optional[str] = None,
     prefix_path: Optional[str] = None,
+    compression: Optional[str] = None,
+    shared_memory_threshold: Optional[int] = SHARED_MEMORY_THRESHOLD,
 ):
     """
-    Start interface for ZMQ communication
+    Start interface for ZMQ communication. Client processes on the same node connect through a unix domain socket,
+    while client processes started by SLURM or flux, which might run on a different node, connect through TCP.
 
     Args:
         command_lst (list): List of commands as strings
@@ -144,49 +287,99 @@ def interface_bootup(
                                       option to true
         prefix_name (str): name of the conda environment to initialize
         prefix_path (str): path of the conda environment to initialize
+        compression (str): compression codec for large messages in both directions, either "zlib", "lz4" or "zstd"
+        shared_memory_threshold (int): minimum size in bytes of the buffers which are exchanged through the shared
+                                       memory file system with client processes on the same node, None disables
+                                       shared memory
 
     Returns:
          executorlib.shared.communication.SocketInterface: socket interface for zmq communication
     """
-    if not hostname_localhost:
+    same_node = _is_same_node(connections=connections)
+    if (
+        shared_memory_threshold is not None
+        and same_node
+        and os.path.isdir(SHARED_MEMORY_DIRECTORY)
+    ):
+        # Large buffers are exchanged through shared memory in both directions, only their file names are sent
+        command_lst += [
+            "--shared-memory-threshold",
+            str(shared_memory_threshold),
+        ]
+    else:
+        shared_memory_threshold = None
+    if not hostname_localhost and not (same_node and zmq.has("ipc")):
         command_lst += [
             "--host",
             gethostname(),
         ]
-    interface = SocketInterface(interface=connections)
-    command_lst += [
-        "--zmqport",
-        str(interface.bind_to_random_port()),
-    ]
+    if compression is not None:
+        command_lst += [
+            "--compression",
+            compression,
+        ]
+    interface = SocketInterface(
+        interface=connections,
+        compression=compression,
+        shared_memory_threshold=shared_memory_threshold,
+    )
+    if same_node and zmq.has("ipc"):
+        command_lst += [
+            "--zmqaddress",
+            interface.bind_to_ipc(),
+        ]
+    else:
+        command_lst += [
+            "--zmqport",
+            str(interface.bind_to_random_port()),
+        ]
     interface.bootup(
         command_lst=command_lst, prefix_name=prefix_name, prefix_path=prefix_path
     )
     return interface
 
 
-def interface_connect(host: str, port: str):
+def interface_connect(host: str, port: Optional[str], address: Optional[str] = None):
     """
-    Connect to an existing SocketInterface instance by providing the hostname and the port as strings.
+    Connect to an existing SocketInterface instance by providing the hostname and the port as strings, or the address
+    of the unix domain socket it is bound to.
 
     Args:
         host (str): hostname of the host running the SocketInterface instance to connect to.
         port (str): port on the host the SocketInterface instance is running on.
+        address (str): address of the unix domain socket, which takes precedence over the hostname and the port.
     """
     context = zmq.Context()
     socket = context.socket(zmq.PAIR)
-    socket.connect("tcp://" + host + ":" + port)
+    if address is not None:
+        socket.connect(address)
+    else:
+        socket.connect("tcp://" + host + ":" + port)
     return context, socket
 
 
-def interface_send(socket: zmq.Socket, result_dict: dict):
+def interface_send(
+    socket: zmq.Socket,
+    result_dict: dict,
+    compression: Optional[str] = None,
+    shared_memory_threshold: Optional[int] = None,
+):
     """
     Send results to a SocketInterface instance.
 
     Args:
         socket (zmq.Socket): socket for the connection
         result_dict (dict): dictionary to be sent, supported keys are result, error and error_type.
+        compression (str): compression codec for large messages, either "zlib", "lz4" or "zstd". Default is None.
+        shared_memory_threshold (int): minimum size in bytes of the buffers which are sent through shared memory
+                                       rather than the socket, None disables shared memory. Default is None.
     """
-    socket.send(cloudpickle.dumps(result_dict))
+    _send_frames(
+        socket=socket,
+        data=result_dict,
+        compression=compression,
+        shared_memory_threshold=shared_memory_threshold,
+    )
 
 
 def interface_receive(socket: zmq.Socket):
@@ -196,7 +389,7 @@ def interface_receive(socket: zmq.Socket):
     Args:
         socket (zmq.Socket): socket for the connection
     """
-    return cloudpickle.loads(socket.recv())
+    return _receive_frames(socket=socket)
 
 
 def interface_shutdown(socket: zmq.Socket, context: zmq.Context):
@@ -209,3 +402,246 @@ def interface_shutdown(socket: zmq.Socket, context: zmq.Context):
     """
     socket.close()
     context.term()
+
+
+def _send_frames(
+    socket: zmq.Socket,
+    data: dict,
+    compression: Optional[str] = None,
+    threshold: int = COMPRESSION_THRESHOLD,
+    shared_memory_threshold: Optional[int] = None,
+) -> list:
+    """
+    Serialize a dictionary with pickle protocol 5, see _dumps(), and send it as zmq multipart message. Large contiguous
+    buffers, like the data of numpy arrays, are not copied into the pickle stream but are sent as separate frames
+    without copying. When a shared memory threshold is set, the buffers larger than the threshold are written to files
+    in the shared memory file system instead, and the message starts with an additional frame listing these files.
+    When the shared memory file system is full, the message is sent as socket frames. Otherwise, when a compression
+    codec is selected and the message is larger than the threshold, all frames are compressed and the first frame
+    starts with a header byte identifying the codec.
+
+    Args:
+        socket (zmq.Socket): socket for the connection
+        data (dict): dictionary to be sent
+        compression (str): name of the compression codec, either "zlib", "lz4" or "zstd". None disables compression.
+        threshold (int): minimum size of the message in bytes to be compressed
+        shared_memory_threshold (int): minimum size in bytes of the buffers which are sent through shared memory,
+                                       None disables shared memory.
+
+    Returns:
+        list: file names of the shared memory files, which are removed by the receiver
+    """
+    buffer_lst = []
+    data_bytes = _dumps(data=data, buffer_callback=buffer_lst.append)
+    frame_lst = [buffer.raw() for buffer in buffer_lst]
+    file_name_lst = None
+    if shared_memory_threshold is not None and any(
+        frame.nbytes >= shared_memory_threshold for frame in frame_lst
+    ):
+        file_name_lst = _write_shared_memory_frames(
+            frame_lst=frame_lst, shared_memory_threshold=shared_memory_threshold
+        )
+    if file_name_lst is not None:
+        socket.send(
+            bytes([_shared_memory_id]) + pickle.dumps(file_name_lst),
+            flags=zmq.SNDMORE,
+        )
+        frame_lst = [
+            frame
+            for frame, file_name in zip(frame_lst, file_name_lst)
+            if file_name is None
+        ]
+        socket.send(data_bytes, flags=zmq.SNDMORE if len(frame_lst) > 0 else 0)
+        if len(frame_lst) > 0:
+            socket.send_multipart(frame_lst, copy=False)
+        return [file_name for file_name in file_name_lst if file_name is not None]
+    if (
+        compression is not None
+        and len(data_bytes) + sum(frame.nbytes for frame in frame_lst) >= threshold
+    ):
+        data_bytes = bytes([get_codec_id(compression=compression)]) + compress(
+            data=data_bytes, compression=compression
+        )
+        frame_lst = [
+            compress(data=frame, compression=compression) for frame in frame_lst
+        ]
+    socket.send(data_bytes, flags=zmq.SNDMORE if len(frame_lst) > 0 else 0)
+    if len(frame_lst) > 0:
+        socket.send_multipart(frame_lst, copy=False)
+    return []
+
+
+def _receive_frames(socket: zmq.Socket) -> dict:
+    """
+    Receive a zmq multipart message and deserialize the dictionary it contains. The out-of-band buffers are used
+    directly, so numpy arrays are reconstructed from the memory of the received frames without copying them. Buffers
+    sent through shared memory are memory-mapped, so they are not copied either. Compressed messages are detected by
+    the header byte of the first frame and decompressed before deserialization.
+
+    Args:
+        socket (zmq.Socket): socket for the connection
+
+    Returns:
+        dict: received dictionary
+    """
+    data = socket.recv()
+    file_name_lst = None
+    if len(data) > 0 and data[0] == _shared_memory_id:
+        file_name_lst = pickle.loads(memoryview(data)[1:])
+        data = socket.recv()
+    buffer_lst = []
+    while socket.getsockopt(zmq.RCVMORE):
+        buffer_lst.append(socket.recv(copy=False).buffer)
+    if file_name_lst is not None:
+        buffer_iter = iter(buffer_lst)
+        buffer_lst = [
+            next(buffer_iter) if file_name is None else _read_shared_memory(file_name)
+            for file_name in file_name_lst
+        ]
+    if is_compressed(data=data):
+        codec_id = data[0]
+        data = decompress(data=memoryview(data)[1:], codec_id=codec_id)
+        # bytearray keeps the reconstructed numpy arrays writeable, like the uncompressed frames
+        buffer_lst = [
+            bytearray(decompress(data=buffer, codec_id=codec_id))
+            for buffer in buffer_lst
+        ]
+    return _loads(data=data, buffers=buffer_lst)
+
+
+def _dumps(data: dict, buffer_callback: Callable) -> bytes:
+    """
+    Serialize a dictionary with pickle protocol 5. The C implementation of pickle is used first, it falls back to
+    cloudpickle only when the dictionary contains objects which have to be pickled by value or which are not
+    supported by pickle. The messages serialized with cloudpickle start with a header byte.
+
+    Args:
+        data (dict): dictionary to be serialized
+        buffer_callback (callable): function called with the out-of-band buffers
+
+    Returns:
+        bytes: serialized dictionary
+    """
+    buffer_lst = []
+    f = io.BytesIO()
+    try:
+        _ReferencePickler(f, protocol=5, buffer_callback=buffer_lst.append).dump(data)
+    except (_PickleByValueError, pickle.PicklingError, TypeError, AttributeError):
+        f = io.BytesIO()
+        f.write(bytes([_cloudpickle_id]))
+        cloudpickle.Pickler(f, protocol=5, buffer_callback=buffer_callback).dump(data)
+    else:
+        for buffer in buffer_lst:
+            buffer_callback(buffer)
+    return f.getvalue()
+
+
+def _loads(data: bytes, buffers: list) -> dict:
+    """
+    Deserialize a dictionary serialized by _dumps(), using the header byte to identify the messages serialized with
+    cloudpickle.
+
+    Args:
+        data (bytes): serialized dictionary
+        buffers (list): out-of-band buffers
+
+    Returns:
+        dict: deserialized dictionary
+    """
+    if len(data) > 0 and data[0] == _cloudpickle_id:
+        return cloudpickle.loads(memoryview(data)[1:], buffers=buffers)
+    return pickle.loads(data, buffers=buffers)
+
+
+def _is_same_node(connections) -> bool:
+    """
+    Check if the interface starts the client process on the same node, which is the case for the local subprocess and
+    mpiexec interfaces, while SLURM and flux can start it on a different node of the allocation.
+
+    Args:
+        connections (executorlib.shared.interface.BaseInterface): Interface to start the client process
+
+    Returns:
+        bool: True if the client process runs on the same node
+    """
+    return isinstance(connections, MpiExecInterface) or (
+        type(connections) is SubprocessInterface
+    )
+
+
+def _write_shared_memory(data: memoryview) -> str:
+    """
+    Write a buffer to a new file in the shared memory file system, which is not backed by a disk.
+
+    Args:
+        data (memoryview): buffer to write
+
+    Returns:
+        str: file name of the shared memory file
+    """
+    file_name = os.path.join(SHARED_MEMORY_DIRECTORY, "executorlib_" + uuid4().hex)
+    # Only the current user can read the file, as the shared memory file system is shared by all users of the node
+    file_descriptor = os.open(file_name, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o600)
+    try:
+        with open(file_descriptor, "wb") as f:
+            f.write(data)
+    except OSError:
+        if os.path.exists(file_name):
+            os.remove(file_name)
+        raise
+    return file_name
+
+
+def _write_shared_memory_frames(
+    frame_lst: list, shared_memory_threshold: int
+) -> Optional[list]:
+    """
+    Write the frames larger than the threshold to files in the shared memory file system. When writing any of the
+    files fails, for example because the shared memory file system is full, the files which were already written for
+    this message are removed again.
+
+    Args:
+        frame_lst (list): buffers of the message
+        shared_memory_threshold (int): minimum size in bytes of the buffers which are written to shared memory
+
+    Returns:
+        list: file name of the shared memory file for each frame, None for the frames below the threshold. None if
+              writing the files failed.
+    """
+    file_name_lst = []
+    try:
+        for frame in frame_lst:
+            file_name_lst.append(
+                _write_shared_memory(data=frame)
+                if frame.nbytes >= shared_memory_threshold
+                else None
+            )
+    except OSError:
+        for file_name in file_name_lst:
+            if file_name is not None:
+                os.remove(file_name)
+        return None
+    return file_name_lst
+
+
+def _read_shared_memory(file_name: str) -> memoryview:
+    """
+    Memory-map a shared memory file and remove it. The memory remains mapped until the objects referencing the buffer
+    are garbage collected. Modifications are private to the receiving process, so the reconstructed numpy arrays are
+    writeable without copying the buffer first.
+
+    Args:
+        file_name (str): file name of the shared memory file
+
+    Returns:
+        memoryview: buffer of the memory-mapped file
+    """
+    with open(file_name, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        buffer = (
+            memoryview(mmap.mmap(f.fileno(), size, access=mmap.ACCESS_COPY))
+            if size > 0
+            else memoryview(bytearray())
+        )
+    os.remove(file_name)
+    return buffer
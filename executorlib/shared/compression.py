@@ -0,0 +1,157 @@
+import zlib
+from typing import Optional
+
+import cloudpickle
+
+try:
+    import lz4.frame as lz4_frame
+except ImportError:
+    lz4_frame = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+
+# Data smaller than the threshold in bytes is not compressed, as the compression would cost more than it saves.
+COMPRESSION_THRESHOLD = 2**20
+
+# Each compressed stream starts with a header byte identifying the codec. The header byte is always smaller than 0x80
+# so it cannot be confused with a pickle stream of protocol 2 or higher, which starts with the PROTO opcode 0x80.
+_codec_id_dict = {"zlib": 1, "lz4": 2, "zstd": 3}
+_codec_name_dict = {v: k for k, v in _codec_id_dict.items()}
+
+
+def check_compression(compression: Optional[str]) -> None:
+    """
+    Check if the compression codec is supported and the corresponding python package is installed.
+
+    Args:
+        compression (str): name of the compression codec, either "zlib", "lz4" or "zstd". None disables compression.
+    """
+    if compression is None:
+        return
+    if compression not in _codec_id_dict.keys():
+        raise ValueError(
+            "The compression codec "
+            + str(compression)
+            + " is not supported, choose one of "
+            + str(list(_codec_id_dict.keys()))
+            + "."
+        )
+    if compression == "lz4" and lz4_frame is None:
+        raise ImportError(
+            "The lz4 compression requires the lz4 package. Install it using: pip install lz4"
+        )
+    if compression == "zstd" and zstandard is None:
+        raise ImportError(
+            "The zstd compression requires the zstandard package. Install it using: pip install zstandard"
+        )
+
+
+def get_codec_id(compression: str) -> int:
+    """
+    Get the header byte for a given compression codec.
+
+    Args:
+        compression (str): name of the compression codec
+
+    Returns:
+        int: codec id stored in the header byte
+    """
+    return _codec_id_dict[compression]
+
+
+def is_compressed(data: bytes) -> bool:
+    """
+    Check if a stream starts with the header byte of a compression codec rather than a pickle PROTO opcode.
+
+    Args:
+        data (bytes): serialized stream
+
+    Returns:
+        bool: True if the stream is compressed
+    """
+    return len(data) > 0 and data[0] in _codec_name_dict.keys()
+
+
+def compress(data, compression: str) -> bytes:
+    """
+    Compress a bytes-like object with the selected codec. The result does not contain the header byte.
+
+    Args:
+        data (bytes-like): data to compress
+        compression (str): name of the compression codec
+
+    Returns:
+        bytes: compressed data
+    """
+    check_compression(compression=compression)
+    if compression == "zlib":
+        return zlib.compress(data, 1)
+    elif compression == "lz4":
+        return lz4_frame.compress(data)
+    else:
+        return zstandard.ZstdCompressor().compress(data)
+
+
+def decompress(data, codec_id: int) -> bytes:
+    """
+    Decompress a bytes-like object compressed with the codec identified by the header byte.
+
+    Args:
+        data (bytes-like): compressed data without the header byte
+        codec_id (int): codec id from the header byte
+
+    Returns:
+        bytes: decompressed data
+    """
+    compression = _codec_name_dict[codec_id]
+    check_compression(compression=compression)
+    if compression == "zlib":
+        return zlib.decompress(data)
+    elif compression == "lz4":
+        return lz4_frame.decompress(data)
+    else:
+        return zstandard.ZstdDecompressor().decompress(data)
+
+
+def dumps(
+    obj: object,
+    compression: Optional[str] = None,
+    threshold: int = COMPRESSION_THRESHOLD,
+) -> bytes:
+    """
+    Serialize an object with cloudpickle and compress the pickle stream when it is larger than the threshold.
+
+    Args:
+        obj (object): object to serialize
+        compression (str): name of the compression codec, None disables compression
+        threshold (int): minimum size in bytes of the pickle stream to be compressed
+
+    Returns:
+        bytes: pickle stream, or header byte followed by the compressed pickle stream
+    """
+    data = cloudpickle.dumps(obj)
+    if compression is not None and len(data) >= threshold:
+        return bytes([get_codec_id(compression=compression)]) + compress(
+            data=data, compression=compression
+        )
+    return data
+
+
+def loads(data: bytes) -> object:
+    """
+    Deserialize an object from a stream created by dumps(), the compression is detected from the header byte.
+
+    Args:
+        data (bytes-like): pickle stream, or header byte followed by the compressed pickle stream
+
+    Returns:
+        object: deserialized object
+    """
+    data = memoryview(data).cast("B")
+    if is_compressed(data=data):
+        return cloudpickle.loads(decompress(data=data[1:], codec_id=data[0]))
+    return cloudpickle.loads(data)
@@ -1,25 +1,36 @@
 import importlib.util
 import inspect
+import itertools
 import os
 import queue
 import sys
+import time
 from concurrent.futures import (
     Executor as FutureExecutor,
 )
 from concurrent.futures import (
     Future,
 )
-from time import sleep
-from typing import Callable, List, Optional
+from functools import partial
+from threading import Condition, RLock, Timer
+from typing import Callable, Iterator, List, Optional
 
 import cloudpickle
 
-from executorlib.shared.communication import interface_bootup
+from executorlib.shared.communication import (
+    SHARED_MEMORY_THRESHOLD,
+    SocketInterface,
+    get_result_from_output,
+    interface_bootup,
+)
+from executorlib.shared.function_cache import FunctionCache
 from executorlib.shared.inputcheck import (
+    check_reduce,
     check_resource_dict,
     check_resource_dict_is_empty,
 )
 from executorlib.shared.interface import BaseInterface, MpiExecInterface
+from executorlib.shared.memoize import ResultCache
 from executorlib.shared.thread import RaisingThread
 
 
@@ -31,13 +42,20 @@ class ExecutorBase(FutureExecutor):
         FutureExecutor: Base class for the executor.
     """
 
-    def __init__(self):
+    # Resource dictionary of the chunks submitted by map(), None for executors whose tasks have no resource dictionary
+    _chunk_resource_dict: Optional[dict] = None
+
+    def __init__(self, result_cache: Optional[ResultCache] = None):
         """
         Initialize the ExecutorBase class.
+
+        Args:
+            result_cache (ResultCache): cache to resolve repeated function calls without executing them again
         """
         cloudpickle_register(ind=3)
         self._future_queue: queue.Queue = queue.Queue()
         self._process: Optional[RaisingThread] = None
+        self._result_cache = result_cache
 
     @property
     def info(self) -> Optional[dict]:
@@ -92,16 +110,68 @@ class ExecutorBase(FutureExecutor):
                                       executor: None,
                                       hostname_localhost: False,
                                   }
+                                  With block_allocation enabled, only the reduction of the outputs of the MPI ranks
+                                  can be defined per function call: {reduce: "gather"}, which is either "gather",
+                                  "root", "sum", "max", "min" or a function with two arguments.
 
         Returns:
             Future: A Future representing the given call.
         """
+        resource_dict, reduce = _split_reduce(resource_dict=resource_dict)
         check_resource_dict_is_empty(resource_dict=resource_dict)
         check_resource_dict(function=fn)
         f = Future()
-        self._future_queue.put({"fn": fn, "args": args, "kwargs": kwargs, "future": f})
+        task_dict = {"fn": fn, "args": args, "kwargs": kwargs, "future": f}
+        if reduce is not None:
+            task_dict["reduce"] = reduce
+        self._put_task(task_dict)
         return f
 
+    def map(
+        self,
+        fn: callable,
+        *iterables,
+        timeout: Optional[float] = None,
+        chunksize: int = 1,
+    ) -> Iterator:
+        """
+        Returns an iterator equivalent to map(fn, iter). With chunksize larger than one, the function calls are
+        combined in chunks, which are communicated to the worker in a single message and evaluated there in a loop.
+        Like the tasks submitted individually, the chunks are resolved by the result cache, so repeating a chunked
+        map() with the same arguments and chunksize returns the cached results.
+
+        Args:
+            fn (callable): function to submit for execution, it is called with one argument from each iterable
+            iterables: iterables of arguments for the submitted function
+            timeout (float): maximum number of seconds to wait for the results - by default there is no limit
+            chunksize (int): number of function calls combined in a single task - defaults to 1
+
+        Returns:
+            Iterator: iterator over the results of the function calls in the order of the input arguments
+        """
+        if chunksize == 1:
+            return super().map(fn, *iterables, timeout=timeout)
+        return map_in_chunks(
+            put_task=self._put_task,
+            fn=fn,
+            iterables=iterables,
+            timeout=timeout,
+            chunksize=chunksize,
+            resource_dict=self._chunk_resource_dict,
+        )
+
+    def _put_task(self, task_dict: dict):
+        """
+        Put a task in the queue, unless it is resolved by the result cache.
+
+        Args:
+            task_dict (dict): task submitted to the executor as dictionary
+        """
+        if self._result_cache is None or not self._result_cache.submit(
+            task_dict=task_dict
+        ):
+            self._future_queue.put(task_dict)
+
     def shutdown(self, wait: bool = True, *, cancel_futures: bool = False):
         """
         Clean-up the resources associated with the Executor.
@@ -195,6 +265,8 @@ class ExecutorBroker(ExecutorBase):
 
 
 class ExecutorSteps(ExecutorBase):
+    _chunk_resource_dict: Optional[dict] = {}
+
     def submit(self, fn: callable, *args, resource_dict: dict = {}, **kwargs):
         """
         Submits a callable to be executed with the given arguments.
@@ -215,22 +287,25 @@ class ExecutorSteps(ExecutorBase):
                                       cwd: None,
                                       executor: None,
                                       hostname_localhost: False,
+                                      reduce: "gather",
                                   }
 
         Returns:
             A Future representing the given call.
         """
+        resource_dict, reduce = _split_reduce(resource_dict=resource_dict)
         check_resource_dict(function=fn)
         f = Future()
-        self._future_queue.put(
-            {
-                "fn": fn,
-                "args": args,
-                "kwargs": kwargs,
-                "future": f,
-                "resource_dict": resource_dict,
-            }
-        )
+        task_dict = {
+            "fn": fn,
+            "args": args,
+            "kwargs": kwargs,
+            "future": f,
+            "resource_dict": resource_dict,
+        }
+        if reduce is not None:
+            task_dict["reduce"] = reduce
+        self._put_task(task_dict)
         return f
 
     def shutdown(self, wait: bool = True, *, cancel_futures: bool = False):
@@ -276,6 +351,28 @@ def cancel_items_in_queue(que: queue.Queue):
             break
 
 
+def _split_reduce(resource_dict: dict) -> tuple:
+    """
+    Separate the reduction of the outputs of the MPI ranks from the resource dictionary. The reduction is not a
+    resource of the worker process but is communicated with the task, so the worker process combines the outputs of
+    the MPI ranks before the result is sent back: "gather" returns the list of the outputs of all ranks, "root" the
+    output of rank 0, "sum", "max" and "min" reduce the outputs with MPI and a function with two arguments reduces
+    them in a tree.
+
+    Args:
+        resource_dict (dict): resource dictionary of the task
+
+    Returns:
+        dict, str: resource dictionary without the key reduce and the reduction, None if it is not defined
+    """
+    if "reduce" not in resource_dict.keys():
+        return resource_dict, None
+    resource_dict = resource_dict.copy()
+    reduce = resource_dict.pop("reduce")
+    check_reduce(reduce=reduce)
+    return resource_dict, reduce
+
+
 def cloudpickle_register(ind: int = 2):
     """
     Cloudpickle can either pickle by value or pickle by reference. The functions which are communicated have to
@@ -298,6 +395,94 @@ def cloudpickle_register(ind: int = 2):
         pass
 
 
+def map_in_chunks(
+    put_task: callable,
+    fn: callable,
+    iterables: tuple,
+    timeout: Optional[float] = None,
+    chunksize: int = 1,
+    resource_dict: Optional[dict] = None,
+) -> Iterator:
+    """
+    Submit the function calls of a map() call in chunks. Each chunk is a single task, which contains the positional
+    arguments for all function calls of the chunk as a list of lists. The list of results returned for each chunk is
+    distributed to one future object per function call.
+
+    Args:
+        put_task (callable): function of the executor to submit a task dictionary, like ExecutorBase._put_task()
+        fn (callable): function to submit for execution
+        iterables (tuple): iterables of arguments for the submitted function
+        timeout (float): maximum number of seconds to wait for the results - by default there is no limit
+        chunksize (int): number of function calls combined in a single task
+        resource_dict (dict): resource dictionary for the chunks, None for executors without resource dictionary
+
+    Returns:
+        Iterator: iterator over the results of the function calls in the order of the input arguments
+    """
+    if chunksize < 1:
+        raise ValueError("chunksize has to be a positive integer.")
+    check_resource_dict(function=fn)
+    if timeout is not None:
+        end_time = timeout + time.monotonic()
+    chunk_future_lst, future_lst = [], []
+    argument_iterator = zip(*iterables)
+    while True:
+        chunk = [list(args) for args in itertools.islice(argument_iterator, chunksize)]
+        if len(chunk) == 0:
+            break
+        chunk_future = Future()
+        item_future_lst = [Future() for _ in chunk]
+        chunk_future.add_done_callback(
+            partial(_set_chunk_result, future_lst=item_future_lst)
+        )
+        task_dict = {
+            "fn": fn,
+            "args": chunk,
+            "kwargs": {},
+            "future": chunk_future,
+            "chunk": True,
+        }
+        if resource_dict is not None:
+            task_dict["resource_dict"] = resource_dict.copy()
+        put_task(task_dict)
+        chunk_future_lst.append(chunk_future)
+        future_lst += item_future_lst
+
+    def result_iterator():
+        try:
+            future_lst.reverse()
+            while future_lst:
+                if timeout is None:
+                    yield future_lst.pop().result()
+                else:
+                    yield future_lst.pop().result(end_time - time.monotonic())
+        finally:
+            for future in chunk_future_lst + future_lst:
+                future.cancel()
+
+    return result_iterator()
+
+
+def _set_chunk_result(chunk_future: Future, future_lst: List[Future]):
+    """
+    Distribute the list of results of a chunk to the future objects of the individual function calls.
+
+    Args:
+        chunk_future (Future): completed future object of the chunk
+        future_lst (list): future objects of the function calls in the chunk
+    """
+    if chunk_future.cancelled():
+        _ = [future.cancel() for future in future_lst]
+    elif chunk_future.exception() is not None:
+        for future in future_lst:
+            if future.set_running_or_notify_cancel():
+                future.set_exception(chunk_future.exception())
+    else:
+        for future, result in zip(future_lst, chunk_future.result()):
+            if future.set_running_or_notify_cancel():
+                future.set_result(result)
+
+
 def execute_parallel_tasks(
     future_queue: queue.Queue,
     cores: int = 1,
@@ -306,6 +491,9 @@ def execute_parallel_tasks(
     init_function: Optional[Callable] = None,
     prefix_name: Optional[str] = None,
     prefix_path: Optional[str] = None,
+    prefetch_depth: int = 1,
+    compression: Optional[str] = None,
+    shared_memory_threshold: Optional[int] = SHARED_MEMORY_THRESHOLD,
     **kwargs,
 ) -> None:
     """
@@ -325,6 +513,12 @@ def execute_parallel_tasks(
        init_function (callable): optional function to preset arguments for functions which are submitted later
        prefix_name (str): name of the conda environment to initialize
        prefix_path (str): path of the conda environment to initialize
+       prefetch_depth (int): number of tasks sent to the worker process before the first result is received, so the
+                             worker process can start with the next task while the previous result is communicated
+       compression (str): compression codec for large task messages and results, either "zlib", "lz4" or "zstd"
+       shared_memory_threshold (int): minimum size in bytes of the buffers which are exchanged through the shared
+                                      memory file system with a worker process on the same node, None disables shared
+                                      memory
     """
     interface = interface_bootup(
         command_lst=_get_backend_path(
@@ -334,21 +528,55 @@ def execute_parallel_tasks(
         hostname_localhost=hostname_localhost,
         prefix_path=prefix_path,
         prefix_name=prefix_name,
+        compression=compression,
+        shared_memory_threshold=shared_memory_threshold,
     )
     if init_function is not None:
         interface.send_dict(
             input_dict={"init": True, "fn": init_function, "args": (), "kwargs": {}}
         )
+    task_future_dict = {}
+    task_id_iterator = itertools.count()
+    function_cache = FunctionCache()
     while True:
-        task_dict = future_queue.get()
-        if "shutdown" in task_dict.keys() and task_dict["shutdown"]:
+        if len(task_future_dict) == 0:
+            task_dict = future_queue.get()
+        elif len(task_future_dict) < prefetch_depth:
+            try:
+                task_dict = future_queue.get_nowait()
+            except queue.Empty:
+                task_dict = None
+        else:
+            task_dict = None
+        if task_dict is None:  # wait for the next result of the tasks in flight
+            _receive_task_result(
+                interface=interface,
+                future_queue=future_queue,
+                task_future_dict=task_future_dict,
+            )
+        elif "shutdown" in task_dict.keys() and task_dict["shutdown"]:
+            while len(task_future_dict) > 0:
+                _receive_task_result(
+                    interface=interface,
+                    future_queue=future_queue,
+                    task_future_dict=task_future_dict,
+                )
             interface.shutdown(wait=task_dict["wait"])
             future_queue.task_done()
             future_queue.join()
             break
         elif "fn" in task_dict.keys() and "future" in task_dict.keys():
             f = task_dict.pop("future")
-            if f.set_running_or_notify_cancel():
+            if not f.set_running_or_notify_cancel():
+                continue
+            # Functions which were sent to the worker process before are replaced by their hash
+            task_dict = function_cache.encode(task_dict=task_dict)
+            if prefetch_depth > 1:
+                task_id = next(task_id_iterator)
+                task_dict["task_id"] = task_id
+                interface.send_dict(input_dict=task_dict)
+                task_future_dict[task_id] = f
+            else:
                 try:
                     f.set_result(interface.send_and_receive_dict(input_dict=task_dict))
                 except Exception as thread_exception:
@@ -364,6 +592,9 @@ def execute_separate_tasks(
     future_queue: queue.Queue,
     interface_class: BaseInterface = MpiExecInterface,
     max_cores: int = 1,
+    max_gpus: Optional[int] = None,
+    max_idle_workers: int = 0,
+    idle_timeout: float = 60.0,
     hostname_localhost: bool = False,
     **kwargs,
 ):
@@ -374,6 +605,10 @@ def execute_separate_tasks(
        future_queue (queue.Queue): task queue of dictionary objects which are submitted to the parallel process
        interface_class (BaseInterface): Interface to start process on selected compute resources
        max_cores (int): defines the number cores which can be used in parallel
+       max_gpus (int): defines the number of GPUs which can be used in parallel - by default the GPUs are not limited
+       max_idle_workers (int): number of idle worker processes which are kept alive to execute following tasks with the
+                               same resource requirements - by default every task is executed in a new process
+       idle_timeout (float): number of seconds after which an idle worker process is shut down
        hostname_localhost (boolean): use localhost instead of the hostname to establish the zmq connection. In the
                                      context of an HPC cluster this essential to be able to communicate to an
                                      Executor running on a different compute node within the same allocation. And
@@ -382,93 +617,471 @@ def execute_separate_tasks(
                                      this look up for security reasons. So on MacOS it is required to set this
                                      option to true
     """
-    active_task_dict = {}
-    process_lst, qtask_lst = [], []
+    scheduler = ResourceScheduler(max_cores=max_cores, max_gpus=max_gpus)
+    if max_idle_workers > 0:
+        worker_pool = WorkerPool(
+            max_cores=max_cores,
+            max_idle_workers=max_idle_workers,
+            idle_timeout=idle_timeout,
+        )
+    else:
+        worker_pool = None
     if "cores" not in kwargs.keys():
         kwargs["cores"] = 1
     while True:
         task_dict = future_queue.get()
         if "shutdown" in task_dict.keys() and task_dict["shutdown"]:
+            if task_dict["wait"]:
+                process_lst = scheduler.join()
+            if worker_pool is not None:
+                worker_pool.shutdown()
             if task_dict["wait"]:
                 _ = [process.join() for process in process_lst]
             future_queue.task_done()
             future_queue.join()
             break
         elif "fn" in task_dict.keys() and "future" in task_dict.keys():
-            qtask = queue.Queue()
-            process, active_task_dict = _submit_function_to_separate_process(
-                task_dict=task_dict,
-                qtask=qtask,
-                active_task_dict=active_task_dict,
-                interface_class=interface_class,
-                executor_kwargs=kwargs,
-                max_cores=max_cores,
-                hostname_localhost=hostname_localhost,
+            resource_dict = task_dict.pop("resource_dict")
+            if "cores" not in resource_dict.keys() or (
+                resource_dict["cores"] == 1 and kwargs["cores"] >= 1
+            ):
+                resource_dict["cores"] = kwargs["cores"]
+            cores = resource_dict["cores"] * resource_dict.get(
+                "threads_per_core", kwargs.get("threads_per_core", 1)
+            )
+            scheduler.submit(
+                future=task_dict["future"],
+                start_function=partial(
+                    _submit_function_to_separate_process,
+                    task_dict=task_dict,
+                    resource_dict=resource_dict,
+                    interface_class=interface_class,
+                    executor_kwargs=kwargs,
+                    hostname_localhost=hostname_localhost,
+                    worker_pool=worker_pool,
+                    cores=cores,
+                ),
+                cores=cores,
+                gpus=resource_dict["cores"]
+                * resource_dict.get("gpus_per_core", kwargs.get("gpus_per_core", 0)),
             )
-            qtask_lst.append(qtask)
-            process_lst.append(process)
             future_queue.task_done()
 
 
+class ResourceScheduler:
+    """
+    Start tasks as soon as the resources they request are available. The tasks are started in the order they were
+    submitted. When the first waiting task does not fit in the available resources, it is reserved and the following
+    smaller tasks are backfilled, as long as they only occupy resources the reserved task does not require. So the
+    reserved task is started at the latest when all tasks which were running when it was reserved are completed.
+    Resources are released by a callback of the future object of the task, so no thread is waiting actively.
+
+    Args:
+        max_cores (int): defines the number cores which can be used in parallel
+        max_gpus (int): defines the number of GPUs which can be used in parallel - by default the GPUs are not limited
+    """
+
+    def __init__(self, max_cores: int = 1, max_gpus: Optional[int] = None):
+        self._max_cores = max_cores
+        self._max_gpus = max_gpus
+        self._condition = Condition()
+        self._pending_lst = []
+        self._process_lst = []
+        self._backfill_dict = {}
+        self._cores_used = 0
+        self._gpus_used = 0
+        self._scheduling = False
+        self._reschedule = False
+
+    def submit(
+        self, future: Future, start_function: Callable, cores: int = 1, gpus: int = 0
+    ):
+        """
+        Add a task to the scheduler and start it, if the requested resources are available. Tasks which request more
+        resources than available in total are limited to the total resources, so they are executed exclusively.
+
+        Args:
+            future (Future): future object of the task, the resources are released when it is done
+            start_function (Callable): function to start the task, returns the thread linked to the task
+            cores (int): number of cores required for executing the task
+            gpus (int): number of GPUs required for executing the task
+        """
+        if self._max_gpus is not None:
+            gpus = min(gpus, self._max_gpus)
+        with self._condition:
+            self._pending_lst.append(
+                {
+                    "future": future,
+                    "start_function": start_function,
+                    "cores": min(cores, self._max_cores),
+                    "gpus": gpus,
+                }
+            )
+            self._schedule()
+
+    def join(self) -> List[RaisingThread]:
+        """
+        Block until all tasks were started.
+
+        Returns:
+            list: threads linked to the started tasks
+        """
+        with self._condition:
+            self._condition.wait_for(
+                lambda: all(task["future"].cancelled() for task in self._pending_lst)
+            )
+            return list(self._process_lst)
+
+    def __len__(self) -> int:
+        """
+        Get the number of tasks waiting for resources.
+
+        Returns:
+            int: number of tasks which were not started yet
+        """
+        with self._condition:
+            return len(
+                [task for task in self._pending_lst if not task["future"].cancelled()]
+            )
+
+    def _is_available(self, task: dict, cores_free: int, gpus_free: int) -> bool:
+        return task["cores"] <= cores_free and (
+            self._max_gpus is None or task["gpus"] <= gpus_free
+        )
+
+    def _start(self, task: dict, reserved: bool = False):
+        if not reserved:
+            self._cores_used += task["cores"]
+            self._gpus_used += task["gpus"]
+        self._process_lst.append(task["start_function"]())
+        task["future"].add_done_callback(
+            partial(self._release, cores=task["cores"], gpus=task["gpus"])
+        )
+
+    def _release(self, future: Future, cores: int, gpus: int):
+        with self._condition:
+            self._cores_used -= cores
+            self._gpus_used -= gpus
+            self._backfill_dict.pop(future, None)
+            if self._scheduling:
+                # A task completed while it was started, so the scheduling pass which started it is repeated
+                self._reschedule = True
+            else:
+                self._schedule()
+
+    def _schedule(self):
+        """
+        Start the waiting tasks in order and backfill the resources which are not required by the first waiting task.
+        Tasks which complete synchronously release their resources during the scheduling pass, so the pass is repeated
+        rather than entered recursively.
+        """
+        self._scheduling = True
+        try:
+            self._reschedule = True
+            while self._reschedule:
+                self._reschedule = False
+                self._schedule_pass()
+        finally:
+            self._scheduling = False
+        self._condition.notify_all()
+
+    def _schedule_pass(self):
+        self._pending_lst = [
+            task for task in self._pending_lst if not task["future"].cancelled()
+        ]
+        while len(self._pending_lst) > 0 and self._is_available(
+            task=self._pending_lst[0],
+            cores_free=self._max_cores - self._cores_used,
+            gpus_free=self._get_gpus_free(),
+        ):
+            self._backfill_dict = {}
+            self._start(task=self._pending_lst.pop(0))
+        if len(self._pending_lst) > 1:
+            reserved_task = self._pending_lst[0]
+            backfill_cores = (
+                self._max_cores
+                - reserved_task["cores"]
+                - sum(cores for cores, _ in self._backfill_dict.values())
+            )
+            backfill_gpus = self._get_gpus_free(
+                gpus_used=reserved_task["gpus"]
+                + sum(gpus for _, gpus in self._backfill_dict.values())
+            )
+            waiting_lst = [reserved_task]
+            started_lst = []
+            for task in self._pending_lst[1:]:
+                if self._is_available(
+                    task=task,
+                    cores_free=min(backfill_cores, self._max_cores - self._cores_used),
+                    gpus_free=min(backfill_gpus, self._get_gpus_free()),
+                ):
+                    self._backfill_dict[task["future"]] = (task["cores"], task["gpus"])
+                    self._cores_used += task["cores"]
+                    self._gpus_used += task["gpus"]
+                    started_lst.append(task)
+                    backfill_cores -= task["cores"]
+                    backfill_gpus -= task["gpus"]
+                else:
+                    waiting_lst.append(task)
+            # The pending tasks are updated before any task is started, as a task can complete while it is started
+            self._pending_lst = waiting_lst
+            for task in started_lst:
+                self._start(task=task, reserved=True)
+
+    def _get_gpus_free(self, gpus_used: Optional[int] = None) -> int:
+        if self._max_gpus is None:
+            return 0
+        elif gpus_used is None:
+            return self._max_gpus - self._gpus_used
+        else:
+            return self._max_gpus - gpus_used
+
+
+class WorkerPool:
+    """
+    Cache of idle worker processes, so a task can be executed by a worker process which was started for a previous task
+    with the same resource requirements, rather than starting a new python process for each task. Idle worker processes
+    are shut down after the idle timeout, when more than max_idle_workers are idle or when their cores are required to
+    start a new worker process, so the cores of all worker processes never exceed max_cores.
+
+    Args:
+        max_cores (int): defines the number cores which can be used in parallel
+        max_idle_workers (int): maximum number of idle worker processes which are kept alive
+        idle_timeout (float): number of seconds after which an idle worker process is shut down
+    """
+
+    def __init__(
+        self, max_cores: int = 1, max_idle_workers: int = 1, idle_timeout: float = 60.0
+    ):
+        self._max_cores = max_cores
+        self._max_idle_workers = max_idle_workers
+        self._idle_timeout = idle_timeout
+        self._lock = RLock()
+        self._worker_lst = []
+        self._idle_lst = []
+        self._shutdown = False
+
+    def submit(self, task_dict: dict, task_kwargs: dict, cores: int = 1):
+        """
+        Execute the task on an idle worker process with the same resource requirements or start a new worker process.
+
+        Args:
+            task_dict (dict): task submitted to the executor as dictionary. This dictionary has the following keys
+                              {"fn": callable, "args": (), "kwargs": {}, "future": Future}
+            task_kwargs (dict): keyword arguments for execute_parallel_tasks() defining the worker process
+            cores (int): number of cores used by the worker process
+
+        Returns:
+            RaisingThread: thread for communicating with the python process which is executing the function
+        """
+        worker_key = tuple(sorted((k, repr(v)) for k, v in task_kwargs.items()))
+        with self._lock:
+            worker_lst = [
+                worker for worker in self._idle_lst if worker["key"] == worker_key
+            ]
+            if self._shutdown:  # execute the task in a new process without caching it
+                worker = self._start(
+                    task_kwargs=task_kwargs, cores=cores, worker_key=worker_key
+                )
+                worker["queue"].put(task_dict)
+                worker["queue"].put({"shutdown": True, "wait": True})
+                return worker["process"]
+            elif len(worker_lst) > 0:
+                worker = worker_lst[-1]
+                worker["timer"].cancel()
+                self._idle_lst.remove(worker)
+            else:
+                while (
+                    len(self._idle_lst) > 0
+                    and cores + sum(worker["cores"] for worker in self._worker_lst)
+                    > self._max_cores
+                ):
+                    self._stop(worker=self._idle_lst[0])
+                worker = self._start(
+                    task_kwargs=task_kwargs, cores=cores, worker_key=worker_key
+                )
+                self._worker_lst.append(worker)
+            task_dict["future"].add_done_callback(partial(self._release, worker=worker))
+            worker["queue"].put(task_dict)
+            return worker["process"]
+
+    def shutdown(self):
+        """
+        Shut down all worker processes once they completed the tasks they are currently executing.
+        """
+        with self._lock:
+            self._shutdown = True
+            for worker in list(self._worker_lst):
+                self._stop(worker=worker)
+
+    @staticmethod
+    def _start(task_kwargs: dict, cores: int, worker_key: tuple) -> dict:
+        worker = {"key": worker_key, "cores": cores, "queue": queue.Queue()}
+        task_kwargs = task_kwargs.copy()
+        task_kwargs["future_queue"] = worker["queue"]
+        worker["process"] = RaisingThread(
+            target=execute_parallel_tasks,
+            kwargs=task_kwargs,
+        )
+        worker["process"].start()
+        return worker
+
+    def _release(self, future: Future, worker: dict):
+        with self._lock:
+            if worker not in self._worker_lst:
+                return
+            elif not future.cancelled() and future.exception() is not None:
+                # the worker process is shut down after a failed task
+                self._worker_lst.remove(worker)
+                return
+            worker["timer"] = Timer(
+                self._idle_timeout, partial(self._expire, worker=worker)
+            )
+            worker["timer"].daemon = True
+            worker["timer"].start()
+            self._idle_lst.append(worker)
+            while len(self._idle_lst) > self._max_idle_workers:
+                self._stop(worker=self._idle_lst[0])
+
+    def _expire(self, worker: dict):
+        with self._lock:
+            if worker in self._idle_lst:
+                self._stop(worker=worker)
+
+    def _stop(self, worker: dict):
+        if worker in self._idle_lst:
+            worker["timer"].cancel()
+            self._idle_lst.remove(worker)
+        self._worker_lst.remove(worker)
+        worker["queue"].put({"shutdown": True, "wait": True})
+
+
 def execute_tasks_with_dependencies(
     future_queue: queue.Queue,
     executor_queue: queue.Queue,
     executor: ExecutorBase,
     refresh_rate: float = 0.01,
+    result_cache: Optional[ResultCache] = None,
 ):
     """
     Resolve the dependencies of multiple tasks, by analysing which task requires concurrent.future.Futures objects from
-    other tasks.
+    other tasks. Rather than polling the waiting tasks, a callback is registered on each future object a task depends
+    on, so the task is submitted to the internal executor as soon as the last of its inputs is completed.
 
     Args:
         future_queue (Queue): Queue for receiving new tasks.
         executor_queue (Queue): Queue for the internal executor.
         executor (ExecutorBase): Executor to execute the tasks with after the dependencies are resolved.
-        refresh_rate (float): Set the refresh rate in seconds, how frequently the input queue is checked.
+        refresh_rate (float): Set the refresh rate in seconds, how frequently the input queue is checked. As the
+                              dependencies are resolved by callbacks, this parameter is only kept for compatibility.
+        result_cache (ResultCache): cache of the internal executor to resolve repeated function calls once their
+                                    dependencies are resolved
     """
-    wait_lst = []
+    dependency_index = DependencyIndex(
+        executor_queue=executor_queue, result_cache=result_cache
+    )
     while True:
-        try:
-            task_dict = future_queue.get_nowait()
-        except queue.Empty:
-            task_dict = None
-        if (  # shutdown the executor
-            task_dict is not None
-            and "shutdown" in task_dict.keys()
-            and task_dict["shutdown"]
-        ):
+        task_dict = future_queue.get()
+        if "shutdown" in task_dict.keys() and task_dict["shutdown"]:
+            if task_dict["wait"]:
+                dependency_index.join()
             executor.shutdown(wait=task_dict["wait"])
             future_queue.task_done()
             future_queue.join()
             break
-        elif (  # handle function submitted to the executor
-            task_dict is not None
-            and "fn" in task_dict.keys()
-            and "future" in task_dict.keys()
-        ):
-            future_lst, ready_flag = _get_future_objects_from_input(task_dict=task_dict)
-            if len(future_lst) == 0 or ready_flag:
-                # No future objects are used in the input or all future objects are already done
-                task_dict["args"], task_dict["kwargs"] = _update_futures_in_input(
-                    args=task_dict["args"], kwargs=task_dict["kwargs"]
-                )
-                executor_queue.put(task_dict)
-            else:  # Otherwise add the function to the wait list
-                task_dict["future_lst"] = future_lst
-                wait_lst.append(task_dict)
+        elif "fn" in task_dict.keys() and "future" in task_dict.keys():
+            dependency_index.add(task_dict=task_dict)
             future_queue.task_done()
-        elif len(wait_lst) > 0:
-            number_waiting = len(wait_lst)
-            # Check functions in the wait list and execute them if all future objects are now ready
-            wait_lst = _submit_waiting_task(
-                wait_lst=wait_lst, executor_queue=executor_queue
+
+
+class DependencyIndex:
+    """
+    Reverse dependency index which maps each unfinished future object to the tasks waiting for it. Every waiting task
+    keeps a counter of the future objects it is still waiting for, so completing a future object only touches the tasks
+    which depend on it, rather than checking all waiting tasks.
+
+    Args:
+        executor_queue (Queue): Queue of the internal executor the tasks are submitted to once they are ready.
+        result_cache (ResultCache): cache of the internal executor to resolve repeated function calls
+    """
+
+    def __init__(
+        self, executor_queue: queue.Queue, result_cache: Optional[ResultCache] = None
+    ):
+        self._executor_queue = executor_queue
+        self._result_cache = result_cache
+        self._condition = Condition()
+        self._dependents_dict = {}
+        self._number_waiting = 0
+
+    def add(self, task_dict: dict):
+        """
+        Submit the task directly when all its future inputs are completed, otherwise register it in the index.
+
+        Args:
+            task_dict (dict): task submitted to the executor as dictionary. This dictionary has the following keys
+                              {"fn": callable, "args": (), "kwargs": {}, "future": Future, "resource_dict": {}}
+        """
+        future_lst, _ = _get_future_objects_from_input(task_dict=task_dict)
+        with self._condition:
+            pending_future_set = {future for future in future_lst if not future.done()}
+            if len(pending_future_set) == 0:
+                self._submit(task_dict=task_dict)
+                return
+            waiting_dict = {
+                "task_dict": task_dict,
+                "remaining": len(pending_future_set),
+            }
+            self._number_waiting += 1
+            for future in pending_future_set:
+                if future not in self._dependents_dict.keys():
+                    self._dependents_dict[future] = [waiting_dict]
+                    future.add_done_callback(self._future_done)
+                else:
+                    self._dependents_dict[future].append(waiting_dict)
+
+    def join(self):
+        """
+        Block until all waiting tasks were submitted to the internal executor.
+        """
+        with self._condition:
+            self._condition.wait_for(lambda: self._number_waiting == 0)
+
+    def _future_done(self, future: Future):
+        """
+        Callback for completed future objects, submits the tasks for which this was the last missing input.
+
+        Args:
+            future (Future): completed future object
+        """
+        with self._condition:
+            for waiting_dict in self._dependents_dict.pop(future, []):
+                waiting_dict["remaining"] -= 1
+                if waiting_dict["remaining"] == 0:
+                    self._submit(task_dict=waiting_dict["task_dict"])
+                    self._number_waiting -= 1
+            self._condition.notify_all()
+
+    def _submit(self, task_dict: dict):
+        """
+        Replace the future objects in the input by their results and submit the task to the internal executor. If one
+        of the future objects failed, the exception is forwarded to the future object of the task.
+
+        Args:
+            task_dict (dict): task submitted to the executor as dictionary
+        """
+        try:
+            task_dict["args"], task_dict["kwargs"] = _update_futures_in_input(
+                args=task_dict["args"], kwargs=task_dict["kwargs"]
             )
-            # if no job is ready, sleep for a moment
-            if len(wait_lst) == number_waiting:
-                sleep(refresh_rate)
+        except Exception as future_exception:
+            if not task_dict["future"].done():
+                task_dict["future"].set_exception(future_exception)
         else:
-            # If there is nothing else to do, sleep for a moment
-            sleep(refresh_rate)
+            if self._result_cache is None or not self._result_cache.submit(
+                task_dict=task_dict
+            ):
+                self._executor_queue.put(task_dict)
 
 
 def get_command_path(executable: str) -> str:
@@ -521,47 +1134,38 @@ def _get_command_path(executable: str) -> str:
     return os.path.abspath(os.path.join(__file__, "..", "..", "backend", executable))
 
 
-def _wait_for_free_slots(
-    active_task_dict: dict, cores_requested: int, max_cores: int
-) -> dict:
+def _receive_task_result(
+    interface: SocketInterface, future_queue: queue.Queue, task_future_dict: dict
+):
     """
-    Wait for available computing resources to become available.
+    Receive the result of one of the tasks in flight and set it on the corresponding future object. When the task
+    failed, the results of the remaining tasks in flight are received, before the interface is shut down and the
+    exception is raised.
 
     Args:
-        active_task_dict (dict): Dictionary containing the future objects and the number of cores they require
-        cores_requested (int): Number of cores required for executing the next task
-        max_cores (int): Maximum number cores which can be used
-
-    Returns:
-        dict: Dictionary containing the future objects and the number of cores they require
-    """
-    while sum(active_task_dict.values()) + cores_requested > max_cores:
-        active_task_dict = {k: v for k, v in active_task_dict.items() if not k.done()}
-    return active_task_dict
-
-
-def _submit_waiting_task(wait_lst: List[dict], executor_queue: queue.Queue) -> list:
+        interface (SocketInterface): socket interface of the worker process
+        future_queue (queue.Queue): task queue of dictionary objects which are submitted to the parallel process
+        task_future_dict (dict): dictionary mapping the task ids of the tasks in flight to their future objects
     """
-    Submit the waiting tasks, which future inputs have been completed, to the executor
-
-    Args:
-        wait_lst (list): List of waiting tasks
-        executor_queue (Queue): Queue of the internal executor
-
-    Returns:
-        list: list tasks which future inputs have not been completed
-    """
-    wait_tmp_lst = []
-    for task_wait_dict in wait_lst:
-        if all([future.done() for future in task_wait_dict["future_lst"]]):
-            del task_wait_dict["future_lst"]
-            task_wait_dict["args"], task_wait_dict["kwargs"] = _update_futures_in_input(
-                args=task_wait_dict["args"], kwargs=task_wait_dict["kwargs"]
-            )
-            executor_queue.put(task_wait_dict)
-        else:
-            wait_tmp_lst.append(task_wait_dict)
-    return wait_tmp_lst
+    task_id, output = interface.receive_tagged_dict()
+    f = task_future_dict.pop(task_id)
+    try:
+        f.set_result(get_result_from_output(output=output))
+    except Exception as thread_exception:
+        while len(task_future_dict) > 0:
+            task_id, output = interface.receive_tagged_dict()
+            task_future = task_future_dict.pop(task_id)
+            try:
+                task_future.set_result(get_result_from_output(output=output))
+            except Exception as task_exception:
+                task_future.set_exception(exception=task_exception)
+            future_queue.task_done()
+        interface.shutdown(wait=True)
+        future_queue.task_done()
+        f.set_exception(exception=thread_exception)
+        raise thread_exception
+    else:
+        future_queue.task_done()
 
 
 def _update_futures_in_input(args: tuple, kwargs: dict):
@@ -619,23 +1223,21 @@ def _get_future_objects_from_input(task_dict: dict):
 
 def _submit_function_to_separate_process(
     task_dict: dict,
-    active_task_dict: dict,
-    qtask: queue.Queue,
+    resource_dict: dict,
     interface_class: BaseInterface,
     executor_kwargs: dict,
-    max_cores: int = 1,
     hostname_localhost: bool = False,
-):
+    worker_pool: Optional[WorkerPool] = None,
+    cores: int = 1,
+) -> RaisingThread:
     """
     Submit function to be executed in separate Python process
     Args:
         task_dict (dict): task submitted to the executor as dictionary. This dictionary has the following keys
-                          {"fn": callable, "args": (), "kwargs": {}, "resource_dict": {}}
-        active_task_dict (dict): Dictionary containing the future objects and the number of cores they require
-        qtask (queue.Queue): Queue to communicate with the thread linked to the process executing the python function
+                          {"fn": callable, "args": (), "kwargs": {}}
+        resource_dict (dict): resource dictionary, which defines the resources used for the execution of the function
         interface_class (BaseInterface): Interface to start process on selected compute resources
         executor_kwargs (dict): keyword parameters used to initialize the Executor
-        max_cores (int): defines the number cores which can be used in parallel
         hostname_localhost (boolean): use localhost instead of the hostname to establish the zmq connection. In the
                                      context of an HPC cluster this essential to be able to communicate to an
                                      Executor running on a different compute node within the same allocation. And
@@ -643,36 +1245,31 @@ def _submit_function_to_separate_process(
                                      points to the same address as localhost. Still MacOS >= 12 seems to disable
                                      this look up for security reasons. So on MacOS it is required to set this
                                      option to true
+        worker_pool (WorkerPool): optional pool of idle worker processes to execute the function
+        cores (int): number of cores used by the python process, to limit the cores of the idle worker processes
     Returns:
-        RaisingThread, dict: thread for communicating with the python process which is executing the function and
-                             dictionary containing the future objects and the number of cores they require
+        RaisingThread: thread for communicating with the python process which is executing the function
     """
-    resource_dict = task_dict.pop("resource_dict")
-    qtask.put(task_dict)
-    qtask.put({"shutdown": True, "wait": True})
-    if "cores" not in resource_dict.keys() or (
-        resource_dict["cores"] == 1 and executor_kwargs["cores"] >= 1
-    ):
-        resource_dict["cores"] = executor_kwargs["cores"]
-    active_task_dict = _wait_for_free_slots(
-        active_task_dict=active_task_dict,
-        cores_requested=resource_dict["cores"],
-        max_cores=max_cores,
-    )
-    active_task_dict[task_dict["future"]] = resource_dict["cores"]
     task_kwargs = executor_kwargs.copy()
     task_kwargs.update(resource_dict)
     task_kwargs.update(
         {
-            "future_queue": qtask,
             "interface_class": interface_class,
             "hostname_localhost": hostname_localhost,
             "init_function": None,
         }
     )
+    if worker_pool is not None:
+        return worker_pool.submit(
+            task_dict=task_dict, task_kwargs=task_kwargs, cores=cores
+        )
+    qtask = queue.Queue()
+    qtask.put(task_dict)
+    qtask.put({"shutdown": True, "wait": True})
+    task_kwargs["future_queue"] = qtask
     process = RaisingThread(
         target=execute_parallel_tasks,
         kwargs=task_kwargs,
     )
     process.start()
-    return process, active_task_dict
+    return process
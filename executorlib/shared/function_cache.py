@@ -0,0 +1,84 @@
+from collections import OrderedDict
+from types import FunctionType
+
+from executorlib.shared.hashing import _get_function_hash
+
+FUNCTION_CACHE_SIZE = 128
+
+
+class FunctionCache:
+    """
+    Least recently used (LRU) cache of the functions submitted to a worker process, identified by the hash of the
+    serialized function. The executor sends each function only once together with its hash and afterwards only the
+    hash, so large closures and modules which are pickled by value are not serialized for every task. The executor
+    and the worker process both keep a FunctionCache of the same size, which is updated in the order the tasks are
+    sent, so the executor knows which functions the worker process still holds without any further communication.
+
+    Only python functions are cached, as the state of other callables, like the instance of a bound method, can
+    change between the function calls. Functions pickled by value are hashed again for every task, so a function whose
+    code, default arguments, closure cells or referenced global variables changed is sent to the worker process again.
+    This saves the communication but not the serialization of these functions on the side of the executor, see
+    executorlib.shared.hashing._get_function_hash().
+
+    Args:
+        max_size (int): maximum number of functions stored by the worker process
+    """
+
+    def __init__(self, max_size: int = FUNCTION_CACHE_SIZE):
+        self._max_size = max_size
+        self._function_dict = OrderedDict()
+
+    def encode(self, task_dict: dict) -> dict:
+        """
+        Replace the function of a task by its hash, if it was sent to the worker process before. Called by the
+        executor before the task is sent.
+
+        Args:
+            task_dict (dict): task dictionary with the keys "fn", "args" and "kwargs"
+
+        Returns:
+            dict: task dictionary with the key "fn_id" and without the key "fn", if the function is cached
+        """
+        if type(task_dict.get("fn")) is not FunctionType:
+            return task_dict
+        fn_id = _get_function_hash(funct=task_dict["fn"]).hex()
+        if fn_id in self._function_dict.keys():
+            self._function_dict.move_to_end(fn_id)
+            task_dict = {key: value for key, value in task_dict.items() if key != "fn"}
+        else:
+            # The executor only tracks which functions the worker process holds
+            self._add(fn_id=fn_id, fn=True)
+            task_dict = task_dict.copy()
+        task_dict["fn_id"] = fn_id
+        return task_dict
+
+    def decode(self, input_dict: dict) -> dict:
+        """
+        Restore the function of a task from its hash. Called by the worker process after the task is received.
+
+        Args:
+            input_dict (dict): task dictionary received from the executor
+
+        Returns:
+            dict: task dictionary with the key "fn"
+        """
+        if "fn_id" in input_dict.keys():
+            fn_id = input_dict.pop("fn_id")
+            if "fn" in input_dict.keys():
+                self._add(fn_id=fn_id, fn=input_dict["fn"])
+            else:
+                self._function_dict.move_to_end(fn_id)
+                input_dict["fn"] = self._function_dict[fn_id]
+        return input_dict
+
+    def _add(self, fn_id: str, fn) -> None:
+        """
+        Add a function to the cache and remove the least recently used function, if the cache is full.
+
+        Args:
+            fn_id (str): hash of the function
+            fn (callable): function, or True for the cache of the executor
+        """
+        self._function_dict[fn_id] = fn
+        if len(self._function_dict) > self._max_size:
+            self._function_dict.popitem(last=False)
@@ -0,0 +1,170 @@
+import hashlib
+import re
+import weakref
+from types import BuiltinFunctionType, FunctionType, MethodType
+
+import cloudpickle
+from cloudpickle.cloudpickle import _should_pickle_by_reference
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
+
+class _FunctionHashDict(weakref.WeakKeyDictionary):
+    """
+    Weak dictionary of the hashes of function objects. When the functions of this module are serialized by value, the
+    dictionary is replaced by an empty one, as weak references can not be serialized.
+    """
+
+    def __reduce__(self):
+        return self.__class__, ()
+
+
+# The hashes of functions pickled by reference are computed once per function object and reused for all following tasks
+_function_hash_dict = _FunctionHashDict()
+
+
+def get_hash(obj: object, algorithm: str = "blake2b") -> str:
+    """
+    Get a hash of a python object, which is identical for objects with the same content. Rather than serializing the
+    whole object first, the hash is computed in a streaming fashion: numpy arrays are hashed directly from their buffers
+    together with their dtype and shape, containers are traversed recursively, the hash of each importable function is
+    computed only once and all remaining objects are serialized with cloudpickle, with their out-of-band buffers hashed
+    directly.
+
+    Args:
+        obj (object): python object to hash, typically a dictionary with the function and its arguments
+        algorithm (str): hash algorithm, either "blake2b" (default) or "xxhash". The default does not depend on the
+                         installed packages, so the cache keys are stable between environments. The faster xxhash
+                         algorithm is opt-in and its hashes are prefixed with "xxh3_", so a cache key records the
+                         algorithm it was computed with.
+
+    Returns:
+        str: hexadecimal hash of the object
+    """
+    hasher = _get_hasher(algorithm=algorithm)
+    _update_hash(hasher=hasher, obj=obj)
+    if algorithm == "xxhash":
+        return "xxh3_" + hasher.hexdigest()
+    return hasher.hexdigest()
+
+
+def _get_hasher(algorithm: str = "blake2b"):
+    """
+    Get a streaming hash object for the selected algorithm.
+
+    Args:
+        algorithm (str): hash algorithm, either "blake2b" or "xxhash"
+
+    Returns:
+        object: hash object with the methods update() and hexdigest()
+    """
+    if algorithm == "xxhash":
+        if xxhash is None:
+            raise ImportError(
+                "The xxhash algorithm requires the xxhash package. Install it using: pip install xxhash"
+            )
+        return xxhash.xxh3_128()
+    elif algorithm == "blake2b":
+        return hashlib.blake2b(digest_size=16)
+    else:
+        raise ValueError(
+            "The hash algorithm "
+            + str(algorithm)
+            + " is not supported, choose either blake2b or xxhash."
+        )
+
+
+def _update_hash(hasher, obj: object):
+    """
+    Add an object to a streaming hash. Every entry starts with a type tag and the containers and binary data include
+    their length, so different objects can not result in the same stream.
+
+    Args:
+        hasher (object): hash object with the method update()
+        obj (object): python object to add to the hash
+    """
+    obj_type = type(obj)
+    if np is not None and obj_type is np.ndarray and not obj.dtype.hasobject:
+        hasher.update(
+            b"ndarray" + str(obj.dtype.descr).encode() + str(obj.shape).encode() + b":"
+        )
+        hasher.update(np.ascontiguousarray(obj).data.cast("B"))
+    elif obj_type in [list, tuple]:
+        hasher.update(obj_type.__name__.encode() + str(len(obj)).encode() + b":")
+        for item in obj:
+            _update_hash(hasher=hasher, obj=item)
+    elif obj_type is dict:
+        hasher.update(b"dict" + str(len(obj)).encode() + b":")
+        for key, value in obj.items():
+            _update_hash(hasher=hasher, obj=key)
+            _update_hash(hasher=hasher, obj=value)
+    elif obj_type is str:
+        data = obj.encode("utf-8", "surrogatepass")
+        hasher.update(b"str" + str(len(data)).encode() + b":" + data)
+    elif obj_type in [bytes, bytearray]:
+        hasher.update(b"bytes" + str(len(obj)).encode() + b":")
+        hasher.update(obj)
+    elif obj_type in [bool, int, float, complex, type(None)]:
+        data = repr(obj).encode()
+        hasher.update(obj_type.__name__.encode() + str(len(data)).encode() + b":")
+        hasher.update(data)
+    elif obj_type in [FunctionType, BuiltinFunctionType, MethodType]:
+        hasher.update(b"function:" + _get_function_hash(funct=obj))
+    else:
+        buffer_lst = []
+        data = _remove_ipykernel_path(
+            binary=cloudpickle.dumps(obj, protocol=5, buffer_callback=buffer_lst.append)
+        )
+        hasher.update(b"pickle" + str(len(data)).encode() + b":" + data)
+        for buffer in buffer_lst:
+            data = buffer.raw()
+            hasher.update(b"buffer" + str(data.nbytes).encode() + b":")
+            hasher.update(data)
+
+
+def _get_function_hash(funct: callable) -> bytes:
+    """
+    Get the hash of a function. Functions which are pickled by reference are serialized as their module and name only,
+    so their hash is computed once per function object. Functions which are pickled by value, like lambda functions,
+    closures and functions defined in __main__, are hashed again each time, as their code, default arguments, closure
+    cells and referenced global variables can change. Comparing the identity of __code__, __defaults__ and __closure__
+    is not sufficient to detect these changes, as closure cells and global variables can be modified in place. So each
+    submission of a function pickled by value costs a full cloudpickle serialization of the function, which is
+    significant for functions referencing large objects. Defining the function in an importable module avoids it.
+
+    Args:
+        funct (callable): function to hash
+
+    Returns:
+        bytes: hash of the serialized function
+    """
+    memoize = type(funct) is FunctionType and _should_pickle_by_reference(funct)
+    if memoize and funct in _function_hash_dict:
+        return _function_hash_dict[funct]
+    function_hash = hashlib.blake2b(
+        _remove_ipykernel_path(binary=cloudpickle.dumps(funct)), digest_size=16
+    ).digest()
+    if memoize:
+        _function_hash_dict[funct] = function_hash
+    return function_hash
+
+
+def _remove_ipykernel_path(binary: bytes) -> bytes:
+    """
+    Remove the specification of the jupyter kernel from a serialized object, so the hash is deterministic.
+
+    Args:
+        binary (bytes): serialized object
+
+    Returns:
+        bytes: serialized object without the jupyter kernel specification
+    """
+    return re.sub(b"(?<=/ipykernel_)(.*)(?=/)", b"", binary)
@@ -1,6 +1,6 @@
 import inspect
 from concurrent.futures import Executor
-from typing import Callable, List, Optional
+from typing import Callable, List, Optional, Union
 
 
 def check_oversubscribe(oversubscribe: bool) -> None:
@@ -91,6 +91,36 @@ def check_resource_dict_is_empty(resource_dict: dict) -> None:
         )
 
 
+def check_reduce(reduce: Optional[Union[str, Callable]]) -> None:
+    """
+    Check if reduce is a supported reduction of the outputs of the MPI ranks and raise a ValueError if it is not.
+    """
+    if (
+        reduce is not None
+        and not callable(reduce)
+        and reduce not in ["gather", "root", "sum", "max", "min"]
+    ):
+        raise ValueError(
+            "The reduction "
+            + str(reduce)
+            + " is not supported, choose either gather, root, sum, max, min or a function with two arguments."
+        )
+
+
+def check_shared_memory_threshold(shared_memory_threshold: Optional[int]) -> None:
+    """
+    Check if shared_memory_threshold is None or a non-negative integer and raise a ValueError if it is not.
+    """
+    if shared_memory_threshold is not None and (
+        not isinstance(shared_memory_threshold, int) or shared_memory_threshold < 0
+    ):
+        raise ValueError(
+            "The shared_memory_threshold "
+            + str(shared_memory_threshold)
+            + " is not supported, choose either None to disable shared memory or a non-negative number of bytes."
+        )
+
+
 def check_refresh_rate(refresh_rate: float) -> None:
     """
     Check if refresh_rate is not 0.01 and raise a ValueError if it is.
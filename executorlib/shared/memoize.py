@@ -0,0 +1,182 @@
+import os
+from collections import OrderedDict
+from concurrent.futures import Future
+from functools import partial
+from threading import RLock
+from typing import Optional, Union
+
+import cloudpickle
+
+from executorlib.shared.hashing import get_hash
+
+
+class ResultCache:
+    """
+    Content-addressed cache for the results of function calls. The results are identified by the hash of the function,
+    its arguments and its resource dictionary. They are stored serialized in an in-memory least recently used (LRU)
+    tier, which is bounded by the total size of the serialized results, and optionally in an on-disk tier, which keeps
+    the results between sessions. Submitting a call which is currently executed returns a future object linked to the
+    running call, rather than executing it again.
+
+    Args:
+        max_bytes (int): maximum total size in bytes of the serialized results in memory - defaults to 1GB
+        cache_directory (str): directory for the on-disk tier, None disables the on-disk tier - defaults to None
+    """
+
+    def __init__(self, max_bytes: int = 2**30, cache_directory: Optional[str] = None):
+        self._max_bytes = max_bytes
+        self._cache_directory = cache_directory
+        if cache_directory is not None:
+            os.makedirs(cache_directory, exist_ok=True)
+        self._memory_dict = OrderedDict()
+        self._memory_bytes = 0
+        self._running_dict = {}
+        self._lock = RLock()
+
+    def submit(self, task_dict: dict) -> bool:
+        """
+        Resolve the future object of a task from the cache or link it to an identical running task. Otherwise, the task
+        is registered as running, so its result is stored once it is completed.
+
+        Args:
+            task_dict (dict): task submitted to the executor as dictionary. This dictionary has the following keys
+                              {"fn": callable, "args": (), "kwargs": {}, "future": Future}
+
+        Returns:
+            bool: True if the task was resolved by the cache and does not have to be executed
+        """
+        try:
+            task_key = get_task_key(task_dict=task_dict)
+        except Exception:  # Tasks which cannot be serialized are not cached
+            return False
+        future = task_dict["future"]
+        with self._lock:
+            if task_key in self._running_dict.keys():
+                self._running_dict[task_key].add_done_callback(
+                    partial(_copy_future_state, target=future)
+                )
+                return True
+            data = self._get(task_key=task_key)
+            if data is not None:
+                if future.set_running_or_notify_cancel():
+                    future.set_result(cloudpickle.loads(data))
+                return True
+            self._running_dict[task_key] = future
+        future.add_done_callback(partial(self._store, task_key=task_key))
+        return False
+
+    def _get(self, task_key: str) -> Optional[bytes]:
+        """
+        Get the serialized result from the in-memory tier or load it from the on-disk tier.
+
+        Args:
+            task_key (str): hash of the task
+
+        Returns:
+            bytes: serialized result, None if the result is not cached
+        """
+        if task_key in self._memory_dict.keys():
+            self._memory_dict.move_to_end(task_key)
+            return self._memory_dict[task_key]
+        if self._cache_directory is not None:
+            file_name = os.path.join(self._cache_directory, task_key + ".pkl")
+            if os.path.exists(file_name):
+                with open(file_name, "rb") as f:
+                    data = f.read()
+                self._add_to_memory(task_key=task_key, data=data)
+                return data
+        return None
+
+    def _store(self, future: Future, task_key: str):
+        """
+        Callback for completed tasks, which stores successful results in the cache.
+
+        Args:
+            future (Future): completed future object of the task
+            task_key (str): hash of the task
+        """
+        with self._lock:
+            del self._running_dict[task_key]
+            if future.cancelled() or future.exception() is not None:
+                return
+            try:
+                data = cloudpickle.dumps(future.result())
+            except Exception:  # Results which cannot be serialized are not cached
+                return
+            self._add_to_memory(task_key=task_key, data=data)
+            if self._cache_directory is not None:
+                file_name = os.path.join(self._cache_directory, task_key + ".pkl")
+                with open(file_name + ".tmp", "wb") as f:
+                    f.write(data)
+                os.replace(file_name + ".tmp", file_name)
+
+    def _add_to_memory(self, task_key: str, data: bytes):
+        """
+        Add a serialized result to the in-memory tier and evict the least recently used results beyond the size limit.
+
+        Args:
+            task_key (str): hash of the task
+            data (bytes): serialized result
+        """
+        if len(data) > self._max_bytes:
+            return
+        self._memory_dict[task_key] = data
+        self._memory_bytes += len(data)
+        while self._memory_bytes > self._max_bytes:
+            _, data_evicted = self._memory_dict.popitem(last=False)
+            self._memory_bytes -= len(data_evicted)
+
+
+def get_result_cache(cache: Union[bool, dict, None]) -> Optional[ResultCache]:
+    """
+    Create the result cache from the cache parameter of the executor.
+
+    Args:
+        cache (bool, dict): True to cache the results in memory, or a dictionary with the keys "max_bytes" and
+                            "cache_directory" to configure the cache. False or None disables the cache.
+
+    Returns:
+        ResultCache: result cache or None if it is disabled
+    """
+    if cache is None or cache is False:
+        return None
+    elif cache is True:
+        return ResultCache()
+    elif isinstance(cache, dict):
+        return ResultCache(**cache)
+    else:
+        raise TypeError(
+            "The cache parameter has to be a boolean or a dictionary with the keys max_bytes and cache_directory."
+        )
+
+
+def get_task_key(task_dict: dict) -> str:
+    """
+    Get the hash of a task, which identifies its result.
+
+    Args:
+        task_dict (dict): task submitted to the executor as dictionary
+
+    Returns:
+        str: hash of the task
+    """
+    return get_hash(
+        obj={key: value for key, value in task_dict.items() if key != "future"}
+    )
+
+
+def _copy_future_state(source: Future, target: Future):
+    """
+    Callback to copy the state of a completed future object to a future object of an identical task.
+
+    Args:
+        source (Future): completed future object
+        target (Future): future object of the identical task
+    """
+    if source.cancelled():
+        target.cancel()
+    elif target.set_running_or_notify_cancel():
+        if source.exception() is not None:
+            target.set_exception(source.exception())
+        else:
+            target.set_result(source.result())
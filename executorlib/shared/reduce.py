@@ -0,0 +1,78 @@
+from typing import Any, Callable, Optional, Union
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def reduce_output(
+    output: Any,
+    reduce: Optional[Union[str, Callable]],
+    comm,
+    chunk: bool = False,
+) -> Any:
+    """
+    Combine the outputs of the MPI ranks on rank 0, before the result is communicated to the executor. By default,
+    the outputs of all ranks are gathered in a list. Alternatively, only the output of rank 0 is returned ("root"),
+    the outputs are reduced by MPI ("sum", "max" or "min") or they are reduced by a user defined function, which
+    combines two outputs and is applied in a tree by mpi4py. Numeric numpy arrays with the same shape and data type
+    on all ranks are reduced with Reduce() on their buffers without pickling them. This function has to be called by
+    all ranks of the communicator.
+
+    Args:
+        output: output of the function on the current rank, a list of outputs for a chunk of function calls
+        reduce (str, callable): reduction of the outputs, either None or "gather", "root", "sum", "max", "min" or a
+                                function with two arguments
+        comm (mpi4py.MPI.Comm): MPI communicator with the root rank 0
+        chunk (bool): the output is a list with the output of each function call of a chunk
+
+    Returns:
+        object: combined output on rank 0, None on the other ranks
+    """
+    if reduce is None or reduce == "gather":
+        output_lst = comm.gather(output, root=0)
+        if comm.Get_rank() == 0 and chunk:
+            # Reorder the results from [rank][call] to [call][rank]
+            return [list(reply) for reply in zip(*output_lst)]
+        return output_lst
+    elif reduce == "root":
+        return output if comm.Get_rank() == 0 else None
+    elif chunk:
+        return [_reduce_object(obj=obj, reduce=reduce, comm=comm) for obj in output]
+    else:
+        return _reduce_object(obj=output, reduce=reduce, comm=comm)
+
+
+def _reduce_object(obj: Any, reduce: Union[str, Callable], comm) -> Any:
+    """
+    Reduce the output of a single function call over the MPI ranks.
+
+    Args:
+        obj: output of the function on the current rank
+        reduce (str, callable): "sum", "max", "min" or a function with two arguments
+        comm (mpi4py.MPI.Comm): MPI communicator with the root rank 0
+
+    Returns:
+        object: reduced output on rank 0, None on the other ranks
+    """
+    from mpi4py import MPI
+
+    if callable(reduce):
+        return comm.reduce(obj, op=reduce, root=0)
+    op = {"sum": MPI.SUM, "max": MPI.MAX, "min": MPI.MIN}[reduce]
+    if np is not None and isinstance(obj, np.ndarray) and not obj.dtype.hasobject:
+        layout = (obj.shape, obj.dtype.str)
+    else:
+        layout = None
+    # All ranks have to agree on the reduction, so the buffers are only used if the layouts match
+    layout_lst = comm.allgather(layout)
+    if layout is not None and all(item == layout for item in layout_lst):
+        send_array = np.ascontiguousarray(obj)
+        if comm.Get_rank() == 0:
+            receive_array = np.empty_like(send_array)
+        else:
+            receive_array = None
+        comm.Reduce(send_array, receive_array, op=op, root=0)
+        return receive_array
+    return comm.reduce(obj, op=op, root=0)
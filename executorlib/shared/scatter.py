@@ -0,0 +1,232 @@
+from typing import Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Largest count of a message in MPI, which uses C integers
+_INT_MAX = 2**31 - 1
+
+
+class Scatter:
+    """
+    Mark an argument of an MPI parallel function as distributed over the MPI ranks. Rather than broadcasting the whole
+    array to every rank, the array is split into nearly equal parts along the given axis, following numpy.array_split(),
+    and each rank receives only its own part. When the function is executed by a single process, it receives the whole
+    array.
+
+    Args:
+        array (numpy.ndarray): array to distribute over the MPI ranks
+        axis (int): axis along which the array is split - default is 0
+    """
+
+    def __init__(self, array, axis: int = 0):
+        if np is None:
+            raise ImportError(
+                "The Scatter argument requires the numpy package. Install it using: pip install numpy"
+            )
+        self.array = np.asarray(array)
+        self.axis = axis if axis >= 0 else self.array.ndim + axis
+        if not 0 <= self.axis < self.array.ndim:
+            raise ValueError(
+                "The axis "
+                + str(axis)
+                + " is out of bounds for an array of dimension "
+                + str(self.array.ndim)
+                + "."
+            )
+
+
+class _ScatterSlot:
+    """
+    Placeholder for a Scatter argument in the task dictionary which is broadcasted to all MPI ranks. It contains the
+    shape and the data type of the array, so each rank can allocate the memory for its part before it is received.
+
+    Args:
+        index (int): index of the array in the list of scattered arrays
+        shape (tuple): shape of the array
+        dtype (numpy.dtype): data type of the array
+        axis (int): axis along which the array is split
+    """
+
+    def __init__(self, index: int, shape: tuple, dtype, axis: int):
+        self.index = index
+        self.shape = shape
+        self.dtype = dtype
+        self.axis = axis
+
+
+def split_scatter_arguments(input_dict: dict) -> Tuple[dict, list]:
+    """
+    Replace the Scatter arguments of a task by placeholders on the root rank, so the arrays are not broadcasted.
+
+    Args:
+        input_dict (dict): task dictionary with the keys "fn", "args" and "kwargs"
+
+    Returns:
+        dict, list: task dictionary with placeholders and the list of arrays to scatter
+    """
+    array_lst = []
+
+    def replace(arg):
+        if _is_scatter(arg=arg):
+            array_lst.append(arg.array)
+            return _ScatterSlot(
+                index=len(array_lst) - 1,
+                shape=arg.array.shape,
+                dtype=arg.array.dtype,
+                axis=arg.axis,
+            )
+        return arg
+
+    if _has_arguments(input_dict=input_dict):
+        input_dict["args"] = [replace(arg) for arg in input_dict["args"]]
+        input_dict["kwargs"] = {
+            key: replace(arg) for key, arg in input_dict["kwargs"].items()
+        }
+    return input_dict, array_lst
+
+
+def scatter_arguments(input_dict: dict, array_lst: Optional[list], comm) -> dict:
+    """
+    Distribute the arrays of the Scatter arguments over the MPI ranks and replace the placeholders by the part of each
+    rank. The buffers of numeric arrays are sent with Scatterv() without pickling them. This function has to be called
+    by all ranks of the communicator.
+
+    Args:
+        input_dict (dict): task dictionary with placeholders, broadcasted to all ranks
+        array_lst (list): arrays to scatter on the root rank, None on the other ranks
+        comm (mpi4py.MPI.Comm): MPI communicator with the root rank 0
+
+    Returns:
+        dict: task dictionary with the part of each rank as arguments
+    """
+    if _has_arguments(input_dict=input_dict):
+        input_dict["args"] = [
+            (
+                _scatter_slot(slot=arg, array_lst=array_lst, comm=comm)
+                if isinstance(arg, _ScatterSlot)
+                else arg
+            )
+            for arg in input_dict["args"]
+        ]
+        input_dict["kwargs"] = {
+            key: (
+                _scatter_slot(slot=arg, array_lst=array_lst, comm=comm)
+                if isinstance(arg, _ScatterSlot)
+                else arg
+            )
+            for key, arg in input_dict["kwargs"].items()
+        }
+    return input_dict
+
+
+def resolve_scatter_arguments(input_dict: dict) -> dict:
+    """
+    Replace the Scatter arguments by their whole arrays, for functions which are executed by a single process.
+
+    Args:
+        input_dict (dict): task dictionary with the keys "fn", "args" and "kwargs"
+
+    Returns:
+        dict: task dictionary without Scatter arguments
+    """
+    if _has_arguments(input_dict=input_dict):
+        input_dict["args"] = [
+            arg.array if _is_scatter(arg=arg) else arg for arg in input_dict["args"]
+        ]
+        input_dict["kwargs"] = {
+            key: arg.array if _is_scatter(arg=arg) else arg
+            for key, arg in input_dict["kwargs"].items()
+        }
+    return input_dict
+
+
+def _is_scatter(arg) -> bool:
+    """
+    Check if an argument is a Scatter object. The executorlib module is pickled by value, so the class of the Scatter
+    objects received by the worker is not identical to the Scatter class imported in the worker and isinstance() fails.
+
+    Args:
+        arg: argument of the function
+
+    Returns:
+        bool: True if the argument is a Scatter object
+    """
+    return (
+        type(arg).__module__ == Scatter.__module__
+        and type(arg).__qualname__ == Scatter.__qualname__
+    )
+
+
+def _has_arguments(input_dict: dict) -> bool:
+    """
+    Check if the task dictionary contains the arguments of a single function call. The arguments of chunks of function
+    calls are not distributed.
+
+    Args:
+        input_dict (dict): task dictionary
+
+    Returns:
+        bool: True if the task dictionary contains the keys "args" and "kwargs" and is not a chunk
+    """
+    return (
+        "args" in input_dict.keys()
+        and "kwargs" in input_dict.keys()
+        and not input_dict.get("chunk", False)
+    )
+
+
+def _scatter_slot(slot: _ScatterSlot, array_lst: Optional[list], comm):
+    """
+    Receive the part of a scattered array on each rank.
+
+    Args:
+        slot (_ScatterSlot): placeholder of the scattered array
+        array_lst (list): arrays to scatter on the root rank, None on the other ranks
+        comm (mpi4py.MPI.Comm): MPI communicator with the root rank 0
+
+    Returns:
+        numpy.ndarray: part of the array of the current rank
+    """
+    from mpi4py import MPI
+
+    rank, size = comm.Get_rank(), comm.Get_size()
+    length_lst = [
+        len(part) for part in np.array_split(np.arange(slot.shape[slot.axis]), size)
+    ]
+    if rank == 0:
+        # The scattered axis is moved to the front, so the part of each rank is a contiguous block of memory
+        send_array = np.ascontiguousarray(
+            np.moveaxis(array_lst[slot.index], slot.axis, 0)
+        )
+    else:
+        send_array = None
+    row_shape = slot.shape[: slot.axis] + slot.shape[slot.axis + 1 :]
+    row_bytes = int(np.prod(row_shape, dtype=int)) * slot.dtype.itemsize
+    if slot.dtype.hasobject or not 0 < row_bytes <= _INT_MAX:
+        part = comm.scatter(
+            np.array_split(send_array, size) if rank == 0 else None, root=0
+        )
+    else:
+        # The counts and displacements of Scatterv() are C integers, so they are given in rows rather than bytes
+        part = np.empty((length_lst[rank],) + row_shape, dtype=slot.dtype)
+        row_type = MPI.BYTE.Create_contiguous(row_bytes).Commit()
+        displacement_lst = [sum(length_lst[:i]) for i in range(size)]
+        comm.Scatterv(
+            (
+                [
+                    send_array.reshape(-1).view(np.uint8),
+                    length_lst,
+                    displacement_lst,
+                    row_type,
+                ]
+                if rank == 0
+                else None
+            ),
+            [part.reshape(-1).view(np.uint8), length_lst[rank], row_type],
+            root=0,
+        )
+        row_type.Free()
+    return np.moveaxis(part, 0, slot.axis)
@@ -0,0 +1,51 @@
+import sys
+from time import time
+
+import cloudpickle
+import numpy as np
+import zmq
+
+from executorlib.shared.communication import interface_receive, interface_send
+
+
+def send_pickle(socket, data):
+    socket.send(cloudpickle.dumps(data))
+
+
+def receive_pickle(socket):
+    return cloudpickle.loads(socket.recv())
+
+
+def run_with_socket(send_funct, receive_funct, size, runs=10):
+    context = zmq.Context()
+    socket_send = context.socket(zmq.PAIR)
+    port = socket_send.bind_to_random_port("tcp://*")
+    socket_receive = context.socket(zmq.PAIR)
+    socket_receive.connect("tcp://localhost:" + str(port))
+    data = {"result": np.random.random(size)}
+    start_time = time()
+    for _ in range(runs):
+        send_funct(socket_send, data)
+        output = receive_funct(socket_receive)
+    stop_time = time()
+    assert np.array_equal(output["result"], data["result"])
+    socket_send.close()
+    socket_receive.close()
+    context.term()
+    return (stop_time - start_time) / runs
+
+
+if __name__ == "__main__":
+    run_mode = sys.argv[1]
+    for size in [10**3, 10**5, 10**7, 10**8]:
+        if run_mode == "pickle":
+            timing = run_with_socket(
+                send_funct=send_pickle, receive_funct=receive_pickle, size=size
+            )
+        elif run_mode == "buffers":
+            timing = run_with_socket(
+                send_funct=interface_send, receive_funct=interface_receive, size=size
+            )
+        else:
+            raise ValueError(run_mode)
+        print(run_mode, size * 8, timing)
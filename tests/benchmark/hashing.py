@@ -0,0 +1,43 @@
+import hashlib
+import re
+import sys
+from time import time
+
+import cloudpickle
+import numpy as np
+
+from executorlib.shared.hashing import get_hash
+
+
+def funct(a, b):
+    return a + b
+
+
+def get_hash_pickle(obj):
+    binary = cloudpickle.dumps(obj)
+    binary_no_ipykernel = re.sub(b"(?<=/ipykernel_)(.*)(?=/)", b"", binary)
+    return str(hashlib.md5(binary_no_ipykernel).hexdigest())
+
+
+def run_hash(hash_funct, size, runs=10):
+    data = {"fn": funct, "args": (np.random.random(size),), "kwargs": {"b": 1}}
+    start_time = time()
+    for _ in range(runs):
+        hash_funct(data)
+    stop_time = time()
+    return (stop_time - start_time) / runs
+
+
+if __name__ == "__main__":
+    run_mode = sys.argv[1]
+    for size in [10**3, 10**5, 10**7]:
+        if run_mode == "pickle":
+            timing = run_hash(hash_funct=get_hash_pickle, size=size)
+        elif run_mode in ["blake2b", "xxhash"]:
+            timing = run_hash(
+                hash_funct=lambda obj: get_hash(obj=obj, algorithm=run_mode),
+                size=size,
+            )
+        else:
+            raise ValueError(run_mode)
+        print(run_mode, size * 8, timing, size * 8 / timing / 10**9, "GB/s")
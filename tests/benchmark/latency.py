@@ -0,0 +1,47 @@
+import shutil
+import sys
+import tempfile
+from time import time
+
+import zmq
+
+from executorlib.shared.communication import interface_receive, interface_send
+
+
+def run_round_trip(transport, runs=10000):
+    context = zmq.Context()
+    socket_send = context.socket(zmq.PAIR)
+    socket_receive = context.socket(zmq.PAIR)
+    ipc_directory = None
+    if transport == "tcp":
+        port = socket_send.bind_to_random_port("tcp://*")
+        socket_receive.connect("tcp://localhost:" + str(port))
+    else:
+        ipc_directory = tempfile.mkdtemp()
+        socket_send.bind("ipc://" + ipc_directory + "/socket")
+        socket_receive.connect("ipc://" + ipc_directory + "/socket")
+    data = {"fn": "calc", "args": (1,), "kwargs": {"j": 2}}
+    start_time = time()
+    for _ in range(runs):
+        interface_send(socket=socket_send, result_dict=data)
+        interface_send(
+            socket=socket_receive, result_dict=interface_receive(socket=socket_receive)
+        )
+        output = interface_receive(socket=socket_send)
+    stop_time = time()
+    assert output == data
+    socket_send.close()
+    socket_receive.close()
+    context.term()
+    if ipc_directory is not None:
+        shutil.rmtree(ipc_directory)
+    return (stop_time - start_time) / runs
+
+
+if __name__ == "__main__":
+    run_mode = sys.argv[1]
+    if run_mode in ["tcp", "ipc"]:
+        timing = run_round_trip(transport=run_mode)
+    else:
+        raise ValueError(run_mode)
+    print(run_mode, timing * 10**6, "us per round trip")
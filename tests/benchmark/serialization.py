@@ -0,0 +1,77 @@
+import pickle
+import sys
+from time import time
+
+import cloudpickle
+import numpy as np
+
+from executorlib.shared.communication import _dumps, _loads
+
+
+def calc(i, j=1):
+    return i + j
+
+
+def get_task_dict_lst():
+    return {
+        "scalar": {"fn": calc, "args": (1,), "kwargs": {"j": 2}},
+        "function_id": {"fn_id": "0" * 32, "args": (1,), "kwargs": {"j": 2}},
+        "array": {"fn": calc, "args": (np.ones(10**5),), "kwargs": {"j": 2}},
+        "nested": {
+            "fn": calc,
+            "args": ([{"a": i, "b": str(i), "c": (i, float(i))} for i in range(1000)],),
+            "kwargs": {},
+        },
+        "result": {"result": [np.ones(100) for _ in range(100)], "task_id": 1},
+        "error": {"error": ValueError("test"), "error_type": "<class 'ValueError'>"},
+    }
+
+
+def run_serialization(dumps_funct, loads_funct, task_dict, runs=1000):
+    start_time = time()
+    for _ in range(runs):
+        buffer_lst = []
+        data = dumps_funct(task_dict, buffer_lst.append)
+        output = loads_funct(data, [buffer.raw() for buffer in buffer_lst])
+    stop_time = time()
+    assert output.keys() == task_dict.keys()
+    return (stop_time - start_time) / runs
+
+
+def dumps_cloudpickle(data, buffer_callback):
+    return cloudpickle.dumps(data, protocol=5, buffer_callback=buffer_callback)
+
+
+def loads_cloudpickle(data, buffers):
+    return cloudpickle.loads(data, buffers=buffers)
+
+
+def dumps_executorlib(data, buffer_callback):
+    return _dumps(data=data, buffer_callback=buffer_callback)
+
+
+def loads_executorlib(data, buffers):
+    return _loads(data=data, buffers=buffers)
+
+
+if __name__ == "__main__":
+    run_mode = sys.argv[1]
+    if run_mode == "cloudpickle":
+        dumps_funct, loads_funct = dumps_cloudpickle, loads_cloudpickle
+    elif run_mode == "pickle":
+        dumps_funct, loads_funct = dumps_executorlib, loads_executorlib
+    else:
+        raise ValueError(run_mode)
+    # The functions of this script are defined in __main__, so they are imported from the installed module instead
+    from serialization import get_task_dict_lst as get_importable_task_dict_lst
+
+    for task_name, task_dict in get_importable_task_dict_lst().items():
+        timing = run_serialization(
+            dumps_funct=dumps_funct, loads_funct=loads_funct, task_dict=task_dict
+        )
+        print(run_mode, task_name, timing * 10**6, "us per message")
+    task_dict = {"fn": lambda i: i, "args": (1,), "kwargs": {}}
+    timing = run_serialization(
+        dumps_funct=dumps_funct, loads_funct=loads_funct, task_dict=task_dict
+    )
+    print(run_mode, "lambda", timing * 10**6, "us per message")
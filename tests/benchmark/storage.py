@@ -0,0 +1,40 @@
+import os
+import shutil
+import sys
+import tempfile
+from time import time
+
+import numpy as np
+
+from executorlib.cache.storage import create_storage, get_output
+
+
+def run_storage(storage, size, runs=100):
+    cache_directory = tempfile.mkdtemp()
+    storage_backend = create_storage(storage=storage, cache_directory=cache_directory)
+    data = np.random.random(size)
+    file_name_lst = [
+        os.path.join(cache_directory, "task_" + str(i) + ".h5out") for i in range(runs)
+    ]
+    start_time = time()
+    for file_name in file_name_lst:
+        storage_backend.dump(file_name=file_name, data_dict={"output": data})
+    write_time = time()
+    for file_name in file_name_lst:
+        _, output = get_output(file_name=file_name)
+    read_time = time()
+    assert np.array_equal(output, data)
+    shutil.rmtree(cache_directory)
+    return (write_time - start_time) / runs, (read_time - write_time) / runs
+
+
+if __name__ == "__main__":
+    run_mode = sys.argv[1]
+    for size in [1, 10**3, 10**5, 10**7]:
+        if run_mode in ["hdf5", "pickle", "sqlite"]:
+            write_timing, read_timing = run_storage(
+                storage=run_mode, size=size, runs=10 if size > 10**5 else 100
+            )
+        else:
+            raise ValueError(run_mode)
+        print(run_mode, size * 8, "write", write_timing, "read", read_timing)
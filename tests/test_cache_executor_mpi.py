@@ -2,15 +2,18 @@ import importlib.util
 import os
 import shutil
 import unittest
+from concurrent.futures import Future
+from queue import Queue
 
 
 try:
     from executorlib import FileExecutor
     from executorlib.cache.shared import execute_tasks_h5, execute_in_subprocess
+    from executorlib.shared.thread import RaisingThread
 
-    skip_h5io_test = False
+    skip_h5py_test = False
 except ImportError:
-    skip_h5io_test = True
+    skip_h5py_test = True
 
 
 skip_mpi4py_test = importlib.util.find_spec("mpi4py") is None
@@ -24,9 +27,17 @@ def mpi_funct(i):
     return i, size, rank
 
 
+def mpi_raise_error(i):
+    from mpi4py import MPI
+
+    if MPI.COMM_WORLD.Get_rank() == 1:
+        raise ValueError(i)
+    return i
+
+
 @unittest.skipIf(
-    skip_h5io_test or skip_mpi4py_test,
-    "h5io or mpi4py are not installed, so the h5io and mpi4py tests are skipped.",
+    skip_h5py_test or skip_mpi4py_test,
+    "h5py or mpi4py are not installed, so the h5py and mpi4py tests are skipped.",
 )
 class TestCacheExecutorMPI(unittest.TestCase):
     def test_executor(self):
@@ -36,6 +47,45 @@ class TestCacheExecutorMPI(unittest.TestCase):
             self.assertEqual(fs1.result(), [(1, 2, 0), (1, 2, 1)])
             self.assertTrue(fs1.done())
 
+    def test_executor_resource_dict(self):
+        with FileExecutor(max_cores=2) as exe:
+            fs1 = exe.submit(mpi_funct, 1, resource_dict={"cores": 2})
+            fs2 = exe.submit(mpi_funct, 2)
+            self.assertEqual(fs1.result(), [(1, 2, 0), (1, 2, 1)])
+            self.assertEqual(fs2.result(), (2, 1, 0))
+
+    def test_executor_function_bundle_error(self):
+        future_lst = [Future() for _ in range(3)]
+        q = Queue()
+        for i, future in enumerate(future_lst):
+            q.put(
+                {
+                    "fn": mpi_raise_error if i == 1 else mpi_funct,
+                    "args": (i,),
+                    "kwargs": {},
+                    "future": future,
+                }
+            )
+        cache_dir = os.path.abspath("cache")
+        os.makedirs(cache_dir, exist_ok=True)
+        process = RaisingThread(
+            target=execute_tasks_h5,
+            kwargs={
+                "future_queue": q,
+                "cache_directory": cache_dir,
+                "execute_function": execute_in_subprocess,
+                "cores_per_worker": 2,
+                "bundle_size": 3,
+            },
+        )
+        process.start()
+        self.assertEqual(future_lst[0].result(), [(0, 2, 0), (0, 2, 1)])
+        with self.assertRaises(ValueError):
+            future_lst[1].result()
+        self.assertEqual(future_lst[2].result(), [(2, 2, 0), (2, 2, 1)])
+        q.put({"shutdown": True, "wait": True})
+        process.join()
+
     def tearDown(self):
         if os.path.exists("cache"):
             shutil.rmtree("cache")
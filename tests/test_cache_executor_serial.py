@@ -2,25 +2,61 @@ from concurrent.futures import Future
 import os
 from queue import Queue
 import shutil
+import subprocess
+import tempfile
+from time import sleep
 import unittest
+from unittest import mock
+
+import numpy as np
 
 from executorlib.shared.thread import RaisingThread
 
 try:
     from executorlib import FileExecutor
-    from executorlib.cache.shared import execute_tasks_h5, execute_in_subprocess
+    from executorlib.cache.shared import (
+        DirectoryWatcher,
+        execute_tasks_h5,
+        execute_in_subprocess,
+    )
 
-    skip_h5io_test = False
+    skip_h5py_test = False
 except ImportError:
-    skip_h5io_test = True
+    skip_h5py_test = True
 
 
 def my_funct(a, b):
     return a + b
 
 
+def raise_error(a):
+    raise ValueError(a)
+
+
+def sleep_one(a):
+    sleep(1)
+    return a
+
+
+def get_pid(i):
+    return i, os.getpid()
+
+
+def execute_without_handle(command, task_dependent_lst=[]):
+    subprocess.Popen(command)
+    return None
+
+
+def get_arrays():
+    return {"a": np.arange(10.0), "b": np.ones(3)}
+
+
+def get_item_type(arrays):
+    return type(arrays).__name__, type(arrays["a"]).__name__, arrays["a"][2]
+
+
 @unittest.skipIf(
-    skip_h5io_test, "h5io is not installed, so the h5io tests are skipped."
+    skip_h5py_test, "h5py is not installed, so the h5py tests are skipped."
 )
 class TestCacheExecutorSerial(unittest.TestCase):
     def test_executor_mixed(self):
@@ -30,6 +66,128 @@ class TestCacheExecutorSerial(unittest.TestCase):
             self.assertEqual(fs1.result(), 3)
             self.assertTrue(fs1.done())
 
+    def test_executor_compression(self):
+        with FileExecutor(compression="zlib") as exe:
+            fs1 = exe.submit(np.zeros, 2**18)
+            self.assertTrue(np.array_equal(fs1.result(), np.zeros(2**18)))
+
+    def test_executor_error(self):
+        with FileExecutor() as exe:
+            fs1 = exe.submit(raise_error, 1)
+            with self.assertRaises(ValueError):
+                fs1.result()
+
+    def test_executor_cache_hit(self):
+        with FileExecutor() as exe:
+            self.assertEqual(exe.submit(my_funct, 1, b=2).result(), 3)
+        with FileExecutor() as exe:
+            fs1 = exe.submit(my_funct, 1, b=2)
+            fs2 = exe.submit(my_funct, 1, b=fs1)
+            self.assertEqual(fs1.result(), 3)
+            self.assertEqual(fs2.result(), 4)
+
+    def test_directory_watcher(self):
+        cache_dir = os.path.abspath("cache")
+        os.makedirs(cache_dir, exist_ok=True)
+        watcher = DirectoryWatcher(directory=cache_dir)
+        with open(os.path.join(cache_dir, "task.h5ready"), "w") as f:
+            f.write("output")
+        os.rename(
+            os.path.join(cache_dir, "task.h5ready"),
+            os.path.join(cache_dir, "task.h5out"),
+        )
+        file_name_set = watcher.read()
+        watcher.close()
+        if file_name_set is not None:
+            self.assertTrue("task.h5out" in file_name_set)
+            self.assertTrue("task.h5ready" in file_name_set)
+        self.assertIsNone(watcher.read())
+
+    def test_directory_watcher_rescan(self):
+        cache_dir = os.path.abspath("cache")
+        os.makedirs(cache_dir, exist_ok=True)
+        watcher = DirectoryWatcher(directory=cache_dir, rescan_interval=0.0)
+        self.assertIsNone(watcher.read())
+        watcher.close()
+
+    def test_executor_function_without_events(self):
+        fs1 = Future()
+        q = Queue()
+        q.put({"fn": my_funct, "args": (), "kwargs": {"a": 1, "b": 2}, "future": fs1})
+        cache_dir = os.path.abspath("cache")
+        os.makedirs(cache_dir, exist_ok=True)
+        with tempfile.TemporaryDirectory() as event_dir:
+            # The watcher observes a different directory, so no events are delivered for the cache directory
+            with mock.patch(
+                "executorlib.cache.shared.DirectoryWatcher",
+                lambda directory, rescan_interval: DirectoryWatcher(
+                    directory=event_dir, rescan_interval=rescan_interval
+                ),
+            ):
+                process = RaisingThread(
+                    target=execute_tasks_h5,
+                    kwargs={
+                        "future_queue": q,
+                        "cache_directory": cache_dir,
+                        "execute_function": execute_without_handle,
+                        "cores_per_worker": 1,
+                        "refresh_rate_max": 0.1,
+                    },
+                )
+                process.start()
+                self.assertEqual(fs1.result(timeout=30), 3)
+                q.put({"shutdown": True, "wait": True})
+                process.join()
+
+    def test_executor_lazy_inputs(self):
+        with FileExecutor(lazy_inputs=True) as exe:
+            fs1 = exe.submit(get_arrays)
+            fs2 = exe.submit(get_item_type, fs1)
+            self.assertEqual(fs2.result(), ("LazyDict", "memmap", 2.0))
+            self.assertTrue(np.array_equal(fs1.result()["a"], np.arange(10.0)))
+
+    def test_executor_dependence_non_blocking(self):
+        with FileExecutor() as exe:
+            fs1 = exe.submit(sleep_one, 1)
+            fs2 = exe.submit(my_funct, 1, b=fs1)
+            fs3 = exe.submit(my_funct, 2, b=2)
+            self.assertEqual(fs3.result(), 4)
+            self.assertFalse(fs1.done())
+            self.assertEqual(fs2.result(), 2)
+
+    def test_executor_dependence_error(self):
+        with FileExecutor() as exe:
+            fs1 = exe.submit(raise_error, 1)
+            fs2 = exe.submit(my_funct, 1, b=fs1)
+            with self.assertRaises(ValueError):
+                fs2.result()
+
+    def test_executor_max_cores(self):
+        with FileExecutor(max_cores=1) as exe:
+            fs1 = exe.submit(sleep_one, 1)
+            fs2 = exe.submit(sleep_one, 2)
+            self.assertEqual(fs1.result(), 1)
+            self.assertFalse(fs2.done())
+            self.assertEqual(fs2.result(), 2)
+
+    def test_executor_max_cores_cancel(self):
+        with FileExecutor(max_cores=1) as exe:
+            fs1 = exe.submit(sleep_one, 1)
+            fs2 = exe.submit(sleep_one, 2)
+            self.assertTrue(fs2.cancel())
+            self.assertEqual(fs1.result(), 1)
+        self.assertTrue(fs2.cancelled())
+        self.assertEqual(
+            len([f for f in os.listdir("cache") if f.endswith(".h5out")]), 1
+        )
+
+    def test_executor_resource_dict(self):
+        with FileExecutor(max_workers=2) as exe:
+            fs1 = exe.submit(my_funct, 1, b=2, resource_dict={"cores": 1})
+            self.assertEqual(fs1.result(), 3)
+            with self.assertRaises(ValueError):
+                exe.submit(my_funct, 1, b=2, resource_dict={"threads_per_core": 2})
+
     def test_executor_dependence_mixed(self):
         with FileExecutor() as exe:
             fs1 = exe.submit(my_funct, 1, b=2)
@@ -59,6 +217,66 @@ class TestCacheExecutorSerial(unittest.TestCase):
         self.assertTrue(fs1.done())
         q.put({"shutdown": True, "wait": True})
 
+    def test_executor_function_bundle(self):
+        future_lst = [Future() for _ in range(3)]
+        q = Queue()
+        for i, future in enumerate(future_lst):
+            q.put({"fn": get_pid, "args": (i,), "kwargs": {}, "future": future})
+        cache_dir = os.path.abspath("cache")
+        os.makedirs(cache_dir, exist_ok=True)
+        process = RaisingThread(
+            target=execute_tasks_h5,
+            kwargs={
+                "future_queue": q,
+                "cache_directory": cache_dir,
+                "execute_function": execute_in_subprocess,
+                "cores_per_worker": 1,
+                "bundle_size": 3,
+            },
+        )
+        process.start()
+        result_lst = [future.result() for future in future_lst]
+        self.assertEqual([i for i, _ in result_lst], [0, 1, 2])
+        self.assertEqual(len({pid for _, pid in result_lst}), 1)
+        self.assertNotEqual(result_lst[0][1], os.getpid())
+        self.assertEqual(
+            len([f for f in os.listdir(cache_dir) if f.endswith(".h5out")]), 3
+        )
+        q.put({"shutdown": True, "wait": True})
+        process.join()
+
+    def test_executor_function_bundle_error(self):
+        future_lst = [Future() for _ in range(3)]
+        q = Queue()
+        for i, future in enumerate(future_lst):
+            q.put(
+                {
+                    "fn": raise_error if i == 1 else get_pid,
+                    "args": (i,),
+                    "kwargs": {},
+                    "future": future,
+                }
+            )
+        cache_dir = os.path.abspath("cache")
+        os.makedirs(cache_dir, exist_ok=True)
+        process = RaisingThread(
+            target=execute_tasks_h5,
+            kwargs={
+                "future_queue": q,
+                "cache_directory": cache_dir,
+                "execute_function": execute_in_subprocess,
+                "cores_per_worker": 1,
+                "bundle_size": 3,
+            },
+        )
+        process.start()
+        self.assertEqual(future_lst[0].result()[0], 0)
+        with self.assertRaises(ValueError):
+            future_lst[1].result()
+        self.assertEqual(future_lst[2].result()[0], 2)
+        q.put({"shutdown": True, "wait": True})
+        process.join()
+
     def test_executor_function_dependence_kwargs(self):
         fs1 = Future()
         fs2 = Future()
@@ -2,9 +2,28 @@ import os
 import shutil
 import unittest
 
+import numpy as np
 
+
+try:
+    import cloudpickle
+    import h5py
+    from executorlib.cache.hdf import (
+        DatasetView,
+        LazyDict,
+        dump,
+        get_output,
+        load,
+    )
+
+    skip_h5py_test = False
+except ImportError:
+    skip_h5py_test = True
+
+# h5io is no longer a dependency, it is only used to test that the cache files written by earlier versions with h5io
+# can still be read and that the new files remain readable with h5io.
 try:
-    from executorlib.cache.hdf import dump, load
+    import h5io
 
     skip_h5io_test = False
 except ImportError:
@@ -16,7 +35,7 @@ def my_funct(a, b):
 
 
 @unittest.skipIf(
-    skip_h5io_test, "h5io is not installed, so the h5io tests are skipped."
+    skip_h5py_test, "h5py is not installed, so the h5py tests are skipped."
 )
 class TestSharedFunctions(unittest.TestCase):
     def test_hdf_mixed(self):
@@ -61,6 +80,152 @@ class TestSharedFunctions(unittest.TestCase):
         self.assertEqual(data_dict["args"], ())
         self.assertEqual(data_dict["kwargs"], {"a": a, "b": b})
 
+    def test_hdf_compression(self):
+        cache_directory = os.path.abspath("cache")
+        os.makedirs(cache_directory, exist_ok=True)
+        file_name = os.path.join(cache_directory, "test_compression.h5")
+        a = np.zeros(2**18)
+        dump(
+            file_name=file_name,
+            data_dict={"fn": my_funct, "args": [a], "kwargs": {"b": 1}},
+            compression="zlib",
+        )
+        self.assertLess(os.path.getsize(file_name), a.nbytes)
+        data_dict = load(file_name=file_name)
+        self.assertTrue(np.array_equal(data_dict["args"][0], a))
+        self.assertEqual(data_dict["kwargs"], {"b": 1})
+        dump(file_name=file_name, data_dict={"output": a}, compression="zlib")
+        flag, output = get_output(file_name=file_name)
+        self.assertTrue(flag)
+        self.assertTrue(np.array_equal(output, a))
+
+    def test_hdf_native_arrays(self):
+        cache_directory = os.path.abspath("cache")
+        os.makedirs(cache_directory, exist_ok=True)
+        file_name = os.path.join(cache_directory, "test_native.h5")
+        output = {
+            "b": np.arange(10.0),
+            "a": (np.ones((2, 2), dtype=int), "text", {"c": np.zeros(3, dtype=bool)}),
+            "d": [1, 2],
+        }
+        dump(file_name=file_name, data_dict={"output": output})
+        with h5py.File(file_name, "r") as hdf:
+            self.assertTrue(isinstance(hdf["output/key_b"], h5py.Dataset))
+            self.assertEqual(hdf["output/key_a/idx_0"].dtype, np.dtype(int))
+        flag, result = get_output(file_name=file_name)
+        self.assertTrue(flag)
+        self.assertEqual(list(result.keys()), ["b", "a", "d"])
+        self.assertTrue(np.array_equal(result["b"], output["b"]))
+        self.assertTrue(isinstance(result["a"], tuple))
+        self.assertTrue(np.array_equal(result["a"][0], output["a"][0]))
+        self.assertEqual(result["a"][1], "text")
+        self.assertTrue(np.array_equal(result["a"][2]["c"], output["a"][2]["c"]))
+        self.assertEqual(result["d"], [1, 2])
+        _, result = get_output(file_name=file_name, mmap_mode="r")
+        self.assertTrue(isinstance(result["b"], np.memmap))
+        self.assertTrue(np.array_equal(result["b"], output["b"]))
+
+    def test_hdf_zero_dimensional_arrays(self):
+        cache_directory = os.path.abspath("cache")
+        os.makedirs(cache_directory, exist_ok=True)
+        file_name = os.path.join(cache_directory, "test_zero_dimensional.h5")
+        for output in [np.array(4.0), [np.array(4), 1]]:
+            with self.subTest(output=output):
+                dump(file_name=file_name, data_dict={"output": output})
+                for kwargs in [{}, {"mmap_mode": "r"}, {"lazy": True}]:
+                    _, result = get_output(file_name=file_name, **kwargs)
+                    if isinstance(output, list):
+                        self.assertEqual(result[1], 1)
+                        result, output_array = result[0], output[0]
+                    else:
+                        output_array = output
+                    self.assertIs(type(result), np.ndarray)
+                    self.assertEqual(result.ndim, 0)
+                    self.assertEqual(result.dtype, output_array.dtype)
+                    self.assertEqual(result, output_array)
+                os.remove(file_name)
+
+    def test_hdf_native_arrays_compression(self):
+        cache_directory = os.path.abspath("cache")
+        os.makedirs(cache_directory, exist_ok=True)
+        file_name = os.path.join(cache_directory, "test_native_compression.h5")
+        a = np.zeros(2**18)
+        dump(file_name=file_name, data_dict={"output": a}, compression="zlib")
+        with h5py.File(file_name, "r") as hdf:
+            self.assertEqual(hdf["output"].compression, "gzip")
+            self.assertIsNotNone(hdf["output"].chunks)
+        _, result = get_output(file_name=file_name, mmap_mode="r")
+        self.assertFalse(isinstance(result, np.memmap))
+        self.assertTrue(np.array_equal(result, a))
+
+    def test_hdf_lazy(self):
+        cache_directory = os.path.abspath("cache")
+        os.makedirs(cache_directory, exist_ok=True)
+        file_name = os.path.join(cache_directory, "test_lazy.h5")
+        a = np.zeros((2**9, 2**9))
+        a[1] = 1.0
+        output = {"a": a, "b": {"c": np.arange(3), "d": "text"}, "e": 1}
+        dump(file_name=file_name, data_dict={"output": output}, compression="zlib")
+        flag, result = get_output(file_name=file_name, lazy=True)
+        self.assertTrue(flag)
+        self.assertTrue(isinstance(result, LazyDict))
+        self.assertEqual(list(result.keys()), ["a", "b", "e"])
+        self.assertEqual(len(result), 3)
+        self.assertTrue(isinstance(result["a"], DatasetView))
+        self.assertEqual(result["a"].shape, a.shape)
+        self.assertEqual(result["a"].dtype, a.dtype)
+        self.assertTrue(np.array_equal(result["a"][1, :4], np.ones(4)))
+        self.assertTrue(np.array_equal(np.asarray(result["a"]), a))
+        self.assertTrue(isinstance(result["b"], LazyDict))
+        self.assertTrue(np.array_equal(result["b"]["c"], np.arange(3)))
+        self.assertEqual(result["b"]["d"], "text")
+        self.assertEqual(result["e"], 1)
+        with self.assertRaises(KeyError):
+            result["f"]
+        view = cloudpickle.loads(cloudpickle.dumps(result["a"]))
+        self.assertTrue(np.array_equal(view[1], np.ones(2**9)))
+        for view_open in [view, result["a"], result["b"]["c"]]:
+            view_open.close()
+        # The file can be written again once the views are closed
+        dump(file_name=file_name, data_dict={"error": ValueError("test")})
+        self.assertTrue(np.array_equal(view[1], np.ones(2**9)))
+        view.close()
+        file_name = os.path.join(cache_directory, "test_lazy_mmap.h5")
+        dump(file_name=file_name, data_dict={"output": a})
+        _, result = get_output(file_name=file_name, lazy=True)
+        self.assertTrue(isinstance(result, np.memmap))
+        self.assertTrue(np.array_equal(result, a))
+
+    def test_hdf_legacy_layout(self):
+        cache_directory = os.path.abspath("cache")
+        os.makedirs(cache_directory, exist_ok=True)
+        file_name = os.path.join(cache_directory, "test_legacy.h5")
+        with h5py.File(file_name, "a") as hdf:
+            # Layout of the cache files written by earlier versions with h5io.write_hdf5()
+            hdf.create_dataset("output", data=np.void(cloudpickle.dumps(3)))
+            hdf["output"].attrs["TITLE"] = "void"
+        self.assertEqual(get_output(file_name=file_name), (True, 3))
+
+    @unittest.skipIf(
+        skip_h5io_test, "h5io is not installed, so the h5io tests are skipped."
+    )
+    def test_hdf_h5io_compatibility(self):
+        cache_directory = os.path.abspath("cache")
+        os.makedirs(cache_directory, exist_ok=True)
+        file_name = os.path.join(cache_directory, "test_h5io.h5")
+        with h5py.File(file_name, "a") as hdf:
+            h5io.write_hdf5(
+                fname=hdf,
+                data=np.void(cloudpickle.dumps(3)),
+                overwrite="update",
+                title="output",
+            )
+        self.assertEqual(get_output(file_name=file_name), (True, 3))
+        dump(file_name=file_name, data_dict={"output": (np.ones(2), 1)})
+        with h5py.File(file_name, "r") as hdf:
+            result = h5io.read_hdf5(fname=hdf, title="output", slash="ignore")
+        self.assertTrue(np.array_equal(result[0], np.ones(2)))
+
     def tearDown(self):
         if os.path.exists("cache"):
             shutil.rmtree("cache")
@@ -0,0 +1,175 @@
+import os
+import shutil
+import sqlite3
+import unittest
+
+from executorlib.cache.index import CacheIndex
+
+try:
+    from executorlib import FileExecutor
+
+    skip_h5py_test = False
+except ImportError:
+    skip_h5py_test = True
+
+
+def my_funct(a, b):
+    return a + b
+
+
+class TestCacheIndex(unittest.TestCase):
+    def setUp(self):
+        self.cache_directory = os.path.abspath("cache")
+        os.makedirs(self.cache_directory, exist_ok=True)
+        for file_name in ["task_a.h5out", "task_b.h5in", "task_c.h5ready"]:
+            open(os.path.join(self.cache_directory, file_name), "w").close()
+
+    def test_index_directory(self):
+        cache_index = CacheIndex(cache_directory=self.cache_directory)
+        self.assertTrue("task_a" in cache_index)
+        self.assertFalse("task_b" in cache_index)
+        self.assertFalse("task_c" in cache_index)
+        cache_index.add(task_key="task_b")
+        self.assertTrue("task_b" in cache_index)
+        cache_index.remove(task_key="task_a")
+        self.assertFalse("task_a" in cache_index)
+        self.assertFalse(
+            os.path.exists(os.path.join(self.cache_directory, "manifest.sqlite"))
+        )
+
+    def test_index_manifest(self):
+        cache_index_1 = CacheIndex(cache_directory=self.cache_directory, manifest=True)
+        cache_index_2 = CacheIndex(cache_directory=self.cache_directory, manifest=True)
+        self.assertTrue("task_a" in cache_index_2)
+        cache_index_1.add(task_key="task_b")
+        self.assertTrue("task_b" in cache_index_2)
+        cache_index_1.remove(task_key="task_a")
+        cache_index_1.close()
+        cache_index_2.close()
+        cache_index_3 = CacheIndex(cache_directory=self.cache_directory, manifest=True)
+        self.assertFalse("task_a" in cache_index_3)
+        self.assertTrue("task_b" in cache_index_3)
+        cache_index_3.close()
+
+    def test_index_eviction_lru(self):
+        os.remove(os.path.join(self.cache_directory, "task_a.h5out"))
+        for i, task_key in enumerate(["task_d", "task_e", "task_f"]):
+            file_name = os.path.join(self.cache_directory, task_key + ".h5out")
+            with open(file_name, "wb") as f:
+                f.write(b"0" * 100)
+            os.utime(file_name, (1000 + i, 1000 + i))
+        cache_index = CacheIndex(cache_directory=self.cache_directory, max_bytes=250)
+        self.assertEqual(cache_index.stats()["bytes"], 200)
+        self.assertFalse("task_d" in cache_index)
+        self.assertFalse(
+            os.path.exists(os.path.join(self.cache_directory, "task_d.h5out"))
+        )
+        cache_index.hit(task_key="task_e", load_time=0.5)
+        for task_key in ["task_g", "task_h"]:
+            with open(
+                os.path.join(self.cache_directory, task_key + ".h5out"), "wb"
+            ) as f:
+                f.write(b"0" * 100)
+            cache_index.pin(task_key="task_e")
+            cache_index.add(task_key=task_key)
+        self.assertFalse("task_f" in cache_index)
+        self.assertFalse("task_g" in cache_index)
+        self.assertTrue("task_e" in cache_index)
+        self.assertTrue("task_h" in cache_index)
+        cache_index.unpin(task_key="task_e")
+        cache_index.unpin(task_key="task_e")
+        cache_index.miss()
+        stats_dict = cache_index.stats()
+        self.assertEqual(stats_dict["hits"], 1)
+        self.assertEqual(stats_dict["misses"], 1)
+        self.assertEqual(stats_dict["hit_rate"], 0.5)
+        self.assertEqual(stats_dict["bytes_saved"], 100)
+        self.assertEqual(stats_dict["average_load_time"], 0.5)
+        self.assertEqual(stats_dict["evictions"], 3)
+        self.assertEqual(stats_dict["entries"], 2)
+        self.assertEqual(stats_dict["bytes"], 200)
+
+    def test_index_eviction_lfu(self):
+        for task_key in ["task_d", "task_e"]:
+            with open(
+                os.path.join(self.cache_directory, task_key + ".h5out"), "wb"
+            ) as f:
+                f.write(b"0" * 100)
+        cache_index = CacheIndex(cache_directory=self.cache_directory, manifest=True)
+        cache_index.hit(task_key="task_d")
+        cache_index.hit(task_key="task_d")
+        cache_index.hit(task_key="task_e")
+        cache_index.close()
+        cache_index = CacheIndex(
+            cache_directory=self.cache_directory,
+            manifest=True,
+            max_bytes=150,
+            eviction_policy="lfu",
+        )
+        self.assertFalse("task_a" in cache_index)
+        self.assertTrue("task_d" in cache_index)
+        self.assertFalse("task_e" in cache_index)
+        cache_index.close()
+        with self.assertRaises(ValueError):
+            CacheIndex(cache_directory=self.cache_directory, eviction_policy="fifo")
+
+    def test_index_manifest_migration(self):
+        connection = sqlite3.connect(
+            os.path.join(self.cache_directory, "manifest.sqlite")
+        )
+        with connection:
+            connection.execute("CREATE TABLE task (task_key TEXT PRIMARY KEY)")
+            connection.execute("INSERT INTO task (task_key) VALUES ('task_a')")
+        connection.close()
+        cache_index = CacheIndex(cache_directory=self.cache_directory, manifest=True)
+        self.assertTrue("task_a" in cache_index)
+        self.assertEqual(cache_index.stats()["bytes"], 0)
+        cache_index.hit(task_key="task_a")
+        cache_index.close()
+
+    def tearDown(self):
+        if os.path.exists("cache"):
+            shutil.rmtree("cache")
+
+
+@unittest.skipIf(
+    skip_h5py_test, "h5py is not installed, so the h5py tests are skipped."
+)
+class TestCacheIndexExecutor(unittest.TestCase):
+    def test_executor_manifest(self):
+        with FileExecutor(cache_manifest=True) as exe:
+            self.assertEqual(exe.submit(my_funct, 1, b=2).result(), 3)
+        self.assertTrue(os.path.exists(os.path.join("cache", "manifest.sqlite")))
+        with FileExecutor(cache_manifest=True) as exe:
+            self.assertEqual(exe.submit(my_funct, 1, b=2).result(), 3)
+
+    def test_executor_stats(self):
+        with FileExecutor() as exe:
+            self.assertEqual(exe.submit(my_funct, 1, b=2).result(), 3)
+            self.assertEqual(exe.submit(my_funct, 1, b=2).result(), 3)
+            stats_dict = exe.stats()
+        self.assertEqual(stats_dict["hits"], 1)
+        self.assertEqual(stats_dict["misses"], 1)
+        self.assertEqual(stats_dict["entries"], 1)
+        self.assertTrue(stats_dict["bytes_saved"] > 0)
+
+    def test_executor_max_bytes(self):
+        with FileExecutor(cache_max_bytes=1) as exe:
+            fs1 = exe.submit(my_funct, 1, b=2)
+            fs2 = exe.submit(my_funct, 1, b=fs1)
+            self.assertEqual(fs2.result(), 4)
+            self.assertEqual(fs1.result(), 3)
+        self.assertEqual([f for f in os.listdir("cache") if f.endswith(".h5out")], [])
+
+    def test_executor_removed_output(self):
+        with FileExecutor(cache_manifest=True) as exe:
+            self.assertEqual(exe.submit(my_funct, 1, b=2).result(), 3)
+        for file_name in os.listdir("cache"):
+            if file_name.endswith(".h5out"):
+                os.remove(os.path.join("cache", file_name))
+        with FileExecutor(cache_manifest=True) as exe:
+            self.assertEqual(exe.submit(my_funct, 1, b=2).result(), 3)
+
+    def tearDown(self):
+        if os.path.exists("cache"):
+            shutil.rmtree("cache")
@@ -1,4 +1,6 @@
 from concurrent.futures import Future
+import contextlib
+import io
 import os
 import shutil
 import unittest
@@ -11,19 +13,23 @@ try:
         _check_task_output,
         _serialize_funct_h5,
     )
-    from executorlib.cache.shared import execute_task_in_file
+    from executorlib.cache.shared import execute_task_bundle, execute_task_in_file
 
-    skip_h5io_test = False
+    skip_h5py_test = False
 except ImportError:
-    skip_h5io_test = True
+    skip_h5py_test = True
 
 
 def my_funct(a, b):
     return a + b
 
 
+def raise_error(a):
+    raise ValueError(a)
+
+
 @unittest.skipIf(
-    skip_h5io_test, "h5io is not installed, so the h5io tests are skipped."
+    skip_h5py_test, "h5py is not installed, so the h5py tests are skipped."
 )
 class TestSharedFunctions(unittest.TestCase):
     def test_execute_function_mixed(self):
@@ -95,6 +101,26 @@ class TestSharedFunctions(unittest.TestCase):
         self.assertTrue(future_file_obj.done())
         self.assertEqual(future_file_obj.result(), 3)
 
+    def test_execute_task_bundle(self):
+        cache_directory = os.path.abspath("cache")
+        os.makedirs(cache_directory, exist_ok=True)
+        file_name_lst = []
+        for fn, args in [(raise_error, (1,)), (my_funct, (1, 2))]:
+            task_key, data_dict = _serialize_funct_h5(fn, *args)
+            file_name = os.path.join(cache_directory, task_key + ".h5in")
+            dump(file_name=file_name, data_dict=data_dict)
+            file_name_lst.append(file_name)
+        with contextlib.redirect_stderr(io.StringIO()):
+            self.assertFalse(execute_task_bundle(file_name_lst=file_name_lst))
+        self.assertFalse(
+            os.path.exists(os.path.splitext(file_name_lst[0])[0] + ".h5out")
+        )
+        future_file_obj = FutureItem(
+            file_name=os.path.splitext(file_name_lst[1])[0] + ".h5out"
+        )
+        self.assertTrue(future_file_obj.done())
+        self.assertEqual(future_file_obj.result(), 3)
+
     def tearDown(self):
         if os.path.exists("cache"):
             shutil.rmtree("cache")
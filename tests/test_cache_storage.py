@@ -0,0 +1,164 @@
+import os
+import shutil
+import unittest
+
+import numpy as np
+
+
+try:
+    from executorlib import FileExecutor
+    from executorlib.cache.storage import (
+        HDF5Storage,
+        PickleStorage,
+        SqliteStorage,
+        create_storage,
+        dump,
+        get_error,
+        get_output,
+        get_storage,
+        load,
+        remove,
+    )
+
+    skip_h5py_test = False
+except ImportError:
+    skip_h5py_test = True
+
+
+def my_funct(a, b):
+    return a + b
+
+
+def raise_error(a):
+    raise ValueError(a)
+
+
+@unittest.skipIf(
+    skip_h5py_test, "h5py is not installed, so the h5py tests are skipped."
+)
+class TestStorage(unittest.TestCase):
+    def setUp(self):
+        self.cache_directory = os.path.abspath("cache")
+        os.makedirs(self.cache_directory, exist_ok=True)
+
+    def test_storage_roundtrip(self):
+        for storage in ["hdf5", "pickle", "sqlite"]:
+            for compression in [None, "zlib"]:
+                with self.subTest(storage=storage, compression=compression):
+                    file_name = os.path.join(
+                        self.cache_directory,
+                        "roundtrip_" + storage + "_" + str(compression) + ".h5in",
+                    )
+                    a = np.arange(10000, dtype=float)
+                    dump(
+                        file_name=file_name,
+                        data_dict={"fn": my_funct, "args": [a], "kwargs": {"b": 2}},
+                        compression=compression,
+                        storage=create_storage(
+                            storage=storage, cache_directory=self.cache_directory
+                        ),
+                    )
+                    data_dict = load(file_name=file_name)
+                    self.assertEqual(data_dict["fn"].__name__, my_funct.__name__)
+                    self.assertTrue(np.array_equal(data_dict["args"][0], a))
+                    self.assertEqual(data_dict["kwargs"], {"b": 2})
+                    self.assertEqual(get_output(file_name=file_name), (False, None))
+                    dump(file_name=file_name, data_dict={"output": a + 2})
+                    flag, output = get_output(file_name=file_name)
+                    self.assertTrue(flag)
+                    self.assertTrue(np.array_equal(output, a + 2))
+                    self.assertIsNone(get_error(file_name=file_name))
+                    remove(file_name=file_name)
+                    self.assertFalse(os.path.exists(file_name))
+
+    def test_storage_detection(self):
+        self.assertIsInstance(
+            create_storage(storage="hdf5", cache_directory=self.cache_directory),
+            HDF5Storage,
+        )
+        with self.assertRaises(ValueError):
+            create_storage(storage="json", cache_directory=self.cache_directory)
+        for storage, storage_class in [
+            ("hdf5", HDF5Storage),
+            ("pickle", PickleStorage),
+            ("sqlite", SqliteStorage),
+        ]:
+            file_name = os.path.join(self.cache_directory, storage + ".h5err")
+            dump(
+                file_name=file_name,
+                data_dict={"error": ValueError(storage)},
+                storage=create_storage(
+                    storage=storage, cache_directory=self.cache_directory
+                ),
+            )
+            self.assertIsInstance(get_storage(file_name=file_name), storage_class)
+            error = get_error(file_name=file_name)
+            self.assertIsInstance(error, ValueError)
+            self.assertEqual(str(error), storage)
+
+    def test_pickle_mmap(self):
+        file_name = os.path.join(self.cache_directory, "mmap.h5out")
+        a = np.arange(10000, dtype=float)
+        storage = PickleStorage()
+        storage.dump(file_name=file_name, data_dict={"output": {"a": a, "b": 1}})
+        _, output = storage.get_output(file_name=file_name, lazy=True)
+        self.assertTrue(np.array_equal(output["a"], a))
+        self.assertFalse(output["a"].flags.writeable)
+        _, output = storage.get_output(file_name=file_name)
+        self.assertTrue(output["a"].flags.writeable)
+        output["a"][0] = 1.0
+        _, output = storage.get_output(file_name=file_name)
+        self.assertEqual(output["a"][0], 0.0)
+
+    def test_sqlite_single_database(self):
+        storage = create_storage(storage="sqlite", cache_directory=self.cache_directory)
+        for i in range(10):
+            storage.dump(
+                file_name=os.path.join(self.cache_directory, str(i) + ".h5out"),
+                data_dict={"output": i},
+            )
+        self.assertTrue(
+            os.path.exists(os.path.join(self.cache_directory, "storage.sqlite"))
+        )
+        self.assertEqual(
+            [
+                get_output(
+                    file_name=os.path.join(self.cache_directory, str(i) + ".h5out")
+                )[1]
+                for i in range(10)
+            ],
+            list(range(10)),
+        )
+
+    def test_executor_storage(self):
+        for storage in ["pickle", "sqlite"]:
+            with self.subTest(storage=storage):
+                with FileExecutor(storage=storage) as exe:
+                    fs1 = exe.submit(my_funct, np.ones(1000), b=1)
+                    fs2 = exe.submit(my_funct, fs1, b=1)
+                    fs3 = exe.submit(raise_error, storage)
+                    self.assertTrue(np.array_equal(fs2.result(), 3 * np.ones(1000)))
+                    with self.assertRaises(ValueError):
+                        fs3.result()
+                with FileExecutor(storage=storage) as exe:
+                    self.assertEqual(exe.submit(my_funct, 1, b=2).result(), 3)
+                    self.assertTrue(
+                        np.array_equal(
+                            exe.submit(my_funct, np.ones(1000), b=1).result(),
+                            2 * np.ones(1000),
+                        )
+                    )
+                    self.assertEqual(exe.stats()["hits"], 1)
+                shutil.rmtree(self.cache_directory)
+
+    def test_executor_storage_persistent_workers(self):
+        with FileExecutor(storage="pickle", persistent_workers=1) as exe:
+            fs1 = exe.submit(my_funct, 1, b=2)
+            fs2 = exe.submit(raise_error, 1)
+            self.assertEqual(fs1.result(), 3)
+            with self.assertRaises(ValueError):
+                fs2.result()
+
+    def tearDown(self):
+        if os.path.exists("cache"):
+            shutil.rmtree("cache")
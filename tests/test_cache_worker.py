@@ -0,0 +1,141 @@
+import os
+import shutil
+import unittest
+
+
+try:
+    from executorlib import FileExecutor
+    from executorlib.cache.hdf import dump, get_error
+    from executorlib.cache.shared import FutureItem, _serialize_funct_h5
+    from executorlib.cache.worker import (
+        MAX_TASK_CRASHES,
+        _claim_task,
+        _execute_claimed_task,
+        _recover_claimed_tasks,
+    )
+
+    skip_h5py_test = False
+except ImportError:
+    skip_h5py_test = True
+
+
+def my_funct(a, b):
+    return a + b
+
+
+def get_pid(i):
+    return i, os.getpid()
+
+
+def raise_error(a):
+    raise ValueError(a)
+
+
+def exit_worker(a):
+    os._exit(a)
+
+
+@unittest.skipIf(
+    skip_h5py_test, "h5py is not installed, so the h5py tests are skipped."
+)
+class TestCacheWorker(unittest.TestCase):
+    def test_executor_persistent_workers(self):
+        with FileExecutor(persistent_workers=2) as exe:
+            future_lst = [exe.submit(get_pid, i) for i in range(6)]
+            fs1 = exe.submit(my_funct, 1, b=2)
+            fs2 = exe.submit(my_funct, 1, b=fs1)
+            result_lst = [future.result() for future in future_lst]
+            self.assertEqual([i for i, _ in result_lst], list(range(6)))
+            self.assertTrue(len({pid for _, pid in result_lst}) <= 2)
+            self.assertNotIn(os.getpid(), {pid for _, pid in result_lst})
+            self.assertEqual(fs2.result(), 4)
+        self.assertEqual(os.listdir(os.path.join("cache", "queue")), [])
+
+    def test_executor_persistent_workers_error(self):
+        with FileExecutor(persistent_workers=1) as exe:
+            fs1 = exe.submit(raise_error, 1)
+            with self.assertRaises(ValueError):
+                fs1.result()
+
+    def test_claim_and_recover(self):
+        cache_directory = os.path.abspath("cache")
+        queue_directory = os.path.join(cache_directory, "queue")
+        claim_directory = os.path.join(queue_directory, "worker_crashed")
+        os.makedirs(claim_directory)
+        with open(os.path.join(claim_directory, "lock"), "w"):
+            pass
+        task_key, data_dict = _serialize_funct_h5(my_funct, 1, b=2)
+        dump(
+            file_name=os.path.join(queue_directory, task_key + ".h5in"),
+            data_dict=data_dict,
+        )
+        file_name = _claim_task(
+            queue_directory=queue_directory, claim_directory=claim_directory
+        )
+        self.assertEqual(file_name, os.path.join(claim_directory, task_key + ".h5in"))
+        self.assertIsNone(
+            _claim_task(
+                queue_directory=queue_directory, claim_directory=claim_directory
+            )
+        )
+        _recover_claimed_tasks(
+            queue_directory=queue_directory, cache_directory=cache_directory
+        )
+        self.assertFalse(os.path.exists(claim_directory))
+        self.assertEqual(
+            sorted(os.listdir(queue_directory)),
+            [task_key + ".crashes", task_key + ".h5in"],
+        )
+        os.makedirs(claim_directory)
+        file_name = _claim_task(
+            queue_directory=queue_directory, claim_directory=claim_directory
+        )
+        _execute_claimed_task(file_name=file_name, cache_directory=cache_directory)
+        future_file_obj = FutureItem(
+            file_name=os.path.join(cache_directory, task_key + ".h5out")
+        )
+        self.assertTrue(future_file_obj.done())
+        self.assertEqual(future_file_obj.result(), 3)
+        self.assertEqual(
+            os.listdir(queue_directory), [os.path.basename(claim_directory)]
+        )
+
+    def test_recover_crash_limit(self):
+        cache_directory = os.path.abspath("cache")
+        queue_directory = os.path.join(cache_directory, "queue")
+        claim_directory = os.path.join(queue_directory, "worker_crashed")
+        task_key, data_dict = _serialize_funct_h5(exit_worker, 1)
+        os.makedirs(queue_directory)
+        dump(
+            file_name=os.path.join(queue_directory, task_key + ".h5in"),
+            data_dict=data_dict,
+        )
+        for _ in range(MAX_TASK_CRASHES):
+            os.makedirs(claim_directory)
+            self.assertIsNotNone(
+                _claim_task(
+                    queue_directory=queue_directory, claim_directory=claim_directory
+                )
+            )
+            _recover_claimed_tasks(
+                queue_directory=queue_directory, cache_directory=cache_directory
+            )
+        self.assertEqual(os.listdir(queue_directory), [])
+        self.assertFalse(
+            os.path.exists(os.path.join(cache_directory, task_key + ".h5out"))
+        )
+        error = get_error(file_name=os.path.join(cache_directory, task_key + ".h5err"))
+        self.assertIsInstance(error, RuntimeError)
+
+    def test_executor_persistent_workers_crash(self):
+        with FileExecutor(persistent_workers=1) as exe:
+            fs1 = exe.submit(exit_worker, 1)
+            fs2 = exe.submit(my_funct, 1, b=2)
+            with self.assertRaises(RuntimeError):
+                fs1.result()
+            self.assertEqual(fs2.result(), 3)
+        self.assertEqual(os.listdir(os.path.join("cache", "queue")), [])
+
+    def tearDown(self):
+        if os.path.exists("cache"):
+            shutil.rmtree("cache")
@@ -7,7 +7,10 @@ from executorlib import Executor
 from executorlib.shared.executor import cloudpickle_register
 from executorlib.interactive import create_executor
 from executorlib.shared.thread import RaisingThread
-from executorlib.shared.executor import execute_tasks_with_dependencies
+from executorlib.shared.executor import (
+    DependencyIndex,
+    execute_tasks_with_dependencies,
+)
 from executorlib.shared.plot import generate_nodes_and_edges
 
 
@@ -39,6 +42,10 @@ def merge(lst):
     return sum(lst)
 
 
+def raise_error(parameter):
+    raise RuntimeError(parameter)
+
+
 class TestExecutorWithDependencies(unittest.TestCase):
     def test_executor(self):
         with Executor(max_cores=1, backend="local", hostname_localhost=True) as exe:
@@ -124,6 +131,24 @@ class TestExecutorWithDependencies(unittest.TestCase):
         self.assertTrue(fs2.done())
         q.put({"shutdown": True, "wait": True})
 
+    def test_dependency_failure(self):
+        with self.assertRaises(RuntimeError):
+            with Executor(max_cores=1, backend="local", hostname_localhost=True) as exe:
+                cloudpickle_register(ind=1)
+                future_1 = exe.submit(raise_error, parameter="error")
+                future_2 = exe.submit(add_function, 1, parameter_2=future_1)
+                with self.assertRaises(RuntimeError):
+                    future_2.result()
+
+    def test_map_chunksize(self):
+        with Executor(max_cores=2, backend="local", hostname_localhost=True) as exe:
+            cloudpickle_register(ind=1)
+            future_1 = exe.submit(add_function, 1, parameter_2=2)
+            output = exe.map(
+                add_function, [1, 2, 3], [future_1, future_1, 1], chunksize=2
+            )
+            self.assertEqual(list(output), [4, 5, 4])
+
     def test_many_to_one(self):
         length = 5
         parameter = 1
@@ -201,3 +226,66 @@ class TestExecutorWithDependencies(unittest.TestCase):
             )
             self.assertEqual(len(nodes), 18)
             self.assertEqual(len(edges), 21)
+
+
+class TestDependencyIndex(unittest.TestCase):
+    def test_release_on_last_input(self):
+        q = Queue()
+        fs1, fs2, fs3 = Future(), Future(), Future()
+        index = DependencyIndex(executor_queue=q)
+        index.add(
+            task_dict={
+                "fn": add_function,
+                "args": (fs1,),
+                "kwargs": {"parameter_2": fs2},
+                "future": fs3,
+                "resource_dict": {},
+            }
+        )
+        self.assertTrue(q.empty())
+        fs1.set_result(1)
+        self.assertTrue(q.empty())
+        fs2.set_result(2)
+        task_dict = q.get_nowait()
+        self.assertEqual(task_dict["args"], [1])
+        self.assertEqual(task_dict["kwargs"], {"parameter_2": 2})
+        self.assertTrue(q.empty())
+        index.join()
+
+    def test_release_shared_input(self):
+        q = Queue()
+        fs1 = Future()
+        index = DependencyIndex(executor_queue=q)
+        for _ in range(3):
+            index.add(
+                task_dict={
+                    "fn": add_function,
+                    "args": (fs1, fs1),
+                    "kwargs": {},
+                    "future": Future(),
+                    "resource_dict": {},
+                }
+            )
+        self.assertTrue(q.empty())
+        fs1.set_result(1)
+        self.assertEqual(q.qsize(), 3)
+        index.join()
+
+    def test_forward_exception(self):
+        q = Queue()
+        fs1, fs2 = Future(), Future()
+        index = DependencyIndex(executor_queue=q)
+        index.add(
+            task_dict={
+                "fn": add_function,
+                "args": (fs1, 1),
+                "kwargs": {},
+                "future": fs2,
+                "resource_dict": {},
+            }
+        )
+        fs1.set_exception(RuntimeError("error"))
+        self.assertTrue(q.empty())
+        with self.assertRaises(RuntimeError):
+            fs2.result()
+        index.join()
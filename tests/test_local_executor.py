@@ -1,5 +1,6 @@
 from concurrent.futures import CancelledError, Future
 import importlib.util
+import os
 from queue import Queue
 from time import sleep
 import unittest
@@ -54,6 +55,12 @@ def raise_error():
     raise RuntimeError
 
 
+def get_pid(i):
+    import os
+
+    return os.getpid()
+
+
 def sleep_one(i):
     sleep(1)
     return i
@@ -119,6 +126,48 @@ class TestPyMpiExecutorStepSerial(unittest.TestCase):
             self.assertTrue(fs_2.done())
 
 
+class TestPyMpiStepExecutorWorkerPool(unittest.TestCase):
+    def test_reuse_worker(self):
+        with InteractiveStepExecutor(
+            max_cores=1,
+            executor_kwargs={"hostname_localhost": True},
+            interface_class=MpiExecInterface,
+            max_idle_workers=1,
+        ) as exe:
+            cloudpickle_register(ind=1)
+            pid_1 = exe.submit(get_pid, 1).result()
+            pid_2 = exe.submit(get_pid, 2).result()
+            self.assertEqual(pid_1, pid_2)
+
+    def test_worker_shape(self):
+        with InteractiveStepExecutor(
+            max_cores=1,
+            executor_kwargs={"hostname_localhost": True},
+            interface_class=MpiExecInterface,
+            max_idle_workers=2,
+        ) as exe:
+            cloudpickle_register(ind=1)
+            pid_1 = exe.submit(get_pid, 1).result()
+            pid_2 = exe.submit(
+                get_pid, 2, resource_dict={"cwd": os.path.abspath(".")}
+            ).result()
+            self.assertNotEqual(pid_1, pid_2)
+
+    def test_idle_timeout(self):
+        with InteractiveStepExecutor(
+            max_cores=1,
+            executor_kwargs={"hostname_localhost": True},
+            interface_class=MpiExecInterface,
+            max_idle_workers=1,
+            idle_timeout=0.1,
+        ) as exe:
+            cloudpickle_register(ind=1)
+            pid_1 = exe.submit(get_pid, 1).result()
+            sleep(1)
+            pid_2 = exe.submit(get_pid, 2).result()
+            self.assertNotEqual(pid_1, pid_2)
+
+
 @unittest.skipIf(
     skip_mpi4py_test, "mpi4py is not installed, so the mpi4py tests are skipped."
 )
@@ -154,6 +203,21 @@ class TestPyMpiExecutorMPI(unittest.TestCase):
             [[(1, 2, 0), (1, 2, 1)], [(2, 2, 0), (2, 2, 1)], [(3, 2, 0), (3, 2, 1)]],
         )
 
+    @unittest.skipIf(
+        skip_mpi4py_test, "mpi4py is not installed, so the mpi4py tests are skipped."
+    )
+    def test_pool_multi_core_map_chunksize(self):
+        with InteractiveExecutor(
+            max_workers=1,
+            executor_kwargs={"cores": 2, "hostname_localhost": True},
+            interface_class=MpiExecInterface,
+        ) as p:
+            output = p.map(mpi_funct, [1, 2, 3], chunksize=2)
+        self.assertEqual(
+            list(output),
+            [[(1, 2, 0), (1, 2, 1)], [(2, 2, 0), (2, 2, 1)], [(3, 2, 0), (3, 2, 1)]],
+        )
+
     def test_pympiexecutor_one_worker_with_mpi_echo(self):
         with InteractiveExecutor(
             max_workers=1,
@@ -236,6 +300,20 @@ class TestPyMpiExecutorInitFunction(unittest.TestCase):
             4,
         )
 
+    def test_call_funct_chunk(self):
+        self.assertEqual(
+            call_funct(
+                input_dict={
+                    "fn": get_global,
+                    "args": [[], []],
+                    "kwargs": {},
+                    "chunk": True,
+                },
+                memory={"memory": 4},
+            ),
+            [4, 4],
+        )
+
     def test_execute_task(self):
         f = Future()
         q = Queue()
@@ -308,6 +386,41 @@ class TestFuturePool(unittest.TestCase):
             output = p.map(calc_array, [1, 2, 3])
         self.assertEqual(list(output), [np.array(1), np.array(4), np.array(9)])
 
+    def test_pool_serial_map_chunksize(self):
+        with InteractiveExecutor(
+            max_workers=1,
+            executor_kwargs={"cores": 1, "hostname_localhost": True},
+            interface_class=MpiExecInterface,
+        ) as p:
+            output = p.map(calc_array, [1, 2, 3, 4, 5], chunksize=2)
+        self.assertEqual(
+            list(output),
+            [np.array(1), np.array(4), np.array(9), np.array(16), np.array(25)],
+        )
+
+    def test_pool_serial_prefetch(self):
+        with InteractiveExecutor(
+            max_workers=1,
+            executor_kwargs={"cores": 1, "hostname_localhost": True},
+            interface_class=MpiExecInterface,
+            prefetch_depth=3,
+        ) as p:
+            cloudpickle_register(ind=1)
+            fs_lst = [p.submit(calc_array, i) for i in range(5)]
+            self.assertEqual([fs.result() for fs in fs_lst], [i**2 for i in range(5)])
+
+    def test_pool_serial_prefetch_exception(self):
+        with self.assertRaises(RuntimeError):
+            with InteractiveExecutor(
+                max_workers=1,
+                executor_kwargs={"cores": 1, "hostname_localhost": True},
+                interface_class=MpiExecInterface,
+                prefetch_depth=2,
+            ) as p:
+                cloudpickle_register(ind=1)
+                fs = p.submit(raise_error)
+                fs.result()
+
     def test_executor_exception(self):
         with self.assertRaises(RuntimeError):
             with InteractiveExecutor(
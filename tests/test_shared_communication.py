@@ -1,18 +1,24 @@
 import importlib.util
 import os
+import errno
 import sys
 import unittest
+from unittest import mock
 
 import numpy as np
 import zmq
 
+from executorlib.shared import communication
 from executorlib.shared.communication import (
+    SHARED_MEMORY_DIRECTORY,
+    interface_bootup,
     interface_connect,
     interface_shutdown,
     interface_send,
     interface_receive,
     SocketInterface,
 )
+from executorlib.shared.compression import get_codec_id, is_compressed
 from executorlib.shared.executor import cloudpickle_register
 from executorlib.shared.interface import MpiExecInterface
 
@@ -84,6 +90,98 @@ class TestInterface(unittest.TestCase):
         )
         interface.shutdown(wait=True)
 
+    def test_interface_serial_compression(self):
+        cloudpickle_register(ind=1)
+        task_dict = {"fn": np.ones, "args": (2**18,), "kwargs": {}}
+        interface = SocketInterface(
+            interface=MpiExecInterface(cwd=None, cores=1, oversubscribe=False),
+            compression="zlib",
+        )
+        interface.bootup(
+            command_lst=[
+                sys.executable,
+                os.path.abspath(
+                    os.path.join(
+                        __file__,
+                        "..",
+                        "..",
+                        "executorlib",
+                        "backend",
+                        "interactive_serial.py",
+                    )
+                ),
+                "--zmqport",
+                str(interface.bind_to_random_port()),
+                "--compression",
+                "zlib",
+            ]
+        )
+        self.assertTrue(
+            np.array_equal(
+                interface.send_and_receive_dict(input_dict=task_dict), np.ones(2**18)
+            )
+        )
+        interface.shutdown(wait=True)
+
+    @unittest.skipIf(
+        not os.path.isdir(SHARED_MEMORY_DIRECTORY),
+        "The shared memory file system is not available, so the shared memory tests are skipped.",
+    )
+    def test_interface_serial_shared_memory(self):
+        cloudpickle_register(ind=1)
+        file_name_set = set(os.listdir(SHARED_MEMORY_DIRECTORY))
+        interface = interface_bootup(
+            command_lst=[
+                sys.executable,
+                os.path.abspath(
+                    os.path.join(
+                        __file__,
+                        "..",
+                        "..",
+                        "executorlib",
+                        "backend",
+                        "interactive_serial.py",
+                    )
+                ),
+            ],
+            connections=MpiExecInterface(cwd=None, cores=1, oversubscribe=False),
+            hostname_localhost=True,
+        )
+        result = interface.send_and_receive_dict(
+            input_dict={"fn": np.add, "args": (np.ones(2**18), 1), "kwargs": {}}
+        )
+        self.assertTrue(np.array_equal(result, 2 * np.ones(2**18)))
+        self.assertTrue(result.flags.writeable)
+        interface.shutdown(wait=True)
+        self.assertEqual(set(os.listdir(SHARED_MEMORY_DIRECTORY)), file_name_set)
+
+    def test_interface_serial_shared_memory_disabled(self):
+        cloudpickle_register(ind=1)
+        interface = interface_bootup(
+            command_lst=[
+                sys.executable,
+                os.path.abspath(
+                    os.path.join(
+                        __file__,
+                        "..",
+                        "..",
+                        "executorlib",
+                        "backend",
+                        "interactive_serial.py",
+                    )
+                ),
+            ],
+            connections=MpiExecInterface(cwd=None, cores=1, oversubscribe=False),
+            hostname_localhost=True,
+            shared_memory_threshold=None,
+        )
+        self.assertIsNone(interface._shared_memory_threshold)
+        result = interface.send_and_receive_dict(
+            input_dict={"fn": np.add, "args": (np.ones(2**18), 1), "kwargs": {}}
+        )
+        self.assertTrue(np.array_equal(result, 2 * np.ones(2**18)))
+        interface.shutdown(wait=True)
+
 
 class TestZMQ(unittest.TestCase):
     def test_initialize_zmq(self):
@@ -98,3 +196,182 @@ class TestZMQ(unittest.TestCase):
         self.assertEqual(interface_receive(socket=socket_client), {"message": message})
         interface_shutdown(socket=socket_client, context=context_client)
         interface_shutdown(socket=socket_server, context=context_server)
+
+    def test_compression_zmq(self):
+        array = np.zeros(2**18)
+        host = "localhost"
+
+        context_server = zmq.Context()
+        socket_server = context_server.socket(zmq.PAIR)
+        port = str(socket_server.bind_to_random_port("tcp://*"))
+        context_client, socket_client = interface_connect(host=host, port=port)
+        interface_send(
+            socket=socket_server, result_dict={"array": array}, compression="zlib"
+        )
+        frame_lst = socket_client.recv_multipart()
+        self.assertEqual(frame_lst[0][0], get_codec_id(compression="zlib"))
+        self.assertLess(sum(len(frame) for frame in frame_lst), array.nbytes)
+        interface_send(
+            socket=socket_server, result_dict={"array": array}, compression="zlib"
+        )
+        result = interface_receive(socket=socket_client)["array"]
+        self.assertTrue(np.array_equal(result, array))
+        self.assertTrue(result.flags.writeable)
+        interface_send(
+            socket=socket_server, result_dict={"message": "test"}, compression="zlib"
+        )
+        self.assertFalse(is_compressed(data=socket_client.recv()))
+        interface_shutdown(socket=socket_client, context=context_client)
+        interface_shutdown(socket=socket_server, context=context_server)
+
+    @unittest.skipIf(
+        not os.path.isdir(SHARED_MEMORY_DIRECTORY),
+        "The shared memory file system is not available, so the shared memory tests are skipped.",
+    )
+    def test_shared_memory_zmq(self):
+        array = np.arange(2**18)
+        host = "localhost"
+
+        context_server = zmq.Context()
+        socket_server = context_server.socket(zmq.PAIR)
+        port = str(socket_server.bind_to_random_port("tcp://*"))
+        context_client, socket_client = interface_connect(host=host, port=port)
+        interface_send(
+            socket=socket_server,
+            result_dict={"array": array, "small": np.ones(10)},
+            shared_memory_threshold=2**16,
+        )
+        frame_lst = socket_client.recv_multipart()
+        self.assertLess(sum(len(frame) for frame in frame_lst), array.nbytes)
+        file_name_lst = [
+            os.path.join(SHARED_MEMORY_DIRECTORY, file_name)
+            for file_name in os.listdir(SHARED_MEMORY_DIRECTORY)
+            if file_name.startswith("executorlib_")
+        ]
+        for file_name in file_name_lst:
+            os.remove(file_name)
+        interface_send(
+            socket=socket_server,
+            result_dict={"array": array, "small": np.ones(10)},
+            shared_memory_threshold=2**16,
+        )
+        result_dict = interface_receive(socket=socket_client)
+        self.assertTrue(np.array_equal(result_dict["array"], array))
+        self.assertTrue(np.array_equal(result_dict["small"], np.ones(10)))
+        result_dict["array"][0] = 1
+        self.assertEqual(array[0], 0)
+        self.assertFalse(
+            any(
+                file_name.startswith("executorlib_")
+                for file_name in os.listdir(SHARED_MEMORY_DIRECTORY)
+            )
+        )
+        interface_shutdown(socket=socket_client, context=context_client)
+        interface_shutdown(socket=socket_server, context=context_server)
+
+    @unittest.skipIf(
+        not os.path.isdir(SHARED_MEMORY_DIRECTORY),
+        "The shared memory file system is not available, so the shared memory tests are skipped.",
+    )
+    def test_shared_memory_permissions(self):
+        file_name = communication._write_shared_memory(data=memoryview(b"data"))
+        self.assertEqual(os.stat(file_name).st_mode & 0o777, 0o600)
+        os.remove(file_name)
+
+    @unittest.skipIf(
+        not os.path.isdir(SHARED_MEMORY_DIRECTORY),
+        "The shared memory file system is not available, so the shared memory tests are skipped.",
+    )
+    def test_shared_memory_full_zmq(self):
+        array_a, array_b = np.arange(2**18), np.ones(2**18)
+        host = "localhost"
+        write_shared_memory = communication._write_shared_memory
+        file_name_lst = []
+
+        def write_shared_memory_once(data):
+            if len(file_name_lst) > 0:
+                raise OSError(errno.ENOSPC, "No space left on device")
+            file_name_lst.append(write_shared_memory(data=data))
+            return file_name_lst[-1]
+
+        context_server = zmq.Context()
+        socket_server = context_server.socket(zmq.PAIR)
+        port = str(socket_server.bind_to_random_port("tcp://*"))
+        context_client, socket_client = interface_connect(host=host, port=port)
+        with mock.patch.object(
+            communication, "_write_shared_memory", write_shared_memory_once
+        ):
+            interface_send(
+                socket=socket_server,
+                result_dict={"a": array_a, "b": array_b},
+                shared_memory_threshold=2**16,
+            )
+        self.assertEqual(len(file_name_lst), 1)
+        self.assertFalse(os.path.exists(file_name_lst[0]))
+        frame_lst = socket_client.recv_multipart()
+        self.assertEqual(frame_lst[0][0], 0x80)
+        self.assertEqual(len(frame_lst), 3)
+        result_dict = communication._loads(data=frame_lst[0], buffers=frame_lst[1:])
+        self.assertTrue(np.array_equal(result_dict["a"], array_a))
+        self.assertTrue(np.array_equal(result_dict["b"], array_b))
+        interface_shutdown(socket=socket_client, context=context_client)
+        interface_shutdown(socket=socket_server, context=context_server)
+
+    @unittest.skipIf(
+        not zmq.has("ipc"),
+        "zmq does not support unix domain sockets, so the ipc tests are skipped.",
+    )
+    def test_ipc_zmq(self):
+        interface = SocketInterface(interface=MpiExecInterface(cwd=None, cores=1))
+        address = interface.bind_to_ipc()
+        self.assertTrue(address.startswith("ipc://"))
+        ipc_directory = os.path.dirname(address[len("ipc://") :])
+        self.assertTrue(os.path.isdir(ipc_directory))
+        context_client, socket_client = interface_connect(
+            host="localhost", port=None, address=address
+        )
+        interface.send_dict(input_dict={"message": "test"})
+        self.assertEqual(interface_receive(socket=socket_client), {"message": "test"})
+        interface_send(socket=socket_client, result_dict={"result": 1})
+        self.assertEqual(interface.receive_dict(), 1)
+        interface_shutdown(socket=socket_client, context=context_client)
+        interface.shutdown(wait=True)
+        self.assertFalse(os.path.exists(ipc_directory))
+
+    def test_pickle_encoding_zmq(self):
+        host = "localhost"
+
+        context_server = zmq.Context()
+        socket_server = context_server.socket(zmq.PAIR)
+        port = str(socket_server.bind_to_random_port("tcp://*"))
+        context_client, socket_client = interface_connect(host=host, port=port)
+        for task_dict, encoding_id in [
+            ({"fn": np.sum, "args": (np.ones(10),), "kwargs": {}}, 0x80),
+            ({"fn": lambda i: np.sum(i), "args": (np.ones(10),), "kwargs": {}}, 0x20),
+        ]:
+            with self.subTest(encoding_id=encoding_id):
+                interface_send(socket=socket_server, result_dict=task_dict)
+                frame_lst = socket_client.recv_multipart()
+                self.assertEqual(frame_lst[0][0], encoding_id)
+                self.assertEqual(len(frame_lst), 2)
+                interface_send(
+                    socket=socket_server, result_dict=task_dict, compression="zlib"
+                )
+                result_dict = interface_receive(socket=socket_client)
+                self.assertEqual(
+                    result_dict["fn"](*result_dict["args"], **result_dict["kwargs"]),
+                    10.0,
+                )
+        interface_send(socket=socket_server, result_dict={"error": ValueError("test")})
+        self.assertEqual(socket_client.recv()[0], 0x80)
+        interface_shutdown(socket=socket_client, context=context_client)
+        interface_shutdown(socket=socket_server, context=context_server)
+
+    def test_compression_unknown_codec(self):
+        with self.assertRaises(ValueError):
+            SocketInterface(compression="unknown")
+
+    def test_shutdown_without_connection(self):
+        interface = SocketInterface()
+        self.assertIsNone(interface.shutdown(wait=True))
+        self.assertIsNone(interface.shutdown(wait=True))
@@ -1,8 +1,9 @@
 from concurrent.futures import Future, CancelledError
+from functools import partial
 from queue import Queue
 import unittest
 
-from executorlib.shared.executor import cancel_items_in_queue
+from executorlib.shared.executor import cancel_items_in_queue, ResourceScheduler
 
 
 class TestQueue(unittest.TestCase):
@@ -21,3 +22,85 @@ class TestQueue(unittest.TestCase):
         with self.assertRaises(CancelledError):
             self.assertTrue(fs2.result())
         q.join()
+
+
+class TestResourceScheduler(unittest.TestCase):
+    def test_fifo(self):
+        started_lst = []
+        scheduler = ResourceScheduler(max_cores=2)
+        future_lst = [Future() for _ in range(3)]
+        for i, f in enumerate(future_lst):
+            scheduler.submit(future=f, start_function=partial(started_lst.append, i))
+        self.assertEqual(started_lst, [0, 1])
+        future_lst[0].set_result(0)
+        self.assertEqual(started_lst, [0, 1, 2])
+
+    def test_backfill(self):
+        started_lst = []
+        scheduler = ResourceScheduler(max_cores=4)
+        future_lst = [Future() for _ in range(4)]
+        for i, (f, cores) in enumerate(zip(future_lst, [2, 3, 1, 1])):
+            scheduler.submit(
+                future=f, start_function=partial(started_lst.append, i), cores=cores
+            )
+        self.assertEqual(started_lst, [0, 2])
+        future_lst[0].set_result(0)
+        self.assertEqual(started_lst, [0, 2, 1])
+        future_lst[2].set_result(2)
+        self.assertEqual(started_lst, [0, 2, 1, 3])
+
+    def test_no_backfill_for_exclusive_task(self):
+        started_lst = []
+        scheduler = ResourceScheduler(max_cores=2)
+        future_lst = [Future() for _ in range(3)]
+        for i, (f, cores) in enumerate(zip(future_lst, [1, 4, 1])):
+            scheduler.submit(
+                future=f, start_function=partial(started_lst.append, i), cores=cores
+            )
+        self.assertEqual(started_lst, [0])
+        future_lst[0].set_result(0)
+        self.assertEqual(started_lst, [0, 1])
+        future_lst[1].set_result(1)
+        self.assertEqual(started_lst, [0, 1, 2])
+
+    def test_gpus(self):
+        started_lst = []
+        scheduler = ResourceScheduler(max_cores=4, max_gpus=1)
+        future_lst = [Future() for _ in range(2)]
+        for i, f in enumerate(future_lst):
+            scheduler.submit(
+                future=f, start_function=partial(started_lst.append, i), gpus=1
+            )
+        self.assertEqual(started_lst, [0])
+        future_lst[0].set_result(0)
+        self.assertEqual(started_lst, [0, 1])
+        self.assertEqual(len(scheduler.join()), 2)
+
+    def test_cancel(self):
+        started_lst = []
+        scheduler = ResourceScheduler(max_cores=1)
+        future_lst = [Future() for _ in range(2)]
+        for i, f in enumerate(future_lst):
+            scheduler.submit(future=f, start_function=partial(started_lst.append, i))
+        future_lst[1].cancel()
+        self.assertEqual(len(scheduler.join()), 1)
+        future_lst[0].set_result(0)
+        self.assertEqual(started_lst, [0])
+
+    def test_synchronous_completion(self):
+        started_lst = []
+
+        def start(i, future):
+            started_lst.append(i)
+            if i > 1:
+                future.set_result(i)
+
+        scheduler = ResourceScheduler(max_cores=4)
+        future_lst = [Future() for _ in range(5)]
+        for i, (f, cores) in enumerate(zip(future_lst, [2, 3, 1, 1, 1])):
+            scheduler.submit(future=f, start_function=partial(start, i, f), cores=cores)
+        self.assertEqual(started_lst, [0, 2, 3, 4])
+        self.assertEqual(len(scheduler), 1)
+        future_lst[0].set_result(0)
+        self.assertEqual(started_lst, [0, 2, 3, 4, 1])
+        self.assertEqual(len(scheduler), 0)
@@ -0,0 +1,86 @@
+import unittest
+
+import cloudpickle
+
+from executorlib import Executor
+from executorlib.shared.executor import cloudpickle_register
+from executorlib.shared.function_cache import FunctionCache
+
+
+def add_one(i):
+    return i + 1
+
+
+def add_two(i):
+    return i + 2
+
+
+def get_add_function(j):
+    def add(i):
+        return i + j
+
+    return add
+
+
+class TestFunctionCache(unittest.TestCase):
+    def test_encode_decode(self):
+        executor_cache = FunctionCache()
+        worker_cache = FunctionCache()
+        task_dict = {"fn": add_one, "args": (1,), "kwargs": {}}
+        message_dict = executor_cache.encode(task_dict=task_dict)
+        self.assertIs(message_dict["fn"], add_one)
+        self.assertTrue("fn_id" in message_dict.keys())
+        self.assertFalse("fn_id" in task_dict.keys())
+        self.assertIs(worker_cache.decode(input_dict=message_dict)["fn"], add_one)
+        message_dict = executor_cache.encode(task_dict=task_dict)
+        self.assertFalse("fn" in message_dict.keys())
+        self.assertTrue("fn" in task_dict.keys())
+        input_dict = worker_cache.decode(input_dict=message_dict)
+        self.assertIs(input_dict["fn"], add_one)
+        self.assertFalse("fn_id" in input_dict.keys())
+
+    def test_eviction(self):
+        executor_cache = FunctionCache(max_size=1)
+        worker_cache = FunctionCache(max_size=1)
+        for fn in [add_one, add_two, add_one]:
+            message_dict = executor_cache.encode(
+                task_dict={"fn": fn, "args": (1,), "kwargs": {}}
+            )
+            self.assertIs(message_dict["fn"], fn)
+            self.assertIs(worker_cache.decode(input_dict=message_dict)["fn"], fn)
+
+    def test_function_by_value(self):
+        executor_cache = FunctionCache()
+        worker_cache = FunctionCache()
+        funct = lambda i, j=1: i + j
+        for j in [1, 1, 2]:
+            funct.__defaults__ = (j,)
+            message_dict = executor_cache.encode(
+                task_dict={"fn": funct, "args": (1,), "kwargs": {}}
+            )
+            input_dict = worker_cache.decode(
+                input_dict=cloudpickle.loads(cloudpickle.dumps(message_dict))
+            )
+            self.assertEqual(
+                input_dict["fn"](*input_dict["args"], **input_dict["kwargs"]), 1 + j
+            )
+        self.assertTrue("fn" in message_dict.keys())
+
+    def test_other_callables(self):
+        executor_cache = FunctionCache()
+        task_dict = {"fn": sum, "args": ([1, 2],), "kwargs": {}}
+        self.assertIs(executor_cache.encode(task_dict=task_dict), task_dict)
+        self.assertIs(executor_cache.encode(task_dict=task_dict), task_dict)
+        shutdown_dict = {"shutdown": True, "wait": True}
+        self.assertIs(executor_cache.encode(task_dict=shutdown_dict), shutdown_dict)
+        self.assertIs(FunctionCache().decode(input_dict=shutdown_dict), shutdown_dict)
+
+    def test_executor(self):
+        with Executor(
+            max_cores=1, hostname_localhost=True, backend="local", block_allocation=True
+        ) as exe:
+            cloudpickle_register(ind=1)
+            fs_lst = [exe.submit(add_one, i) for i in range(3)]
+            fs_lst += [exe.submit(get_add_function(j=j), 1) for j in range(3)]
+            fs_lst += [exe.submit(add_one, 3)]
+            self.assertEqual([fs.result() for fs in fs_lst], [1, 2, 3, 1, 2, 3, 4])
@@ -0,0 +1,97 @@
+import importlib.util
+import unittest
+
+import numpy as np
+
+from executorlib.shared.hashing import get_hash
+
+
+skip_xxhash_test = importlib.util.find_spec("xxhash") is None
+
+
+def my_funct(a, b):
+    return a + b
+
+
+class TestHashing(unittest.TestCase):
+    def test_hash_task(self):
+        task_dict = {"fn": my_funct, "args": (1,), "kwargs": {"b": 2}}
+        self.assertEqual(
+            get_hash(obj=task_dict),
+            get_hash(obj={"fn": my_funct, "args": (1,), "kwargs": {"b": 2}}),
+        )
+        self.assertNotEqual(
+            get_hash(obj=task_dict),
+            get_hash(obj={"fn": my_funct, "args": (1,), "kwargs": {"b": 3}}),
+        )
+        self.assertNotEqual(
+            get_hash(obj=task_dict),
+            get_hash(obj={"fn": np.add, "args": (1,), "kwargs": {"b": 2}}),
+        )
+
+    def test_hash_function_by_value(self):
+        funct = lambda a, b=1: a + b
+        hash_lst = [get_hash(obj={"fn": funct, "args": (1,), "kwargs": {}})]
+        self.assertEqual(
+            hash_lst[0], get_hash(obj={"fn": funct, "args": (1,), "kwargs": {}})
+        )
+        funct.__defaults__ = (2,)
+        hash_lst.append(get_hash(obj={"fn": funct, "args": (1,), "kwargs": {}}))
+        funct.__code__ = (lambda a, b=1: a - b).__code__
+        hash_lst.append(get_hash(obj={"fn": funct, "args": (1,), "kwargs": {}}))
+        self.assertEqual(len(set(hash_lst)), 3)
+
+    def test_hash_function_closure_in_place(self):
+        offset_lst = [1]
+        funct = lambda a: a + offset_lst[0]
+        hash_before = get_hash(obj={"fn": funct, "args": (1,), "kwargs": {}})
+        offset_lst[0] = 2
+        self.assertNotEqual(
+            hash_before, get_hash(obj={"fn": funct, "args": (1,), "kwargs": {}})
+        )
+
+    def test_hash_types(self):
+        self.assertNotEqual(get_hash(obj=[1, 2]), get_hash(obj=(1, 2)))
+        self.assertNotEqual(get_hash(obj=1), get_hash(obj=1.0))
+        self.assertNotEqual(get_hash(obj=1), get_hash(obj=True))
+        self.assertNotEqual(get_hash(obj="1"), get_hash(obj=b"1"))
+        self.assertNotEqual(get_hash(obj=["a", "b"]), get_hash(obj=["ab"]))
+        self.assertNotEqual(get_hash(obj={"a": 1}), get_hash(obj=["a", 1]))
+
+    def test_hash_array(self):
+        a = np.arange(12, dtype=np.float64)
+        self.assertEqual(get_hash(obj=a), get_hash(obj=a.copy()))
+        self.assertNotEqual(get_hash(obj=a), get_hash(obj=a.reshape(3, 4)))
+        self.assertNotEqual(get_hash(obj=a), get_hash(obj=a.astype(np.int64)))
+        self.assertNotEqual(get_hash(obj=a), get_hash(obj=a + 1))
+        b = a.reshape(3, 4)[:, ::2]
+        self.assertEqual(get_hash(obj=b), get_hash(obj=b.copy()))
+        c = np.array([1, "a"], dtype=object)
+        self.assertEqual(get_hash(obj=c), get_hash(obj=c.copy()))
+
+    def test_hash_pickle_fallback(self):
+        self.assertEqual(get_hash(obj={1, 2}), get_hash(obj={1, 2}))
+        self.assertNotEqual(get_hash(obj={1, 2}), get_hash(obj={1, 3}))
+
+    def test_hash_algorithm(self):
+        self.assertNotEqual(
+            get_hash(obj=[1], algorithm="blake2b"),
+            get_hash(obj=[2], algorithm="blake2b"),
+        )
+        self.assertEqual(get_hash(obj=[1]), get_hash(obj=[1], algorithm="blake2b"))
+        with self.assertRaises(ValueError):
+            get_hash(obj=[1], algorithm="md5")
+
+    @unittest.skipIf(
+        skip_xxhash_test, "xxhash is not installed, so the xxhash tests are skipped."
+    )
+    def test_hash_xxhash(self):
+        self.assertEqual(
+            get_hash(obj=np.ones(10), algorithm="xxhash"),
+            get_hash(obj=np.ones(10), algorithm="xxhash"),
+        )
+        self.assertNotEqual(
+            get_hash(obj=np.ones(10), algorithm="xxhash"),
+            get_hash(obj=np.ones(10), algorithm="blake2b"),
+        )
+        self.assertTrue(get_hash(obj=np.ones(10), algorithm="xxhash").startswith("xxh3_"))
@@ -13,6 +13,7 @@ from executorlib.shared.inputcheck import (
     check_refresh_rate,
     check_resource_dict,
     check_resource_dict_is_empty,
+    check_shared_memory_threshold,
     validate_backend,
 )
 
@@ -90,3 +91,11 @@ class TestInputCheck(unittest.TestCase):
     def test_check_plot_dependency_graph(self):
         with self.assertRaises(ValueError):
             check_plot_dependency_graph(plot_dependency_graph=True)
+
+    def test_check_shared_memory_threshold(self):
+        check_shared_memory_threshold(shared_memory_threshold=None)
+        check_shared_memory_threshold(shared_memory_threshold=0)
+        with self.assertRaises(ValueError):
+            check_shared_memory_threshold(shared_memory_threshold=-1)
+        with self.assertRaises(ValueError):
+            check_shared_memory_threshold(shared_memory_threshold=1.5)
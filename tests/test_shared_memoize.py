@@ -0,0 +1,150 @@
+import os
+import shutil
+import unittest
+from concurrent.futures import Future
+
+import numpy as np
+
+from executorlib import Executor
+from executorlib.shared.memoize import ResultCache, get_result_cache
+
+
+def get_random(i):
+    return np.random.random() + i
+
+
+def raise_error(i):
+    raise ValueError(i)
+
+
+def get_task_dict(i):
+    return {"fn": get_random, "args": (i,), "kwargs": {}, "future": Future()}
+
+
+class TestResultCache(unittest.TestCase):
+    def test_cache_hit(self):
+        result_cache = ResultCache()
+        task_dict = get_task_dict(i=1)
+        self.assertFalse(result_cache.submit(task_dict=task_dict))
+        task_dict["future"].set_result(np.array([1.0, 2.0]))
+        task_dict_repeat = get_task_dict(i=1)
+        self.assertTrue(result_cache.submit(task_dict=task_dict_repeat))
+        self.assertTrue(task_dict_repeat["future"].done())
+        self.assertTrue(
+            np.array_equal(task_dict_repeat["future"].result(), np.array([1.0, 2.0]))
+        )
+        self.assertFalse(result_cache.submit(task_dict=get_task_dict(i=2)))
+
+    def test_cache_running(self):
+        result_cache = ResultCache()
+        task_dict = get_task_dict(i=1)
+        task_dict_repeat = get_task_dict(i=1)
+        self.assertFalse(result_cache.submit(task_dict=task_dict))
+        self.assertTrue(result_cache.submit(task_dict=task_dict_repeat))
+        self.assertFalse(task_dict_repeat["future"].done())
+        task_dict["future"].set_result(3)
+        self.assertEqual(task_dict_repeat["future"].result(), 3)
+
+    def test_cache_error(self):
+        result_cache = ResultCache()
+        task_dict = get_task_dict(i=1)
+        task_dict_repeat = get_task_dict(i=1)
+        self.assertFalse(result_cache.submit(task_dict=task_dict))
+        self.assertTrue(result_cache.submit(task_dict=task_dict_repeat))
+        task_dict["future"].set_exception(ValueError(1))
+        with self.assertRaises(ValueError):
+            task_dict_repeat["future"].result()
+        self.assertFalse(result_cache.submit(task_dict=get_task_dict(i=1)))
+
+    def test_cache_max_bytes(self):
+        result_cache = ResultCache(max_bytes=2 * 8 * 10**4 + 1000)
+        for i in range(3):
+            task_dict = get_task_dict(i=i)
+            self.assertFalse(result_cache.submit(task_dict=task_dict))
+            task_dict["future"].set_result(np.ones(10**4))
+        self.assertTrue(result_cache.submit(task_dict=get_task_dict(i=2)))
+        self.assertTrue(result_cache.submit(task_dict=get_task_dict(i=1)))
+        self.assertFalse(result_cache.submit(task_dict=get_task_dict(i=0)))
+
+    def test_cache_directory(self):
+        result_cache = ResultCache(cache_directory="memoize")
+        task_dict = get_task_dict(i=1)
+        self.assertFalse(result_cache.submit(task_dict=task_dict))
+        task_dict["future"].set_result(5)
+        result_cache = get_result_cache(cache={"cache_directory": "memoize"})
+        task_dict_repeat = get_task_dict(i=1)
+        self.assertTrue(result_cache.submit(task_dict=task_dict_repeat))
+        self.assertEqual(task_dict_repeat["future"].result(), 5)
+
+    def test_get_result_cache(self):
+        self.assertIsNone(get_result_cache(cache=False))
+        self.assertTrue(isinstance(get_result_cache(cache=True), ResultCache))
+        with self.assertRaises(TypeError):
+            get_result_cache(cache="memory")
+
+    def tearDown(self):
+        if os.path.exists("memoize"):
+            shutil.rmtree("memoize")
+
+
+class TestExecutorCache(unittest.TestCase):
+    def test_executor_block_allocation(self):
+        with Executor(
+            max_cores=1,
+            backend="local",
+            block_allocation=True,
+            hostname_localhost=True,
+            cache=True,
+        ) as exe:
+            fs1 = exe.submit(get_random, 1)
+            fs2 = exe.submit(get_random, 1)
+            fs3 = exe.submit(get_random, 2)
+            self.assertEqual(fs1.result(), fs2.result())
+            self.assertNotEqual(fs1.result(), fs3.result())
+            self.assertEqual(fs1.result(), exe.submit(get_random, 1).result())
+
+    def test_executor_dependencies(self):
+        with Executor(
+            max_cores=1,
+            backend="local",
+            block_allocation=False,
+            hostname_localhost=True,
+            cache=True,
+        ) as exe:
+            fs1 = exe.submit(get_random, 1)
+            fs2 = exe.submit(get_random, fs1)
+            fs3 = exe.submit(get_random, fs1)
+            self.assertEqual(fs2.result(), fs3.result())
+
+    def test_executor_no_dependencies(self):
+        with Executor(
+            max_cores=1,
+            backend="local",
+            block_allocation=True,
+            hostname_localhost=True,
+            disable_dependencies=True,
+            cache=True,
+        ) as exe:
+            fs1 = exe.submit(get_random, 1)
+            fs1.result()
+            fs2 = exe.submit(get_random, 1)
+            self.assertTrue(fs2.done())
+            self.assertEqual(fs1.result(), fs2.result())
+            self.assertEqual(
+                list(exe.map(get_random, [1, 1])), [fs1.result(), fs1.result()]
+            )
+
+    def test_executor_map_chunksize(self):
+        for disable_dependencies in [True, False]:
+            with Executor(
+                max_cores=1,
+                backend="local",
+                block_allocation=True,
+                hostname_localhost=True,
+                disable_dependencies=disable_dependencies,
+                cache=True,
+            ) as exe:
+                result_lst = list(exe.map(get_random, [1, 2, 3], chunksize=2))
+                self.assertEqual(
+                    list(exe.map(get_random, [1, 2, 3], chunksize=2)), result_lst
+                )
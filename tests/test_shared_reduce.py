@@ -0,0 +1,103 @@
+import importlib.util
+import os
+import shutil
+import unittest
+
+import numpy as np
+
+from executorlib import Executor
+from executorlib.shared.executor import cloudpickle_register
+
+try:
+    from executorlib import FileExecutor
+
+    skip_h5py_test = False
+except ImportError:
+    skip_h5py_test = True
+
+
+skip_mpi4py_test = importlib.util.find_spec("mpi4py") is None
+
+
+def get_rank_array(i=0):
+    from mpi4py import MPI
+
+    return np.ones(4) * (MPI.COMM_WORLD.Get_rank() + 1) + i
+
+
+def get_rank_dict():
+    from mpi4py import MPI
+
+    return {MPI.COMM_WORLD.Get_rank(): MPI.COMM_WORLD.Get_size()}
+
+
+def merge_dict(a, b):
+    return {**a, **b}
+
+
+class TestReduce(unittest.TestCase):
+    def test_reduce_invalid(self):
+        with Executor(
+            max_cores=1, hostname_localhost=True, backend="local", block_allocation=True
+        ) as exe:
+            with self.assertRaises(ValueError):
+                exe.submit(sum, [1, 2], resource_dict={"reduce": "prod"})
+
+    @unittest.skipIf(
+        skip_mpi4py_test, "mpi4py is not installed, so the mpi4py tests are skipped."
+    )
+    def test_executor_block_allocation(self):
+        with Executor(
+            max_cores=2,
+            cores_per_worker=2,
+            hostname_localhost=True,
+            backend="local",
+            block_allocation=True,
+        ) as exe:
+            cloudpickle_register(ind=1)
+            fs_gather = exe.submit(get_rank_array)
+            fs_root = exe.submit(get_rank_array, resource_dict={"reduce": "root"})
+            fs_sum = exe.submit(get_rank_array, resource_dict={"reduce": "sum"})
+            fs_max = exe.submit(get_rank_array, i=1, resource_dict={"reduce": "max"})
+            fs_min = exe.submit(get_rank_array, resource_dict={"reduce": "min"})
+            fs_merge = exe.submit(get_rank_dict, resource_dict={"reduce": merge_dict})
+            self.assertEqual(len(fs_gather.result()), 2)
+            self.assertTrue(np.array_equal(fs_root.result(), np.ones(4)))
+            self.assertTrue(np.array_equal(fs_sum.result(), 3 * np.ones(4)))
+            self.assertTrue(np.array_equal(fs_max.result(), 3 * np.ones(4)))
+            self.assertTrue(np.array_equal(fs_min.result(), np.ones(4)))
+            self.assertEqual(fs_merge.result(), {0: 2, 1: 2})
+            self.assertEqual(
+                exe.submit(sum, [1, 2], resource_dict={"reduce": "sum"}).result(), 6
+            )
+
+    @unittest.skipIf(
+        skip_mpi4py_test, "mpi4py is not installed, so the mpi4py tests are skipped."
+    )
+    def test_executor_steps(self):
+        with Executor(
+            max_cores=2,
+            hostname_localhost=True,
+            backend="local",
+            block_allocation=False,
+        ) as exe:
+            cloudpickle_register(ind=1)
+            fs = exe.submit(get_rank_array, resource_dict={"cores": 2, "reduce": "sum"})
+            self.assertTrue(np.array_equal(fs.result(), 3 * np.ones(4)))
+
+    @unittest.skipIf(
+        skip_h5py_test or skip_mpi4py_test,
+        "h5py or mpi4py are not installed, so the h5py and mpi4py tests are skipped.",
+    )
+    def test_file_executor(self):
+        with FileExecutor(cores_per_worker=2) as exe:
+            fs_gather = exe.submit(get_rank_array)
+            fs_sum = exe.submit(get_rank_array, resource_dict={"reduce": "sum"})
+            self.assertEqual(len(fs_gather.result()), 2)
+            self.assertTrue(np.array_equal(fs_sum.result(), 3 * np.ones(4)))
+            with self.assertRaises(ValueError):
+                exe.submit(get_rank_array, resource_dict={"reduce": "prod"})
+
+    def tearDown(self):
+        if os.path.exists("cache"):
+            shutil.rmtree("cache")
@@ -0,0 +1,131 @@
+import importlib.util
+import os
+import shutil
+import unittest
+
+import numpy as np
+
+from executorlib import Executor, Scatter
+from executorlib.interactive.backend import call_funct
+from executorlib.shared.executor import cloudpickle_register
+from executorlib.shared.scatter import (
+    resolve_scatter_arguments,
+    split_scatter_arguments,
+)
+
+try:
+    from executorlib import FileExecutor
+
+    skip_h5py_test = False
+except ImportError:
+    skip_h5py_test = True
+
+
+skip_mpi4py_test = importlib.util.find_spec("mpi4py") is None
+
+
+def get_part(a, b=None):
+    from mpi4py import MPI
+
+    return MPI.COMM_WORLD.Get_rank(), a, b
+
+
+def get_sum(a, b=0):
+    return np.sum(a) + b
+
+
+class TestScatter(unittest.TestCase):
+    def test_scatter_axis(self):
+        self.assertEqual(Scatter(np.ones((2, 3)), axis=-1).axis, 1)
+        with self.assertRaises(ValueError):
+            Scatter(np.ones((2, 3)), axis=2)
+
+    def test_split_scatter_arguments(self):
+        array = np.arange(6).reshape(2, 3)
+        input_dict, array_lst = split_scatter_arguments(
+            input_dict={
+                "fn": get_sum,
+                "args": (Scatter(array, axis=1),),
+                "kwargs": {"b": 1},
+            }
+        )
+        self.assertEqual(len(array_lst), 1)
+        self.assertTrue(np.array_equal(array_lst[0], array))
+        self.assertEqual(input_dict["args"][0].shape, (2, 3))
+        self.assertEqual(input_dict["args"][0].axis, 1)
+        self.assertEqual(input_dict["kwargs"], {"b": 1})
+        input_dict, array_lst = split_scatter_arguments(
+            input_dict={"shutdown": True, "wait": True}
+        )
+        self.assertEqual(array_lst, [])
+
+    def test_resolve_scatter_arguments(self):
+        input_dict = resolve_scatter_arguments(
+            input_dict={
+                "fn": get_sum,
+                "args": (Scatter(np.arange(4)),),
+                "kwargs": {"b": Scatter(np.ones(2))},
+            }
+        )
+        self.assertTrue(np.array_equal(input_dict["args"][0], np.arange(4)))
+        self.assertTrue(np.array_equal(input_dict["kwargs"]["b"], np.ones(2)))
+        self.assertEqual(
+            call_funct(
+                input_dict={
+                    "fn": get_sum,
+                    "args": (Scatter(np.arange(4)),),
+                    "kwargs": {"b": 1},
+                }
+            ),
+            7,
+        )
+
+    def test_executor_serial(self):
+        with Executor(
+            max_cores=1, hostname_localhost=True, backend="local", block_allocation=True
+        ) as exe:
+            cloudpickle_register(ind=1)
+            self.assertEqual(exe.submit(get_sum, Scatter(np.arange(4))).result(), 6)
+
+    @unittest.skipIf(
+        skip_mpi4py_test, "mpi4py is not installed, so the mpi4py tests are skipped."
+    )
+    def test_executor_parallel(self):
+        array = np.arange(15).reshape(5, 3)
+        with Executor(
+            max_workers=2,
+            cores_per_worker=2,
+            hostname_localhost=True,
+            backend="local",
+            block_allocation=True,
+        ) as exe:
+            cloudpickle_register(ind=1)
+            result_lst = exe.submit(
+                get_part, Scatter(array), b=Scatter(array, axis=1)
+            ).result()
+            empty_lst = exe.submit(get_part, Scatter(np.ones((3, 0)))).result()
+        self.assertEqual([part.shape for _, part, _ in empty_lst], [(2, 0), (1, 0)])
+        self.assertEqual([rank for rank, _, _ in result_lst], [0, 1])
+        self.assertTrue(np.array_equal(result_lst[0][1], array[:3]))
+        self.assertTrue(np.array_equal(result_lst[1][1], array[3:]))
+        self.assertTrue(np.array_equal(result_lst[0][2], array[:, :2]))
+        self.assertTrue(np.array_equal(result_lst[1][2], array[:, 2:]))
+
+    @unittest.skipIf(
+        skip_h5py_test or skip_mpi4py_test,
+        "h5py or mpi4py are not installed, so the h5py and mpi4py tests are skipped.",
+    )
+    def test_file_executor_parallel(self):
+        array = np.array([{"a": 1}, {"b": 2}, {"c": 3}], dtype=object)
+        with FileExecutor(cores_per_worker=2) as exe:
+            result_lst = exe.submit(
+                get_part, Scatter(np.arange(5.0)), b=Scatter(array)
+            ).result()
+        self.assertTrue(np.array_equal(result_lst[0][1], np.arange(3.0)))
+        self.assertTrue(np.array_equal(result_lst[1][1], np.arange(3.0, 5.0)))
+        self.assertEqual(list(result_lst[0][2]), [{"a": 1}, {"b": 2}])
+        self.assertEqual(list(result_lst[1][2]), [{"c": 3}])
+
+    def tearDown(self):
+        if os.path.exists("cache"):
+            shutil.rmtree("cache")